@@ -0,0 +1,40 @@
+"""Benchmark of the cold import of :mod:`poisson_approval`.
+
+Run with ``python benchmarks/bench_import.py``. Each measure is made in a new Python process. The script fails if the
+median import time exceeds the budget, or if the import loads one of the slow optional modules (they are supposed to
+be imported lazily, on first use).
+"""
+import statistics
+import subprocess
+import sys
+
+BUDGET = 1.0
+SLOW_MODULES = ['sympy', 'matplotlib', 'ternary', 'scipy', 'poisson_approval.meta_analysis']
+SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+import poisson_approval
+print(time.perf_counter() - start)
+print(','.join(module for module in %r if module in sys.modules))
+''' % SLOW_MODULES
+
+
+def measure():
+    output = subprocess.run([sys.executable, '-c', SCRIPT], check=True, stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout.splitlines()
+    return float(output[0]), [module for module in output[1].split(',') if module]
+
+
+def bench(n_repeats=7):
+    measures = [measure() for _ in range(n_repeats)]
+    durations = [duration for duration, _ in measures]
+    loaded = sorted(set(module for _, modules in measures for module in modules))
+    median = statistics.median(durations)
+    print('import poisson_approval: median %.3f s, min %.3f s, max %.3f s (budget %.3f s)'
+          % (median, min(durations), max(durations), BUDGET))
+    assert not loaded, 'Slow modules loaded at import: %s' % loaded
+    assert median <= BUDGET, 'Import time %.3f s exceeds the budget of %.3f s' % (median, BUDGET)
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,33 @@
+"""Benchmark of :func:`masks_area` against :func:`masks_area_naive`.
+
+Run with ``python benchmarks/bench_masks.py``.
+"""
+import random
+import time
+from fractions import Fraction
+from poisson_approval.utils.UtilMasks import masks_area, masks_area_naive
+
+
+def random_fraction_masks(rng, dim, n_masks, grid=20):
+    return [[(Fraction(rng.randint(0, grid), grid), rng.choice([True, False])) for _ in range(dim)]
+            for _ in range(n_masks)]
+
+
+def bench(dim, n_masks, n_repeats=5, seed=0):
+    rng = random.Random(seed)
+    inf, sup = [0] * dim, [1] * dim
+    cases = [random_fraction_masks(rng, dim, n_masks) for _ in range(n_repeats)]
+    start = time.perf_counter()
+    naive = [masks_area_naive(inf, sup, masks) for masks in cases]
+    time_naive = time.perf_counter() - start
+    start = time.perf_counter()
+    sweep = [masks_area(inf, sup, masks) for masks in cases]
+    time_sweep = time.perf_counter() - start
+    assert naive == sweep
+    print('dim = %d, n_masks = %2d: naive %8.4f s, sweep %8.4f s, speed-up %6.1f'
+          % (dim, n_masks, time_naive, time_sweep, time_naive / time_sweep))
+
+
+if __name__ == '__main__':
+    for dim, n_masks in [(3, 5), (4, 8), (5, 8), (6, 6), (6, 8)]:
+        bench(dim, n_masks)
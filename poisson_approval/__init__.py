@@ -4,12 +4,13 @@ __author__ = """François Durand"""
 __email__ = 'fradurand@gmail.com'
 __version__ = '0.29.2'
 
+import importlib
 
 # Utils
 from poisson_approval.utils.computation_engine import computation_engine
 from poisson_approval.utils.ComputationEngine import ComputationEngine
+from poisson_approval.utils.ComputationEngineFloat import ComputationEngineFloat
 from poisson_approval.utils.ComputationEngineNumeric import ComputationEngineNumeric
-from poisson_approval.utils.ComputationEngineSymbolic import ComputationEngineSymbolic
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 from poisson_approval.utils.DictPrintingInOrderIgnoringNone import DictPrintingInOrderIgnoringNone
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
@@ -22,10 +23,12 @@ from poisson_approval.utils.Util import initialize_random_seeds, rand_simplex, r
 from poisson_approval.utils.UtilBallots import ballot_one, ballot_two, ballot_one_two, ballot_one_three, \
     ballot_high_u, ballot_low_u, allowed_ballots
 from poisson_approval.utils.UtilCache import cached_property, DeleteCacheMixin, property_deleting_cache
-from poisson_approval.utils.UtilMasks import masks_area_naive, masks_area, masks_distribution_naive, \
+from poisson_approval.utils.UtilCanonical import canonical_form
+from poisson_approval.utils.UtilMasks import masks_area_naive, masks_area, masks_cells, masks_distribution_naive, \
     masks_distribution, winners_distribution, random_mask, random_masks
-from poisson_approval.utils.UtilPlot import plt_cdf, plt_step_with_error, plt_plot_with_error
+from poisson_approval.utils.UtilParallel import effective_n_jobs, imap_chunks, imap_parallel, process_pool
 from poisson_approval.utils.UtilPreferences import is_hater, is_lover, is_weak_order, sort_weak_order
+from poisson_approval.utils.UtilTrio import trio_minimize
 
 # Constants
 from poisson_approval.constants.basic_constants import *
@@ -39,7 +42,9 @@ from poisson_approval.containers.AnalyzedStrategies import AnalyzedStrategies
 
 # Events
 from poisson_approval.events.Asymptotic import Asymptotic
+from poisson_approval.events.AsymptoticArray import AsymptoticArray
 from poisson_approval.events.Event import Event
+from poisson_approval.events.EventArray import EventArray
 from poisson_approval.events.EventDuo import EventDuo
 from poisson_approval.events.EventPivotStrict import EventPivotStrict
 from poisson_approval.events.EventPivotTij import EventPivotTij
@@ -57,6 +62,8 @@ from poisson_approval.best_response.BestResponsePlurality import BestResponsePlu
 
 # Tau-vector
 from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.tau_vector.TauVectorArray import TauVectorArray
+from poisson_approval.tau_vector.TauVectorCache import TauVectorCache
 
 # Strategies
 from poisson_approval.strategies.Strategy import Strategy
@@ -107,23 +114,67 @@ from poisson_approval.random_factories.RandStrategyTwelveUniform import RandStra
 from poisson_approval.random_factories.RandTauVectorGridUniform import RandTauVectorGridUniform
 from poisson_approval.random_factories.RandTauVectorUniform import RandTauVectorUniform
 
-# Meta-analysis
-from poisson_approval.meta_analysis.NiceStatsProfileOrdinal import NiceStatsProfileOrdinal
-from poisson_approval.meta_analysis.binary_plots import BinaryAxesSubplotPoisson, binary_figure
-from poisson_approval.meta_analysis.binary_shortcuts import binary_plot_n_equilibria, \
-    binary_plot_winners_at_equilibrium, binary_plot_winning_frequencies, binary_plot_convergence, \
-    XyyToProfile
-from poisson_approval.meta_analysis.convergence_test import convergence_test
-from poisson_approval.meta_analysis.is_condorcet import is_condorcet
-from poisson_approval.meta_analysis.is_not_condorcet import is_not_condorcet
-from poisson_approval.meta_analysis.monte_carlo_fictitious_play import monte_carlo_fictitious_play, \
-    MCS_BALLOT_STATISTICS, MCS_CONVERGES, MCS_DECREASING_SCORES, \
-    MCS_FREQUENCY_CW_WINS, MCS_PROFILE, MCS_TAU_INIT, MCS_WELFARE_LOSSES, \
-    MCS_UTILITY_THRESHOLDS, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_N_EPISODES
-from poisson_approval.meta_analysis.plot_welfare_losses import plot_welfare_losses
-from poisson_approval.meta_analysis.plot_distribution_scores import plot_distribution_scores
-from poisson_approval.meta_analysis.plot_utility_thresholds import plot_utility_thresholds
-from poisson_approval.meta_analysis.ternary_plots import TernaryAxesSubplotPoisson, ternary_figure
-from poisson_approval.meta_analysis.ternary_shortcuts import ternary_plot_n_equilibria, \
-    ternary_plot_winners_at_equilibrium, ternary_plot_winning_frequencies, ternary_plot_convergence, \
-    SimplexToProfile
+# Lazy imports: symbolic computation, plotting and meta-analysis. These modules import `sympy`, `matplotlib`,
+# `ternary` or `scipy`, which are slow to import. They are imported on first access of one of their names (cf. PEP 562).
+_LAZY_IMPORTS = {
+    # Utils
+    'ComputationEngineSymbolic': 'poisson_approval.utils.ComputationEngineSymbolic',
+    'plt_cdf': 'poisson_approval.utils.UtilPlot',
+    'plt_step_with_error': 'poisson_approval.utils.UtilPlot',
+    'plt_plot_with_error': 'poisson_approval.utils.UtilPlot',
+    # Meta-analysis
+    'MonteCarloStream': 'poisson_approval.meta_analysis.MonteCarloStream',
+    'HeatmapCache': 'poisson_approval.meta_analysis.HeatmapCache',
+    'NiceStatsProfileOrdinal': 'poisson_approval.meta_analysis.NiceStatsProfileOrdinal',
+    'BinaryAxesSubplotPoisson': 'poisson_approval.meta_analysis.binary_plots',
+    'binary_figure': 'poisson_approval.meta_analysis.binary_plots',
+    'binary_plot_n_equilibria': 'poisson_approval.meta_analysis.binary_shortcuts',
+    'binary_plot_winners_at_equilibrium': 'poisson_approval.meta_analysis.binary_shortcuts',
+    'binary_plot_winning_frequencies': 'poisson_approval.meta_analysis.binary_shortcuts',
+    'binary_plot_convergence': 'poisson_approval.meta_analysis.binary_shortcuts',
+    'XyyToProfile': 'poisson_approval.meta_analysis.binary_shortcuts',
+    'convergence_test': 'poisson_approval.meta_analysis.convergence_test',
+    'fictitious_play_batch': 'poisson_approval.meta_analysis.fictitious_play_batch',
+    'is_condorcet': 'poisson_approval.meta_analysis.is_condorcet',
+    'is_not_condorcet': 'poisson_approval.meta_analysis.is_not_condorcet',
+    'monte_carlo_fictitious_play': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_BALLOT_STATISTICS': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_CONVERGES': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_DECREASING_SCORES': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_FREQUENCY_CW_WINS': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_PROFILE': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_TAU_INIT': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_WELFARE_LOSSES': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_UTILITY_THRESHOLDS': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_CANDIDATE_WINNING_FREQUENCY': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'MCS_N_EPISODES': 'poisson_approval.meta_analysis.monte_carlo_fictitious_play',
+    'plot_welfare_losses': 'poisson_approval.meta_analysis.plot_welfare_losses',
+    'plot_distribution_scores': 'poisson_approval.meta_analysis.plot_distribution_scores',
+    'plot_utility_thresholds': 'poisson_approval.meta_analysis.plot_utility_thresholds',
+    'TernaryAxesSubplotPoisson': 'poisson_approval.meta_analysis.ternary_plots',
+    'ternary_figure': 'poisson_approval.meta_analysis.ternary_plots',
+    'ternary_plot_n_equilibria': 'poisson_approval.meta_analysis.ternary_shortcuts',
+    'ternary_plot_winners_at_equilibrium': 'poisson_approval.meta_analysis.ternary_shortcuts',
+    'ternary_plot_winning_frequencies': 'poisson_approval.meta_analysis.ternary_shortcuts',
+    'ternary_plot_convergence': 'poisson_approval.meta_analysis.ternary_shortcuts',
+    'SimplexToProfile': 'poisson_approval.meta_analysis.ternary_shortcuts',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name)) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_IMPORTS.keys()))
+
+
+# For ``from poisson_approval import *``: same names as with eager imports (this triggers the lazy imports).
+__all__ = sorted({name for name in globals().keys() if not name.startswith('_')} - {'importlib'}
+                 | set(_LAZY_IMPORTS.keys()))
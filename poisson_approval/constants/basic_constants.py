@@ -96,6 +96,9 @@ ANTI_PLURALITY = 'Anti-plurality'
 VOTING_RULES = [APPROVAL, PLURALITY, ANTI_PLURALITY]
 """list of str: The three voting rules of the package, i.e. Approval, Plurality and Anti-Plurality."""
 
+FLOAT = 'float'
+"""str: Value of the argument `symbolic` that selects :class:`ComputationEngineFloat` (computation with floats only)."""
+
 
 def _f_abc_xyz(my_list):
     return [element.replace('a', 'x').replace('b', 'y').replace('c', 'z') for element in my_list]
@@ -18,6 +18,12 @@ class AnalyzedStrategies:
         a strategy is an equilibrium or not.
     non_equilibria : list of :class:`Strategy`
         List of the strategies where the program certifies there is no equilibrium.
+    n_distinct_taus : int, optional
+        Number of distinct tau-vectors among the analyzed strategies (cf. :meth:`Profile.analyzed_strategies`).
+    n_best_responses_computed : int, optional
+        Number of best responses computed during the analysis (cf. :meth:`Profile.analyzed_strategies`).
+    n_best_responses_avoided : int, optional
+        Number of best responses avoided during the analysis (cf. :meth:`Profile.analyzed_strategies`).
 
     Examples
     --------
@@ -33,11 +39,16 @@ class AnalyzedStrategies:
         a, b
     """
 
-    def __init__(self, equilibria: list, utility_dependent: list, inconclusive: list, non_equilibria: list):
+    def __init__(self, equilibria: list, utility_dependent: list, inconclusive: list, non_equilibria: list,
+                 n_distinct_taus: int = None, n_best_responses_computed: int = None,
+                 n_best_responses_avoided: int = None):
         self.equilibria = equilibria
         self.utility_dependent = utility_dependent
         self.inconclusive = inconclusive
         self.non_equilibria = non_equilibria
+        self.n_distinct_taus = n_distinct_taus
+        self.n_best_responses_computed = n_best_responses_computed
+        self.n_best_responses_avoided = n_best_responses_avoided
 
     def __repr__(self):
         """
@@ -1,4 +1,3 @@
-import sympy
 from poisson_approval.utils.computation_engine import computation_engine
 from poisson_approval.utils.Util import isnan, isneginf
 
@@ -15,8 +14,8 @@ class Asymptotic:
         Coefficient of the term in `log n`.
     xi : Number, ``sp.nan``, ``np.nan``, ``- sp.oo`` or ``- np.inf``
         Constant coefficient.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
     Attributes
     ----------
@@ -89,7 +88,7 @@ class Asymptotic:
             >>> print(Asymptotic(mu=-np.inf, nu=-np.inf, xi=-np.inf))
             exp(- inf)
         """
-        if self.symbolic:
+        if self.ce.symbolic:
             return self._str_symbolic()
         else:
             return self._str_approximate()
@@ -97,6 +96,7 @@ class Asymptotic:
     def _str_symbolic(self):
         """Auxiliary function for __str__
         """
+        import sympy
         if isneginf(self.mu) and isneginf(self.nu) and isneginf(self.xi):
             return "exp(- inf)"
 
@@ -362,8 +362,8 @@ class Asymptotic:
             The parameter of the Poisson distribution is ``tau * n``, where `n` tends to infinity.
         k : int
             The desired value in ``P(X = k)``.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -401,8 +401,8 @@ class Asymptotic:
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
         k : int
             The desired value in ``P(X_1 = X_2 + k)``.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -453,8 +453,8 @@ class Asymptotic:
         ----------
         tau_1,tau_2 : Number
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -482,8 +482,8 @@ class Asymptotic:
         ----------
         tau_1,tau_2 : Number
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -510,8 +510,8 @@ class Asymptotic:
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
         k : int
             The desired value in ``P(X_1 >= X_2 + k)``.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -567,8 +567,8 @@ class Asymptotic:
         ----------
         tau_1,tau_2 : Number
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -606,8 +606,8 @@ class Asymptotic:
         ----------
         tau_1,tau_2 : Number
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -645,8 +645,8 @@ class Asymptotic:
         ----------
         tau_1,tau_2 : Number
             The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
-        symbolic : bool
-            Whether the computations are symbolic or numeric.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
         Returns
         -------
@@ -0,0 +1,355 @@
+import math
+import numpy as np
+from poisson_approval.events.Asymptotic import Asymptotic
+
+
+class AsymptoticArray:
+    r"""A batch of asymptotic developments of the form :math:`\exp(\mu n + \nu \log n + \xi + o(1))`.
+
+    Parameters
+    ----------
+    mu : numpy.ndarray or Number
+        Coefficients of the term in `n` (called "magnitudes").
+    nu : numpy.ndarray or Number
+        Coefficients of the term in `log n`.
+    xi : numpy.ndarray or Number
+        Constant coefficients.
+
+    Notes
+    -----
+    The conventions are the same as in :class:`Asymptotic` (with ``np.nan`` and ``- np.inf``), but each coefficient
+    is an array with one value per asymptotic development. The operations are elementwise, and they give the same
+    results as the operations of :class:`Asymptotic` (in numeric mode), without a loop in Python. The coefficients
+    are broadcast to a common shape.
+
+    Examples
+    --------
+        >>> asymptotics = AsymptoticArray(mu=[-1, 0], nu=[0, -0.5], xi=[0, np.nan])
+        >>> len(asymptotics)
+        2
+        >>> print(asymptotics[0])
+        exp(- n + o(1))
+        >>> print(asymptotics[1])
+        exp(- 0.5 log n + ? + o(1))
+        >>> asymptotics
+        <AsymptoticArray of 2 asymptotic developments>
+        >>> (asymptotics * 2).xi
+        array([0.69314718,        nan])
+        >>> (asymptotics + AsymptoticArray(mu=-2, nu=0, xi=1)).mu
+        array([-1.,  0.])
+        >>> asymptotics.limit
+        array([0., 0.])
+    """
+
+    def __init__(self, mu, nu, xi):
+        self.mu, self.nu, self.xi = (np.array(coefficient, dtype=float) for coefficient in np.broadcast_arrays(
+            np.asarray(mu, dtype=float), np.asarray(nu, dtype=float), np.asarray(xi, dtype=float)))
+        self.μ, self.ν, self.ξ = self.mu, self.nu, self.xi
+
+    def __len__(self):
+        return self.mu.shape[0]
+
+    def __getitem__(self, item):
+        """
+            >>> asymptotics = AsymptoticArray(mu=[-1, -2, -3], nu=0, xi=0)
+            >>> asymptotics[1]
+            Asymptotic(mu=-2.0, nu=0.0, xi=0.0)
+            >>> asymptotics[1:].mu
+            array([-2., -3.])
+        """
+        if isinstance(item, (int, np.integer)):
+            return Asymptotic(mu=float(self.mu[item]), nu=float(self.nu[item]), xi=float(self.xi[item]))
+        return AsymptoticArray(self.mu[item], self.nu[item], self.xi[item])
+
+    def __repr__(self):
+        return '<AsymptoticArray of %d asymptotic developments>' % len(self)
+
+    @classmethod
+    def _convert(cls, other):
+        """Convert `other` (an :class:`Asymptotic`, a positive number or an array of positive numbers) to an
+        asymptotic array."""
+        if isinstance(other, AsymptoticArray):
+            return other
+        if isinstance(other, Asymptotic):
+            return cls(float(other.mu), float(other.nu), float(other.xi))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return cls(0., 0., np.log(np.asarray(other, dtype=float)))
+
+    @property
+    def limit(self):
+        """numpy.ndarray : Limits when `n` tends to infinity. Cf. :attr:`Asymptotic.limit`.
+
+        Examples
+        --------
+            >>> AsymptoticArray(mu=[-1, 1, -1, 0, 0, 0], nu=[0, 0, np.nan, -1, 0, 0],
+            ...                 xi=[0, 0, np.nan, np.nan, np.nan, 0]).limit
+            array([ 0., inf,  0.,  0., nan,  1.])
+        """
+        with np.errstate(invalid='ignore', over='ignore'):
+            limit_nu = np.where(self.nu > 0, np.inf, np.where(self.nu < 0, 0., np.exp(self.xi)))
+            limit_nu = np.where(np.isnan(self.nu), np.nan, limit_nu)
+            limit = np.where(self.mu > 0, np.inf, np.where(self.mu < 0, 0., limit_nu))
+            return np.where(np.isnan(self.mu), np.nan, limit)
+
+    def __mul__(self, other):
+        """Multiplication of asymptotic developments. Cf. :meth:`Asymptotic.__mul__`.
+
+        Parameters
+        ----------
+        other : AsymptoticArray, Asymptotic, Number or numpy.ndarray
+
+        Returns
+        -------
+        AsymptoticArray
+            The elementwise product.
+
+        Examples
+        --------
+            >>> product = AsymptoticArray(mu=[42, 42], nu=[51, 51], xi=[69, 69]) * AsymptoticArray(
+            ...     mu=[1, 1], nu=[2, np.nan], xi=[3, np.nan])
+            >>> print(product[0])
+            exp(43 n + 53 log n + 72 + o(1))
+            >>> print(product[1])
+            exp(43 n + ? log n + ? + o(1))
+        """
+        other = self._convert(other)
+        return AsymptoticArray(_my_addition(self.mu, other.mu),
+                               _my_addition(self.nu, other.nu),
+                               _my_addition(self.xi, other.xi))
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        """Division of asymptotic developments. Cf. :meth:`Asymptotic.__truediv__`.
+
+        Examples
+        --------
+            >>> print((AsymptoticArray(mu=[42], nu=[51], xi=[69]) / AsymptoticArray(mu=[1], nu=[2], xi=[3]))[0])
+            exp(41 n + 49 log n + 66 + o(1))
+            >>> print((1 / AsymptoticArray(mu=[42], nu=[51], xi=[69]))[0])
+            exp(- 42 n - 51 log n - 69 + o(1))
+        """
+        other = self._convert(other)
+        return self * AsymptoticArray(- other.mu, - other.nu, - other.xi)
+
+    def __rtruediv__(self, other):
+        return self._convert(other) / self
+
+    def __add__(self, other):
+        """Addition of asymptotic developments. Cf. :meth:`Asymptotic.__add__`.
+
+        Parameters
+        ----------
+        other : AsymptoticArray, Asymptotic, Number or numpy.ndarray
+
+        Returns
+        -------
+        AsymptoticArray
+            The elementwise sum.
+
+        Examples
+        --------
+            >>> asymptotics = (AsymptoticArray(mu=[42, 42, 42], nu=[2, 2, 2], xi=[69, 69, 4])
+            ...                + AsymptoticArray(mu=[1, 42, 42], nu=[51, 51, 2], xi=[3, 3, 3]))
+            >>> print(asymptotics[0])
+            exp(42 n + 2 log n + 69 + o(1))
+            >>> print(asymptotics[1])
+            exp(42 n + 51 log n + 3 + o(1))
+            >>> print(asymptotics[2])
+            exp(42 n + 2 log n + 4.31326 + o(1))
+        """
+        other = self._convert(other)
+        mu_1, nu_1, xi_1 = self.mu, self.nu, self.xi
+        mu_2, nu_2, xi_2 = other.mu, other.nu, other.xi
+        with np.errstate(invalid='ignore', over='ignore', divide='ignore'):
+            same_mu = _look_equal(mu_1, mu_2)
+            same_nu = _look_equal(nu_1, nu_2)
+            mu = np.where(same_mu, np.maximum(mu_1, mu_2), np.where(mu_1 > mu_2, mu_1, mu_2))
+            nu = np.where(same_mu, np.where(same_nu, np.maximum(nu_1, nu_2), np.where(nu_1 > nu_2, nu_1, nu_2)),
+                          np.where(mu_1 > mu_2, nu_1, nu_2))
+            xi = np.where(same_mu,
+                          np.where(same_nu, np.log(np.exp(xi_1) + np.exp(xi_2)), np.where(nu_1 > nu_2, xi_1, xi_2)),
+                          np.where(mu_1 > mu_2, xi_1, xi_2))
+            nan_nu = same_mu & (np.isnan(nu_1) | np.isnan(nu_2))
+            nu = np.where(nan_nu, np.nan, nu)
+            xi = np.where(nan_nu, np.nan, xi)
+            nan_mu = np.isnan(mu_1) | np.isnan(mu_2)
+            return AsymptoticArray(np.where(nan_mu, np.nan, mu), np.where(nan_mu, np.nan, nu),
+                                   np.where(nan_mu, np.nan, xi))
+
+    def __radd__(self, other):
+        return self + other
+
+    def look_equal(self, other, rel_tol=1e-9, abs_tol=0.):
+        """Test if asymptotic developments can reasonably be considered as equal. Cf. :meth:`Asymptotic.look_equal`.
+
+        Parameters
+        ----------
+        other : AsymptoticArray or Asymptotic
+        rel_tol, abs_tol : float
+            Cf. ``math.isclose``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of Booleans.
+
+        Examples
+        --------
+            >>> AsymptoticArray(mu=[1, 1], nu=[2, 2], xi=[3, 3]).look_equal(
+            ...     AsymptoticArray(mu=[0.999999999999, 1], nu=[2.00000000001, 2], xi=[3, 4]))
+            array([ True, False])
+        """
+        other = self._convert(other)
+        coefficients = [self.mu, self.nu, self.xi, other.mu, other.nu, other.xi]
+        if any(np.any(np.isnan(coefficient)) for coefficient in coefficients):
+            raise ValueError('Can assert look_equal only when all coefficients are known.')
+        return (_look_equal(self.mu, other.mu, rel_tol, abs_tol)
+                & _look_equal(self.nu, other.nu, rel_tol, abs_tol)
+                & _look_equal(self.xi, other.xi, rel_tol, abs_tol))
+
+    @classmethod
+    def poisson_x1_eq_x2_plus_k(cls, tau_1, tau_2, k):
+        """Asymptotic developments of ``P(X_1 = X_2 + k)``, where ``X_i ~ Poison(tau_i * n)``.
+
+        Parameters
+        ----------
+        tau_1,tau_2 : numpy.ndarray
+            The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
+        k : int
+            The desired value in ``P(X_1 = X_2 + k)``.
+
+        Returns
+        -------
+        AsymptoticArray
+            Cf. :meth:`Asymptotic.poisson_x1_eq_x2_plus_k`.
+
+        Examples
+        --------
+            >>> asymptotics = AsymptoticArray.poisson_x1_eq_x2_plus_k(
+            ...     tau_1=np.array([0, 1, 1]), tau_2=np.array([1, 0, 2]), k=1)
+            >>> print(asymptotics[0])
+            exp(- inf)
+            >>> print(asymptotics[1])
+            exp(- n + log n + o(1))
+            >>> asymptotics[2].look_equal(Asymptotic.poisson_x1_eq_x2_plus_k(tau_1=1, tau_2=2, k=1))
+            True
+        """
+        tau_1, tau_2 = np.broadcast_arrays(np.asarray(tau_1, dtype=float), np.asarray(tau_2, dtype=float))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mu = np.where(tau_2 == 0, - tau_1, - (np.sqrt(tau_1) - np.sqrt(tau_2)) ** 2)
+            nu = np.where(tau_2 == 0, float(k), - 1 / 2)
+            xi = np.where(tau_2 == 0, k * np.log(tau_1) - math.log(math.factorial(k)),
+                          - 1 / 2 * np.log(4 * np.pi * np.sqrt(tau_1 * tau_2) * tau_2 ** k / tau_1 ** k))
+        if k == 0:
+            mu_zero, nu_zero, xi_zero = - tau_2, 0., 0.
+        else:
+            mu_zero, nu_zero, xi_zero = - np.inf, - np.inf, - np.inf
+        return cls(np.where(tau_1 == 0, mu_zero, mu), np.where(tau_1 == 0, nu_zero, nu),
+                   np.where(tau_1 == 0, xi_zero, xi))
+
+    @classmethod
+    def poisson_eq(cls, tau_1, tau_2):
+        """Asymptotic developments of ``P(X_1 = X_2)``, where ``X_i ~ Poison(tau_i * n)``.
+
+        Parameters
+        ----------
+        tau_1,tau_2 : numpy.ndarray
+            The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
+
+        Returns
+        -------
+        AsymptoticArray
+            Cf. :meth:`Asymptotic.poisson_eq`.
+
+        Examples
+        --------
+            >>> asymptotics = AsymptoticArray.poisson_eq(tau_1=np.array([0, 1/10, 1/10]),
+            ...                                          tau_2=np.array([0, 0, 9/10]))
+            >>> print(asymptotics[0])
+            exp(o(1))
+            >>> print(asymptotics[1])
+            exp(- 0.1 n + o(1))
+            >>> asymptotics[2].look_equal(Asymptotic.poisson_eq(tau_1=1/10, tau_2=9/10))
+            True
+        """
+        return cls.poisson_x1_eq_x2_plus_k(tau_1, tau_2, 0)
+
+    @classmethod
+    def poisson_one_more(cls, tau_1, tau_2):
+        """Asymptotic developments of ``P(X_1 = X_2 + 1)``, where ``X_i ~ Poison(tau_i * n)``.
+
+        Parameters
+        ----------
+        tau_1,tau_2 : numpy.ndarray
+            The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
+
+        Returns
+        -------
+        AsymptoticArray
+            Cf. :meth:`Asymptotic.poisson_one_more`.
+
+        Examples
+        --------
+            >>> asymptotics = AsymptoticArray.poisson_one_more(tau_1=np.array([0, 1/10]), tau_2=np.array([1/10, 0]))
+            >>> print(asymptotics[0])
+            exp(- inf)
+            >>> print(asymptotics[1])
+            exp(- 0.1 n + log n - 2.30259 + o(1))
+        """
+        return cls.poisson_x1_eq_x2_plus_k(tau_1, tau_2, 1)
+
+    @classmethod
+    def poisson_x1_ge_x2_plus_k(cls, tau_1, tau_2, k):
+        """Asymptotic developments of ``P(X_1 >= X_2 + k)``, where ``X_i ~ Poison(tau_i * n)``.
+
+        Parameters
+        ----------
+        tau_1,tau_2 : numpy.ndarray
+            The parameter of the Poisson distribution of ``X_i`` is ``tau_i * n``, where `n` tends to infinity.
+        k : int
+            The desired value in ``P(X_1 >= X_2 + k)``.
+
+        Returns
+        -------
+        AsymptoticArray
+            Cf. :meth:`Asymptotic.poisson_x1_ge_x2_plus_k`.
+
+        Examples
+        --------
+            >>> asymptotics = AsymptoticArray.poisson_x1_ge_x2_plus_k(
+            ...     tau_1=np.array([0, 1, 1, 1]), tau_2=np.array([1, 0, 1, 2]), k=0)
+            >>> print(asymptotics[0])
+            exp(- n + o(1))
+            >>> print(asymptotics[1])
+            exp(o(1))
+            >>> print(asymptotics[2])
+            exp(- 0.693147 + o(1))
+            >>> asymptotics[3].look_equal(Asymptotic.poisson_x1_ge_x2_plus_k(tau_1=1, tau_2=2, k=0))
+            True
+        """
+        tau_1, tau_2 = np.broadcast_arrays(np.asarray(tau_1, dtype=float), np.asarray(tau_2, dtype=float))
+        # Use the offset theorem with event X_1 = X_2, then infinite sum.
+        offset = cls.poisson_x1_eq_x2_plus_k(tau_1, tau_2, k)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xi = offset.xi - np.log(1 - np.sqrt(tau_1 / tau_2))
+        # Probability 1 (resp. 1/2) => the log tends to 0 (resp. - log(2)).
+        mu = np.where(tau_1 >= tau_2, 0., offset.mu)
+        nu = np.where(tau_1 >= tau_2, 0., offset.nu)
+        xi = np.where(tau_1 > tau_2, 0., np.where(tau_1 == tau_2, - np.log(2), xi))
+        return cls(np.where(tau_1 == 0, offset.mu, mu), np.where(tau_1 == 0, offset.nu, nu),
+                   np.where(tau_1 == 0, offset.xi, xi))
+
+
+def _look_equal(x, y, rel_tol=1e-9, abs_tol=0.):
+    """Vectorized version of :meth:`ComputationEngine.look_equal` for floats, i.e. of ``math.isclose``."""
+    with np.errstate(invalid='ignore'):
+        return (x == y) | (np.isfinite(x) & np.isfinite(y)
+                           & (np.abs(x - y) <= np.maximum(rel_tol * np.maximum(np.abs(x), np.abs(y)), abs_tol)))
+
+
+def _my_addition(x, y):
+    """Addition, with the same convention as in :meth:`Asymptotic.__mul__`."""
+    with np.errstate(invalid='ignore'):
+        return np.where(_look_equal(x, -y), 0., x + y)
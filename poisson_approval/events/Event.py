@@ -1,4 +1,6 @@
-from poisson_approval.utils.computation_engine import computation_engine
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from poisson_approval.constants.basic_constants import *
 from poisson_approval.utils.SuperclassMeta import SuperclassMeta
 from poisson_approval.utils.Util import isnan
 from poisson_approval.utils.UtilBallots import sort_ballot
@@ -31,13 +33,13 @@ class Event(metaclass=SuperclassMeta):
     phi_ab : Number or ``np.nan``
         The offset for this kind of ballot. An offset is ``np.nan`` if it is not defined.
         Other offsets are denoted ``phi_a``, etc.
-    phi : dict
+    phi : Mapping
         The dictionary of the offsets. For example, ``self.phi['a']`` is just an alternate notation for ``self.phi_a``.
     psi_ab : Number or ``np.nan``
         The pseudo-offset for this kind of ballot. It is equal to ``phi_ab`` if it exists, and ``phi_a * phi_b``
         otherwise. Similarly, the pseudo-offset ``psi_a`` is equal to ``phi_a`` if it exists, and ``phi_ab * phi_ac``
         otherwise. Other pseudo-offsets are denoted ``psi_b``, etc.
-    psi : dict
+    psi : Mapping
         The dictionary of pseudo-offsets. For example, ``self.psi['a']`` is just an alternate notation for
         ``self.psi_a``.
 
@@ -47,44 +49,22 @@ class Event(metaclass=SuperclassMeta):
     For example, in :class:`EventDuo`, we consider a tie between candidates ``x`` and ``y`` (hence in that case, if is
     the same if ``x`` and ``y`` are exchanged, but not if ``x`` and ``z`` are exchanged for example).
 
+    To keep events light (a tau-vector can have dozens of them), an event only stores its tau-vector, its three
+    candidates, its asymptotic and its six offsets and pseudo-offsets (in ``__slots__``). The other attributes, such
+    as ``phi_ab``, ``psi_ab``, ``phi``, ``mu`` or ``tau_ab``, are computed views on these values. In particular, the
+    subclasses must declare ``__slots__ = ()``.
+
     Examples
     --------
     Cf. :class:`EventPivotWeak`.
     """
 
+    __slots__ = ('tau', '_label_x', '_label_y', '_label_z', 'asymptotic',
+                 '_phi_x', '_phi_y', '_phi_z', '_phi_xy', '_phi_xz', '_phi_yz',
+                 '_psi_x', '_psi_y', '_psi_z', '_psi_xy', '_psi_xz', '_psi_yz')
+
     def __init__(self, candidate_x, candidate_y, candidate_z, tau):
-        # -------------
-        # Preliminaries
-        # -------------
-        self.symbolic = tau.symbolic
-        self.ce = computation_engine(self.symbolic)
-        # Create labels
-        self._label_x, self._label_y, self._label_z = candidate_x, candidate_y, candidate_z
-        self._label_xy = ''.join(sorted([self._label_x, self._label_y]))
-        self._label_xz = ''.join(sorted([self._label_x, self._label_z]))
-        self._label_yz = ''.join(sorted([self._label_y, self._label_z]))
-        self._label_xyd = self._label_xy[1] + self._label_xy[0]
-        self._label_xzd = self._label_xz[1] + self._label_xz[0]
-        self._label_yzd = self._label_yz[1] + self._label_yz[0]
-        self._labels_std_one = {self._label_x: 'x', self._label_y: 'y', self._label_z: 'z'}
-        self._labels_std_two = {self._label_xy: 'xy', self._label_xz: 'xz', self._label_yz: 'yz'}
-        self._labels_std_two_down = {self._label_xyd: 'xy', self._label_xzd: 'xz', self._label_yzd: 'yz'}
-        self._labels_std = self._labels_std_one.copy()
-        self._labels_std.update(self._labels_std_two)
-        self._labels_std.update(self._labels_std_two_down)
-        # Declare variables to tranquilize PyCharm's syntax checker
-        self.tau = tau
-        self._tau_x, self._tau_y, self._tau_z = 0, 0, 0
-        self._tau_xy, self._tau_xz, self._tau_yz = 0, 0, 0
-        # Initialize variables such as self.tau_a and self._tau_x
-        for label, label_std in self._labels_std.items():
-            # Ex: label = 'ab', label_std = 'xy'
-            # The share
-            share = tau.d_ballot_share[sort_ballot(label)]
-            # Define variable such as self._tau_xy
-            setattr(self, '_tau_' + label_std, share)
-            # Define variable such as tau_ab
-            setattr(self, 'tau_' + label, share)
+        self._initialize_labels(candidate_x, candidate_y, candidate_z, tau)
         # Declare the computed variables
         self._phi_x, self._phi_y, self._phi_z = None, None, None
         self._phi_xy, self._phi_xz, self._phi_yz = None, None, None
@@ -92,46 +72,116 @@ class Event(metaclass=SuperclassMeta):
         # ------------------------------------------------
         # Magnitudes, offsets and (if possible) asymptotic
         # ------------------------------------------------
-        self._compute(tau_x=self._tau_x, tau_y=self._tau_y, tau_z=self._tau_z,
-                      tau_xy=self._tau_xy, tau_xz=self._tau_xz, tau_yz=self._tau_yz)
-        self.mu = self.asymptotic.mu
-        self.nu = self.asymptotic.nu
-        self.xi = self.asymptotic.xi
-        # ---------------------------------------------------------------
-        # Create the variables like self.phi_ab, self.phi['ab'] (offsets)
-        # ---------------------------------------------------------------
-        self.phi = dict()
-        for label, label_std in self._labels_std.items():
-            # Ex: label = 'ab', label_std = 'xy'
-            setattr(self, 'phi_' + label, getattr(self, '_phi_' + label_std))
-            self.phi[label] = getattr(self, '_phi_' + label_std)
-        # ----------------------------------------------------------------------
-        # Create the variables like self.psi_ab, self.psi['ab'] (pseudo-offsets)
-        # ----------------------------------------------------------------------
+        d = tau.d_ballot_share
+        self._compute(tau_x=d[candidate_x], tau_y=d[candidate_y], tau_z=d[candidate_z],
+                      tau_xy=d[self._label_xy], tau_xz=d[self._label_xz], tau_yz=d[self._label_yz])
+        self._initialize_pseudo_offsets()
 
+    def _initialize_labels(self, candidate_x, candidate_y, candidate_z, tau):
+        self.tau = tau
+        self._label_x, self._label_y, self._label_z = candidate_x, candidate_y, candidate_z
+
+    def _initialize_pseudo_offsets(self):
         def pseudo_offset(phi, phi_left, phi_right):
             if isnan(phi):
                 return phi_left * phi_right
             else:
                 return phi
-        self.psi = dict()
-        self.psi[self._label_x] = pseudo_offset(self.phi[self._label_x],
-                                                self.phi[self._label_xy], self.phi[self._label_xz])
-        self.psi[self._label_y] = pseudo_offset(self.phi[self._label_y],
-                                                self.phi[self._label_xy], self.phi[self._label_yz])
-        self.psi[self._label_z] = pseudo_offset(self.phi[self._label_z],
-                                                self.phi[self._label_xz], self.phi[self._label_yz])
-        self.psi[self._label_xy] = pseudo_offset(self.phi[self._label_xy],
-                                                 self.phi[self._label_x], self.phi[self._label_y])
-        self.psi[self._label_xz] = pseudo_offset(self.phi[self._label_xz],
-                                                 self.phi[self._label_x], self.phi[self._label_z])
-        self.psi[self._label_yz] = pseudo_offset(self.phi[self._label_yz],
-                                                 self.phi[self._label_y], self.phi[self._label_z])
-        self.psi[self._label_xyd] = self.psi[self._label_xy]
-        self.psi[self._label_xzd] = self.psi[self._label_xz]
-        self.psi[self._label_yzd] = self.psi[self._label_yz]
-        for label in self._labels_std.keys():
-            setattr(self, 'psi_' + label, self.psi[label])
+        self._psi_x = pseudo_offset(self._phi_x, self._phi_xy, self._phi_xz)
+        self._psi_y = pseudo_offset(self._phi_y, self._phi_xy, self._phi_yz)
+        self._psi_z = pseudo_offset(self._phi_z, self._phi_xz, self._phi_yz)
+        self._psi_xy = pseudo_offset(self._phi_xy, self._phi_x, self._phi_y)
+        self._psi_xz = pseudo_offset(self._phi_xz, self._phi_x, self._phi_z)
+        self._psi_yz = pseudo_offset(self._phi_yz, self._phi_y, self._phi_z)
+
+    @property
+    def symbolic(self):
+        """bool : Whether the computations are symbolic or numeric."""
+        return self.tau.symbolic
+
+    @property
+    def ce(self):
+        """ComputationEngine : The computation engine."""
+        return self.tau.ce
+
+    @property
+    def mu(self):
+        return self.asymptotic.mu
+
+    @property
+    def nu(self):
+        return self.asymptotic.nu
+
+    @property
+    def xi(self):
+        return self.asymptotic.xi
+
+    @property
+    def _label_xy(self):
+        return ''.join(sorted([self._label_x, self._label_y]))
+
+    @property
+    def _label_xz(self):
+        return ''.join(sorted([self._label_x, self._label_z]))
+
+    @property
+    def _label_yz(self):
+        return ''.join(sorted([self._label_y, self._label_z]))
+
+    @property
+    def _labels_std(self):
+        """dict : Key: a label (e.g. ``'ab'`` or ``'ba'``). Value: the corresponding standard label (e.g. ``'xy'``)."""
+        return _labels_std(self._label_x, self._label_y, self._label_z)
+
+    @property
+    def phi(self):
+        return _EventOffsets(self, '_phi_')
+
+    @property
+    def psi(self):
+        return _EventOffsets(self, '_psi_')
+
+    def permuted(self, d_candidate_new, tau):
+        """The same event, with the candidates renamed.
+
+        Parameters
+        ----------
+        d_candidate_new : dict
+            Key: a candidate. Value: the new name of this candidate.
+        tau : TauVector
+            The tau-vector with the new names, i.e. the tau-vector of this event up to the renaming of the candidates.
+
+        Returns
+        -------
+        Event
+            The same event, for the new names of the candidates. It is not computed again: the asymptotic and the
+            offsets are simply copied.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import TauVector, EventPivotWeak
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> event = EventPivotWeak(candidate_x='a', candidate_y='c', candidate_z='b', tau=tau)
+            >>> event
+            <asymptotic = exp(- 0.0834849 n - 0.5 log n - 0.87535 + o(1)), phi_a = 0.654654, phi_c = 1.52753, \
+phi_ab = 0.654654>
+            >>> tau_permuted = TauVector({'b': Fraction(1, 10), 'bc': Fraction(3, 5), 'a': Fraction(3, 10)})
+            >>> event.permuted({'a': 'b', 'b': 'c', 'c': 'a'}, tau=tau_permuted)
+            <asymptotic = exp(- 0.0834849 n - 0.5 log n - 0.87535 + o(1)), phi_a = 1.52753, phi_b = 0.654654, \
+phi_bc = 0.654654>
+            >>> EventPivotWeak(candidate_x='b', candidate_y='a', candidate_z='c', tau=tau_permuted)
+            <asymptotic = exp(- 0.0834849 n - 0.5 log n - 0.87535 + o(1)), phi_a = 1.52753, phi_b = 0.654654, \
+phi_bc = 0.654654>
+        """
+        event = object.__new__(type(self))
+        event._initialize_labels(d_candidate_new[self._label_x], d_candidate_new[self._label_y],
+                                 d_candidate_new[self._label_z], tau)
+        for label_std in ['x', 'y', 'z', 'xy', 'xz', 'yz']:
+            setattr(event, '_phi_' + label_std, getattr(self, '_phi_' + label_std))
+            setattr(event, '_psi_' + label_std, getattr(self, '_psi_' + label_std))
+        event.asymptotic = self.asymptotic
+        return event
 
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         """
@@ -146,12 +196,10 @@ class Event(metaclass=SuperclassMeta):
 
     def __repr__(self):
         s = 'asymptotic = %s' % self.asymptotic
-        lab_sorted = sorted(self._labels_std_one.keys())
-        lab_sorted.extend(sorted(self._labels_std_two.keys()))
-        for label in lab_sorted:
+        for label in BALLOTS_WITHOUT_INVERSIONS:
             val = getattr(self, 'phi_' + label)
             if not isnan(val):
-                if self.symbolic:
+                if self.ce.symbolic:
                     s += ', phi_' + label + ' = %s' % val
                 else:
                     s += ', phi_' + label + ' = {:.6g}'.format(float(val))
@@ -160,3 +208,60 @@ class Event(metaclass=SuperclassMeta):
     def _repr_pretty_(self, p, cycle):  # pragma: no cover - Only for notebooks
         # https://stackoverflow.com/questions/41453624/tell-ipython-to-use-an-objects-str-instead-of-repr-for-output
         p.text(str(self) if not cycle else '...')
+
+
+class _EventOffsets(Mapping):
+    """Read-only view of the offsets (or pseudo-offsets) of an event, as a dictionary."""
+
+    __slots__ = ('_event', '_prefix')
+
+    def __init__(self, event, prefix):
+        self._event = event
+        self._prefix = prefix
+
+    def __getitem__(self, label):
+        return getattr(self._event, self._prefix + self._event._labels_std[label])
+
+    def __iter__(self):
+        return iter(self._event._labels_std)
+
+    def __len__(self):
+        return len(self._event._labels_std)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+@lru_cache(maxsize=None)
+def _labels_std(candidate_x, candidate_y, candidate_z):
+    """Labels of an event (shared by all the events with the same candidates `x`, `y` and `z`)."""
+    label_xy = ''.join(sorted([candidate_x, candidate_y]))
+    label_xz = ''.join(sorted([candidate_x, candidate_z]))
+    label_yz = ''.join(sorted([candidate_y, candidate_z]))
+    return {candidate_x: 'x', candidate_y: 'y', candidate_z: 'z', label_xy: 'xy', label_xz: 'xz', label_yz: 'yz',
+            label_xy[::-1]: 'xy', label_xz[::-1]: 'xz', label_yz[::-1]: 'yz'}
+
+
+def _f_share(self, label):
+    """Share of this ballot"""
+    # This function is used to define the attributes like tau_ab and _tau_xy.
+    return self.tau.d_ballot_share[sort_ballot(label)]
+
+
+def _f_share_std(self, label_std):
+    return self.tau.d_ballot_share[getattr(self, '_label_' + label_std)]
+
+
+def _f_offset(self, label, prefix):
+    """Offset or pseudo-offset of this ballot"""
+    # This function is used to define the attributes like phi_ab and psi_ab.
+    return getattr(self, prefix + self._labels_std[label])
+
+
+for my_label_std in ['x', 'y', 'z', 'xy', 'xz', 'yz']:
+    setattr(Event, '_tau_' + my_label_std, property(partial(_f_share_std, label_std=my_label_std)))
+
+for my_ballot in BALLOTS_WITH_INVERSIONS:
+    setattr(Event, 'tau_' + my_ballot, property(partial(_f_share, label=my_ballot)))
+    setattr(Event, 'phi_' + my_ballot, property(partial(_f_offset, label=my_ballot, prefix='_phi_')))
+    setattr(Event, 'psi_' + my_ballot, property(partial(_f_offset, label=my_ballot, prefix='_psi_')))
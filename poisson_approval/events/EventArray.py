@@ -0,0 +1,143 @@
+import numpy as np
+from poisson_approval.events.Asymptotic import Asymptotic
+from poisson_approval.events.AsymptoticArray import AsymptoticArray
+
+
+class EventArray:
+    """A batch of events of the same kind, one for each tau-vector of a :class:`TauVectorArray`.
+
+    Parameters
+    ----------
+    candidate_x : str
+        A candidate (e.g. ``'a'``).
+    candidate_y : str
+        A candidate (e.g. ``'b'``).
+    candidate_z : str
+        A candidate (e.g. ``'c'``).
+    mu : numpy.ndarray
+        The magnitudes (one per tau-vector).
+    nu : numpy.ndarray
+        The coefficients in `log n` (one per tau-vector).
+    xi : numpy.ndarray
+        The constant coefficients (one per tau-vector).
+    phi : dict
+        Key: a ballot without inversion (e.g. ``'a'`` or ``'ab'``). Value: a :class:`numpy.ndarray` with the offsets of
+        this ballot (one per tau-vector).
+
+    Attributes
+    ----------
+    phi_ab : numpy.ndarray
+        The offsets for this kind of ballot. Other offsets are denoted ``phi_a``, etc. Like in :class:`Event`, an
+        offset is ``np.nan`` if it is not defined.
+    psi_ab : numpy.ndarray
+        The pseudo-offsets for this kind of ballot. Cf. :class:`Event`. Other pseudo-offsets are denoted ``psi_a``,
+        etc.
+    psi : dict
+        The dictionary of the pseudo-offsets.
+
+    Notes
+    -----
+    The conventions are the same as in :class:`Event`, but each attribute is an array with one coefficient per
+    tau-vector. Such objects are typically returned by :class:`TauVectorArray`.
+
+    Examples
+    --------
+        >>> event = EventArray('a', 'b', 'c', mu=np.array([-0.1, 0.]), nu=np.array([-0.5, 0.]),
+        ...                    xi=np.array([-1., 0.]),
+        ...                    phi={'a': np.array([1., 1.]), 'b': np.array([1., np.nan]), 'c': np.array([2., 1.]),
+        ...                         'ab': np.array([np.nan, 2.]), 'ac': np.array([1., 1.]), 'bc': np.array([1., 1.])})
+        >>> len(event)
+        2
+        >>> event.psi_ab
+        array([1., 2.])
+        >>> event.psi_ba
+        array([1., 2.])
+        >>> event.psi_b
+        array([1., 2.])
+        >>> event[0]
+        <asymptotic = exp(- 0.1 n - 0.5 log n - 1 + o(1)), phi_a = 1, phi_b = 1, phi_c = 2, phi_ac = 1, phi_bc = 1>
+        >>> print(event.asymptotic(1))
+        exp(o(1))
+        >>> event.asymptotics.mu
+        array([-0.1,  0. ])
+    """
+
+    def __init__(self, candidate_x, candidate_y, candidate_z, mu, nu, xi, phi):
+        self._label_x, self._label_y, self._label_z = candidate_x, candidate_y, candidate_z
+        self.mu = mu
+        self.nu = nu
+        self.xi = xi
+        self.phi = {label: phi[label] for label in sorted(phi.keys(), key=lambda s: (len(s), s))}
+        label_xy = ''.join(sorted([candidate_x, candidate_y]))
+        label_xz = ''.join(sorted([candidate_x, candidate_z]))
+        label_yz = ''.join(sorted([candidate_y, candidate_z]))
+
+        def pseudo_offset(phi_main, phi_left, phi_right):
+            return np.where(np.isnan(phi_main), phi_left * phi_right, phi_main)
+
+        self.psi = dict()
+        self.psi[candidate_x] = pseudo_offset(phi[candidate_x], phi[label_xy], phi[label_xz])
+        self.psi[candidate_y] = pseudo_offset(phi[candidate_y], phi[label_xy], phi[label_yz])
+        self.psi[candidate_z] = pseudo_offset(phi[candidate_z], phi[label_xz], phi[label_yz])
+        self.psi[label_xy] = pseudo_offset(phi[label_xy], phi[candidate_x], phi[candidate_y])
+        self.psi[label_xz] = pseudo_offset(phi[label_xz], phi[candidate_x], phi[candidate_z])
+        self.psi[label_yz] = pseudo_offset(phi[label_yz], phi[candidate_y], phi[candidate_z])
+        for label in list(self.phi.keys()):
+            setattr(self, 'phi_' + label, self.phi[label])
+            setattr(self, 'psi_' + label, self.psi[label])
+            if len(label) == 2:
+                setattr(self, 'phi_' + label[::-1], self.phi[label])
+                setattr(self, 'psi_' + label[::-1], self.psi[label])
+
+    def __len__(self):
+        return self.mu.shape[0]
+
+    @property
+    def asymptotics(self):
+        """AsymptoticArray : The asymptotic developments of the probabilities of the events."""
+        return AsymptoticArray(self.mu, self.nu, self.xi)
+
+    def asymptotic(self, i):
+        """Asymptotic development of the event for one tau-vector.
+
+        Parameters
+        ----------
+        i : int
+            Index of the tau-vector.
+
+        Returns
+        -------
+        Asymptotic
+            The asymptotic development of the probability of the event for the `i`-th tau-vector.
+        """
+        return Asymptotic(mu=float(self.mu[i]), nu=float(self.nu[i]), xi=float(self.xi[i]))
+
+    def __getitem__(self, i):
+        return _EventRow(self, i)
+
+    def __repr__(self):
+        """
+            >>> EventArray('a', 'b', 'c', mu=np.zeros(3), nu=np.zeros(3), xi=np.zeros(3),
+            ...            phi={label: np.ones(3) for label in ['a', 'b', 'c', 'ab', 'ac', 'bc']})
+            <EventArray of 3 events>
+        """
+        return '<EventArray of %d events>' % len(self)
+
+
+class _EventRow:
+    """Read-only view of one event in an :class:`EventArray` (mostly for printing)."""
+
+    def __init__(self, event_array, i):
+        self.event_array = event_array
+        self.i = i
+
+    @property
+    def asymptotic(self):
+        return self.event_array.asymptotic(self.i)
+
+    def __repr__(self):
+        s = 'asymptotic = %s' % self.asymptotic
+        for label, values in self.event_array.phi.items():
+            if not np.isnan(values[self.i]):
+                s += ', phi_' + label + ' = {:.6g}'.format(float(values[self.i]))
+        return '<%s>' % s
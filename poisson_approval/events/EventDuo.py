@@ -21,6 +21,8 @@ class EventDuo(Event):
         <asymptotic = exp(- 0.1 n + o(1)), phi_a = 0, phi_c = 1, phi_ab = 1>
     """
 
+    __slots__ = ()
+
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
         w_x = ce.S(tau_x + tau_xz)
@@ -22,6 +22,8 @@ class EventPivotTij(Event):
         <asymptotic = exp(- 0.1 n + o(1)), phi_a = 0, phi_c = 1, phi_ab = 1>
     """
 
+    __slots__ = ()
+
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
         pivot_weak = getattr(self.tau, 'pivot_weak_' + self._label_xy)
@@ -31,6 +31,8 @@ class EventPivotWeak(Event):
         0.0
     """
 
+    __slots__ = ()
+
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
         if (tau_x == 0 and tau_xz == 0) or (tau_y == 0 and tau_yz == 0):
@@ -1,7 +1,7 @@
 import numpy as np
-from scipy.optimize import minimize
 from poisson_approval.events.Asymptotic import Asymptotic
 from poisson_approval.events.Event import Event
+from poisson_approval.utils.UtilTrio import trio_minimize
 
 
 class EventTrio(Event):
@@ -27,6 +27,8 @@ class EventTrio(Event):
         <asymptotic = exp(? log n + ? + o(1)), phi_a = 1, phi_b = 1, phi_c = 1, phi_ab = 1, phi_ac = 1, phi_bc = 1>
     """
 
+    __slots__ = ()
+
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
         is_cross_diagram = (tau_x == 0 and tau_yz == 0) or (tau_y == 0 and tau_xz == 0) or (tau_z == 0 and tau_xy == 0)
@@ -83,15 +85,10 @@ class EventTrio(Event):
             inf, sup, start = self._get_bounds_and_start(tau_x_f, tau_y_f, tau_z_f,
                                                          tau_xy_f, tau_xz_f, tau_yz_f)
             # Let's go for the actual computation
-            optimizer = minimize(
-                lambda x: 2 * np.sqrt(
-                    (tau_x_f * x + tau_xz_f) * (tau_yz_f / x + tau_y_f)
-                ) + tau_xy_f * x + tau_z_f / x - 1,
-                start,
-                bounds=[(inf, sup)]
-            )
-            self.asymptotic = Asymptotic(mu=ce.S(float(optimizer.fun)), nu=ce.nan, xi=ce.nan, symbolic=self.symbolic)
-            x_2 = ce.S(optimizer.x[0])
+            mu, x_2 = trio_minimize(tau_x_f, tau_y_f, tau_z_f, tau_xy_f, tau_xz_f, tau_yz_f,
+                                    inf=inf, sup=sup, start=start)
+            self.asymptotic = Asymptotic(mu=ce.S(float(mu)), nu=ce.nan, xi=ce.nan, symbolic=self.symbolic)
+            x_2 = ce.S(float(x_2))
             x_1 = ce.simplify(ce.sqrt((ce.S(tau_yz) / x_2 + tau_y) / (tau_x * x_2 + tau_xz)))
             self._phi_x = ce.simplify(x_1 * x_2) if tau_x > 0 else ce.nan
             self._phi_y = ce.simplify(ce.S(1) / x_1) if tau_y > 0 else ce.nan
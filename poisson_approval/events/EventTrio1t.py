@@ -21,6 +21,8 @@ class EventTrio1t(Event):
         <asymptotic = exp(- inf)>
     """
 
+    __slots__ = ()
+
     def _compute(self, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
         ce = self.ce
         trio = self.tau.trio
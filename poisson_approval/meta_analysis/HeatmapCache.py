@@ -0,0 +1,144 @@
+import os
+import hashlib
+import tempfile
+import numpy as np
+from functools import partial
+from poisson_approval import __version__
+from poisson_approval.utils.UtilCanonical import canonical_form
+from poisson_approval.utils.UtilParallel import imap_parallel
+
+
+def _key(inputs):
+    return tuple(float(x) for x in inputs)
+
+
+def _stored(value):
+    """Value as it is stored in the cache, i.e. converted to floats (possibly in a nested list)."""
+    return np.asarray(value, dtype=float).tolist()
+
+
+class HeatmapCache:
+    """On-disk cache of the values of a function on the points of heat maps.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the cache files. It is created if necessary.
+    parameters
+        All the parameters that define the function: typically the :class:`SimplexToProfile` or
+        :class:`XyyToProfile`, the name of the statistic, the method used, etc. Cf. :func:`canonical_form` for the way
+        they are identified.
+
+    Notes
+    -----
+    The name of the file is a hash of the parameters and of the version of the library: a new version of the library,
+    or any change of the parameters, automatically leads to another file. The scale of the plot is not a parameter:
+    the values are stored point by point, hence a plot with another scale reuses all the points that are already
+    computed, and computes only the new ones.
+
+    The file is a ``.npz`` file with two arrays: `inputs` (one line per point, i.e. the inputs of the function, as
+    floats) and `values` (the values of the function, as floats). Hence, when a cache is used, the values are
+    converted to floats, whether they are read from the cache or just computed.
+
+    Examples
+    --------
+        >>> directory = tempfile.mkdtemp()
+        >>> def f(right, top, left):
+        ...     return [right, top, left]
+        >>> cache = HeatmapCache(directory, statistic='f')
+        >>> evaluate_on_inputs(f, [(1, 0, 0), (.5, .5, 0)], cache=cache)
+        ([[1.0, 0.0, 0.0], [0.5, 0.5, 0.0]], 2)
+
+    Another cache with the same parameters uses the same file:
+
+        >>> cache = HeatmapCache(directory, statistic='f')
+        >>> len(cache)
+        2
+        >>> evaluate_on_inputs(f, [(1, 0, 0), (0, 0, 1)], cache=cache)
+        ([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], 1)
+        >>> len(cache)
+        3
+    """
+
+    def __init__(self, directory, **parameters):
+        self.directory = directory
+        self.parameters = parameters
+        key = repr((__version__, canonical_form(parameters))).encode()
+        self.file_name = os.path.join(directory, 'heatmap_%s.npz' % hashlib.sha256(key).hexdigest()[:32])
+        self._d_key_value = dict()
+        if os.path.exists(self.file_name):
+            with np.load(self.file_name) as data:
+                for inputs, values in zip(data['inputs'], data['values']):
+                    self._d_key_value[tuple(inputs.tolist())] = values.tolist()
+
+    def __len__(self):
+        return len(self._d_key_value)
+
+    def __contains__(self, inputs):
+        return _key(inputs) in self._d_key_value
+
+    def __getitem__(self, inputs):
+        return self._d_key_value[_key(inputs)]
+
+    def update(self, pairs):
+        """Add values to the cache and save it.
+
+        Parameters
+        ----------
+        pairs : iterable
+            Each element is a pair ``(inputs, value)``. The value is converted to floats.
+        """
+        self._d_key_value.update((_key(inputs), _stored(value)) for inputs, value in pairs)
+        os.makedirs(self.directory, exist_ok=True)
+        # Write in a temporary file first, so that an interruption does not corrupt the cache.
+        fd, temp_file_name = tempfile.mkstemp(suffix='.npz', dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(f, inputs=np.array(list(self._d_key_value.keys()), dtype=float),
+                                values=np.array(list(self._d_key_value.values()), dtype=float))
+        os.replace(temp_file_name, self.file_name)
+
+
+def _apply_to_inputs(f, inputs):
+    return f(*inputs)
+
+
+def evaluate_on_inputs(f, inputs, cache=None, n_jobs=None, executor=None, chunk_size=64):
+    """Values of `f` on some inputs, possibly in parallel and with a cache.
+
+    Parameters
+    ----------
+    f : callable
+        The function.
+    inputs : iterable
+        Each element is a tuple of arguments of `f`.
+    cache : HeatmapCache, optional
+        If specified, `f` is computed only for the inputs that are not in the cache, and the new values are added to
+        the cache.
+    n_jobs, executor, chunk_size
+        Cf. :func:`imap_parallel`.
+
+    Returns
+    -------
+    values : list
+        The values of `f`, in the order of `inputs`. If `cache` is specified, they are converted to floats
+        (cf. :class:`HeatmapCache`).
+    n_evaluations : int
+        Number of evaluations of `f`, i.e. without the values read from the cache.
+
+    Examples
+    --------
+        >>> evaluate_on_inputs(max, [(1, 2), (4, 3)])
+        ([2, 4], 2)
+    """
+    inputs = list(inputs)
+    if cache is None:
+        missing = inputs
+    else:
+        missing = [x for x in dict.fromkeys(inputs) if x not in cache]
+    values = [value for _, value in imap_parallel(partial(_apply_to_inputs, f), missing, n_jobs=n_jobs,
+                                                  executor=executor, chunk_size=chunk_size)]
+    if cache is None:
+        return values, len(missing)
+    if missing:
+        cache.update(zip(missing, values))
+    return [cache[x] for x in inputs], len(missing)
@@ -0,0 +1,189 @@
+import os
+import pickle
+from collections.abc import MutableMapping
+
+
+class MonteCarloStream:
+    """An append-only file of records for :func:`monte_carlo_fictitious_play`.
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the file.
+
+    Notes
+    -----
+    The file is a sequence of pickled objects. The first one is a header, i.e. a dictionary with the settings of the
+    Monte-Carlo analysis (number of samples, voting rules, names of the statistics, master seed, parameters of the
+    fictitious play or iterated voting). Each subsequent object is a pair ``(i_sample, record)``, where `record` is a
+    dictionary. Key: voting rule. Value: a dictionary whose keys are the names of the statistics and whose values are
+    the values of these statistics for this sample.
+
+    Records are appended and flushed to the disk as soon as they are computed. If the process is interrupted, a
+    truncated record at the end of the file is ignored (and removed when the stream is resumed).
+
+    Examples
+    --------
+        >>> import tempfile
+        >>> file_name = os.path.join(tempfile.mkdtemp(), 'stream.sav')
+        >>> stream = MonteCarloStream(file_name)
+        >>> stream.start({'n_samples': 3, 'voting_rules': ['Approval'], 'statistic_names': ['n_episodes']})
+        set()
+        >>> stream.append([(0, {'Approval': {'n_episodes': 10}}), (2, {'Approval': {'n_episodes': 30}})])
+
+    After an interruption, the completed samples are known:
+
+        >>> stream = MonteCarloStream(file_name)
+        >>> stream.start({'n_samples': 3, 'voting_rules': ['Approval'], 'statistic_names': ['n_episodes']})
+        {0, 2}
+        >>> stream.append([(1, {'Approval': {'n_episodes': 20}})])
+        >>> meta_results = stream.meta_results()
+        >>> meta_results['Approval']['n_episodes']
+        [10, 20, 30]
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+
+    def _frames(self):
+        """Iterate over the objects of the file.
+
+        Yields
+        ------
+        tuple
+            The object and the position of the end of the object in the file.
+        """
+        with open(self.file_name, 'rb') as f:
+            while True:
+                try:
+                    o = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError, AttributeError, ValueError, IndexError):
+                    return
+                yield o, f.tell()
+
+    @property
+    def header(self):
+        """dict : The header of the file (None if the file does not exist or is empty)."""
+        if not os.path.exists(self.file_name):
+            return None
+        for header, _ in self._frames():
+            return header
+        return None
+
+    def start(self, header):
+        """Start or resume the stream.
+
+        Parameters
+        ----------
+        header : dict
+            The settings of the Monte-Carlo analysis. If the file already exists, they must be the same as in its
+            header.
+
+        Returns
+        -------
+        set
+            The indices of the samples that are already in the file.
+        """
+        if self.header is None:
+            with open(self.file_name, 'wb') as f:
+                pickle.dump(header, f)
+            return set()
+        frames = self._frames()
+        header_file, end = next(frames)
+        if header_file != header:
+            raise ValueError('The file %s was created with other settings: %s.' % (self.file_name, header_file))
+        completed_samples = set()
+        for (i_sample, _), end in frames:
+            completed_samples.add(i_sample)
+        # Remove a truncated record, if any.
+        with open(self.file_name, 'r+b') as f:
+            f.truncate(end)
+        return completed_samples
+
+    def append(self, records):
+        """Append records to the file.
+
+        Parameters
+        ----------
+        records : iterable
+            Each element is a pair ``(i_sample, record)``.
+        """
+        with open(self.file_name, 'ab') as f:
+            for i_sample, record in records:
+                pickle.dump((i_sample, record), f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def column(self, voting_rule, statistic_name):
+        """Values of a statistic.
+
+        Parameters
+        ----------
+        voting_rule : str
+            The voting rule.
+        statistic_name : str
+            The name of the statistic.
+
+        Returns
+        -------
+        list
+            The values of the statistic, in the order of the samples.
+        """
+        frames = self._frames()
+        next(frames)  # Skip the header.
+        d_sample_value = {i_sample: record[voting_rule][statistic_name] for (i_sample, record), _ in frames}
+        return [d_sample_value[i_sample] for i_sample in sorted(d_sample_value.keys())]
+
+    def meta_results(self):
+        """Results stored in the file.
+
+        Returns
+        -------
+        dict
+            Key: voting rule. Value: a dictionary whose keys are the names of the statistics and whose values are
+            the lists of their values, in the order of the samples (cf. :func:`monte_carlo_fictitious_play`). Each
+            list is loaded from the file only when it is accessed for the first time.
+        """
+        header = self.header
+        return {voting_rule: _LazyStatistics(self, voting_rule, header['statistic_names'])
+                for voting_rule in header['voting_rules']}
+
+
+class _LazyStatistics(MutableMapping):
+    """Dictionary of the statistics of a voting rule, loaded lazily from a :class:`MonteCarloStream`."""
+
+    def __init__(self, stream, voting_rule, statistic_names):
+        self._stream = stream
+        self._voting_rule = voting_rule
+        self._statistic_names = list(statistic_names)
+        self._d_name_value = dict()
+
+    def __getitem__(self, statistic_name):
+        if statistic_name not in self._d_name_value:
+            if statistic_name not in self._statistic_names:
+                raise KeyError(statistic_name)
+            self._d_name_value[statistic_name] = self._stream.column(self._voting_rule, statistic_name)
+        return self._d_name_value[statistic_name]
+
+    def __setitem__(self, statistic_name, value):
+        self._d_name_value[statistic_name] = value
+
+    def __delitem__(self, statistic_name):
+        if statistic_name not in self._statistic_names and statistic_name not in self._d_name_value:
+            raise KeyError(statistic_name)
+        self._d_name_value.pop(statistic_name, None)
+        if statistic_name in self._statistic_names:
+            self._statistic_names.remove(statistic_name)
+
+    def __contains__(self, statistic_name):
+        return statistic_name in self._statistic_names or statistic_name in self._d_name_value
+
+    def __iter__(self):
+        yield from self._statistic_names
+        yield from (name for name in self._d_name_value.keys() if name not in self._statistic_names)
+
+    def __len__(self):
+        return len(set(self._statistic_names) | set(self._d_name_value.keys()))
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -4,6 +4,124 @@ from matplotlib.patches import Patch
 from poisson_approval.meta_analysis.colors import *
 from poisson_approval.meta_analysis.binary_condorcet import draw_condorcet_intervals
 from poisson_approval.utils.Util import my_range
+from poisson_approval.meta_analysis.HeatmapCache import evaluate_on_inputs
+
+
+def _coarse_intervals(n, coarse_scale):
+    """Intervals of indices that cover ``range(n)``, with about `coarse_scale` intervals.
+
+    Two consecutive intervals share their common bound.
+
+    Examples
+    --------
+        >>> _coarse_intervals(10, 4)
+        [(0, 2), (2, 4), (4, 7), (7, 9)]
+        >>> _coarse_intervals(3, 8)
+        [(0, 1), (1, 2)]
+        >>> _coarse_intervals(1, 8)
+        [(0, 0)]
+    """
+    bounds = sorted({round(i * (n - 1) / coarse_scale) for i in range(coarse_scale + 1)})
+    return list(zip(bounds[:-1], bounds[1:])) or [(0, 0)]
+
+
+def _split_interval(interval):
+    start, end = interval
+    if end - start <= 1:
+        return [interval]
+    middle = (start + end) // 2
+    return [(start, middle), (middle, end)]
+
+
+def _evaluate_on_cells(f, xs, ys, reverse_right=False, adaptive=False, coarse_scale=8, n_jobs=None, executor=None,
+                       chunk_size=64, cache=None):
+    """Values of `f` on the cells of a binary plot.
+
+    Parameters
+    ----------
+    f : callable
+        Input: coordinates `x`, `y1`, `y2`.
+    xs : list
+        The values of `x` (centers of the columns of cells).
+    ys : list
+        The values of `y1` (centers of the lines of cells).
+    reverse_right : bool
+        If True, then ``y2 = 1 - y1``. Otherwise, ``y2 = y1``.
+    adaptive : bool
+        If True, use a quadtree refinement. The grid is first divided into about ``coarse_scale * coarse_scale``
+        rectangles. Then the rectangles whose corner cells have different values are split in four, recursively. When
+        the four corners of a rectangle have the same value, this value is assigned to all its cells without computing
+        `f`.
+    coarse_scale : int
+        Number of rectangles of the coarse grid in each dimension, in the adaptive mode.
+    n_jobs, executor, chunk_size
+        Cf. :func:`imap_parallel`. In the adaptive mode, the cells of each step of the refinement are computed in
+        parallel.
+    cache : HeatmapCache, optional
+        If specified, the values of `f` are read from this cache when possible, and the new values are added to it.
+
+    Returns
+    -------
+    values : list
+        List of lines: ``values[j][i]`` is the value of `f` in the cell of column `i` and line `j`.
+    n_evaluations : int
+        Number of evaluations of `f`, i.e. without the values read from the cache.
+
+    Examples
+    --------
+        >>> def f(x, y1, y2):
+        ...     return int(x > y1)
+        >>> xs = ys = [Fraction(2 * i + 1, 80) for i in range(40)]
+        >>> values, n_evaluations = _evaluate_on_cells(f, xs, ys, adaptive=True)
+        >>> values == [[f(x, y, y) for x in xs] for y in ys]
+        True
+        >>> n_evaluations
+        315
+    """
+    def evaluate(cells):
+        cells = list(dict.fromkeys(cells))
+        inputs = [(xs[i], ys[j], 1 - ys[j] if reverse_right else ys[j]) for i, j in cells]
+        values, n_evaluations_step = evaluate_on_inputs(f, inputs, cache=cache, n_jobs=n_jobs, executor=executor,
+                                                        chunk_size=chunk_size)
+        return dict(zip(cells, values)), n_evaluations_step
+
+    cells = [(i, j) for j in range(len(ys)) for i in range(len(xs))]
+    if not adaptive:
+        d_evaluated, n_evaluations = evaluate(cells)
+        return [[d_evaluated[i, j] for i in range(len(xs))] for j in range(len(ys))], n_evaluations
+    d_evaluated = dict()  # Key: a cell (i, j). Value: the value of `f`.
+    d_filled = dict()  # Same, for the cells where `f` was not computed.
+    n_evaluations = 0
+
+    def corners(rectangle):
+        (i_start, i_end), (j_start, j_end) = rectangle
+        return [(i_start, j_start), (i_end, j_start), (i_start, j_end), (i_end, j_end)]
+
+    rectangles = [(x_interval, y_interval)
+                  for x_interval in _coarse_intervals(len(xs), coarse_scale)
+                  for y_interval in _coarse_intervals(len(ys), coarse_scale)]
+    while rectangles:
+        d_evaluated_step, n_evaluations_step = evaluate(
+            corner for rectangle in rectangles for corner in corners(rectangle) if corner not in d_evaluated)
+        d_evaluated.update(d_evaluated_step)
+        n_evaluations += n_evaluations_step
+        next_rectangles = []
+        for rectangle in rectangles:
+            (i_start, i_end), (j_start, j_end) = rectangle
+            if i_end - i_start <= 1 and j_end - j_start <= 1:
+                continue  # All the cells are corners.
+            corner_values = [d_evaluated[corner] for corner in corners(rectangle)]
+            if all(np.array_equal(corner_values[0], value) for value in corner_values[1:]):
+                for i in range(i_start, i_end + 1):
+                    for j in range(j_start, j_end + 1):
+                        d_filled.setdefault((i, j), corner_values[0])
+            else:
+                next_rectangles.extend((x_interval, y_interval)
+                                       for x_interval in _split_interval(rectangle[0])
+                                       for y_interval in _split_interval(rectangle[1]))
+        rectangles = next_rectangles
+    d_filled.update(d_evaluated)
+    return [[d_filled[i, j] for i in range(len(xs))] for j in range(len(ys))], n_evaluations
 
 
 def binary_figure(xscale, yscale, size_inches='auto'):
@@ -41,6 +159,14 @@ class BinaryAxesSubplotPoisson:
         self.xscale = xscale
         self.yscale = yscale
         self.size_inches = size_inches
+        self.data_ = None  # Data of the last heat map (array yscale * xscale or yscale * xscale * 3)
+        self.n_evaluations_ = None  # Number of evaluations of the function in the last heat map
+        self.n_evaluations_saved_ = None  # Number of cells where the function was not computed in the last heat map
+
+    def _set_data(self, data, n_evaluations):
+        self.data_ = data
+        self.n_evaluations_ = n_evaluations
+        self.n_evaluations_saved_ = data.shape[0] * data.shape[1] - n_evaluations
 
     @staticmethod
     def set_title(title, **kwargs):
@@ -53,7 +179,8 @@ class BinaryAxesSubplotPoisson:
         plt.gca().set_title(title, **kwargs)
 
     def heatmap_intensity(self, func, x_left_label, x_right_label, y_left_label, y_right_label, reverse_right=False,
-                          cmap='plasma', **kwargs):
+                          cmap='plasma', adaptive=False, coarse_scale=8, n_jobs=None, executor=None, chunk_size=64,
+                          cache=None, **kwargs):
         """Intensity heatmap.
 
         Parameters
@@ -73,6 +200,25 @@ class BinaryAxesSubplotPoisson:
             increasing from 0 to 1).
         cmap : str
             Colormap. Default: ``'plasma'``.
+        adaptive : bool
+            If True, use a quadtree refinement: `func` is computed on a coarse grid, then only the rectangles whose
+            corner cells have different values are split, recursively, up to the scale of the plot. In the rectangles
+            whose corners have the same value, this value is used without computing `func`. The number of evaluations
+            of `func` and the number of evaluations saved are stored in :attr:`n_evaluations_` and
+            :attr:`n_evaluations_saved_`. This is an approximation, which is suitable when `func` is piecewise constant
+            on large regions.
+        coarse_scale : int
+            Number of rectangles of the coarse grid in each dimension, in the adaptive mode.
+        n_jobs : int, optional
+            If specified, `func` is computed in a pool of `n_jobs` processes (-1 means the number of CPUs).
+        executor : concurrent.futures.Executor, optional
+            If specified, `func` is computed by this executor (it must be picklable if the executor is a pool of
+            processes). This parameter takes precedence over `n_jobs`.
+        chunk_size : int
+            Number of cells sent at once to a worker.
+        cache : HeatmapCache, optional
+            If specified, the values of `func` are read from this on-disk cache when possible, and the new values are
+            added to it. The values read from the cache do not count in :attr:`n_evaluations_`.
         kwargs
             All other keywords arguments are passed to method ``imshow`` of `matplotlib`.
 
@@ -88,16 +234,13 @@ class BinaryAxesSubplotPoisson:
             ...                       y_right_label='y-right')
             >>> tax.set_title('An intensity heat map')
         """
-        if reverse_right:
-            m = np.array([
-                [func(x, y, 1 - y) for x in np.arange(.5 / self.xscale, 1., 1 / self.xscale)]
-                for y in np.arange(.5 / self.yscale, 1., 1 / self.yscale)
-            ])
-        else:
-            m = np.array([
-                [func(x, y, y) for x in np.arange(.5 / self.xscale, 1., 1 / self.xscale)]
-                for y in np.arange(.5 / self.yscale, 1., 1 / self.yscale)
-            ])
+        values, n_evaluations = _evaluate_on_cells(
+            func, list(np.arange(.5 / self.xscale, 1., 1 / self.xscale)),
+            list(np.arange(.5 / self.yscale, 1., 1 / self.yscale)), reverse_right=reverse_right, adaptive=adaptive,
+            coarse_scale=coarse_scale, n_jobs=n_jobs, executor=executor, chunk_size=chunk_size,
+            cache=cache)
+        m = np.array(values)
+        self._set_data(m, n_evaluations)
         plt.imshow(m, origin='lower', extent=([0, 1, 0, 1]), aspect='auto', cmap=cmap, **kwargs)
         plt.annotate(x_left_label, (0, -0.025), verticalalignment='top', horizontalalignment='left',
                      annotation_clip=False)
@@ -126,7 +269,8 @@ class BinaryAxesSubplotPoisson:
             plt.gcf().set_size_inches(5.75, 4)
 
     def heatmap_candidates(self, func, x_left_label, x_right_label, y_left_label, y_right_label, reverse_right=False,
-                           legend_title='', legend_style='palette', **kwargs):
+                           legend_title='', legend_style='palette', adaptive=False, coarse_scale=8, n_jobs=None,
+                           executor=None, chunk_size=64, cache=None, **kwargs):
         """Heatmap of a function from a 3D vector (x, y1, y2) to a 3D vector.
 
         Parameters
@@ -150,6 +294,25 @@ class BinaryAxesSubplotPoisson:
         legend_style : str
             The style of the legend. The two available options are ``'palette'`` and ``'color_patches'``.
             Cf. :meth:`legend_palette` and :meth:`legend_color_patches`.
+        adaptive : bool
+            If True, use a quadtree refinement: `func` is computed on a coarse grid, then only the rectangles whose
+            corner cells have different values are split, recursively, up to the scale of the plot. In the rectangles
+            whose corners have the same value, this value is used without computing `func`. The number of evaluations
+            of `func` and the number of evaluations saved are stored in :attr:`n_evaluations_` and
+            :attr:`n_evaluations_saved_`. This is an approximation, which is suitable when `func` is piecewise constant
+            on large regions.
+        coarse_scale : int
+            Number of rectangles of the coarse grid in each dimension, in the adaptive mode.
+        n_jobs : int, optional
+            If specified, `func` is computed in a pool of `n_jobs` processes (-1 means the number of CPUs).
+        executor : concurrent.futures.Executor, optional
+            If specified, `func` is computed by this executor (it must be picklable if the executor is a pool of
+            processes). This parameter takes precedence over `n_jobs`.
+        chunk_size : int
+            Number of cells sent at once to a worker.
+        cache : HeatmapCache, optional
+            If specified, the values of `func` are read from this on-disk cache when possible, and the new values are
+            added to it. The values read from the cache do not count in :attr:`n_evaluations_`.
         kwargs
             All other keywords arguments are passed to method ``imshow`` of `matplotlib`.
 
@@ -170,18 +333,13 @@ class BinaryAxesSubplotPoisson:
             ...                        legend_style='palette')
             >>> tax.set_title('A candidate heat map')
         """
-        if reverse_right:
-            m = np.array([
-                [abc_to_rgb(func(x, y, 1 - y))
-                 for x in my_range(Fraction(1, 2 * self.xscale), 1, Fraction(1, self.xscale))]
-                for y in my_range(Fraction(1, 2 * self.yscale), 1, Fraction(1, self.yscale))
-            ], dtype=float)
-        else:
-            m = np.array([
-                [abc_to_rgb(func(x, y, y))
-                 for x in my_range(Fraction(1, 2 * self.xscale), 1, Fraction(1, self.xscale))]
-                for y in my_range(Fraction(1, 2 * self.yscale), 1, Fraction(1, self.yscale))
-            ], dtype=float)
+        values, n_evaluations = _evaluate_on_cells(
+            func, list(my_range(Fraction(1, 2 * self.xscale), 1, Fraction(1, self.xscale))),
+            list(my_range(Fraction(1, 2 * self.yscale), 1, Fraction(1, self.yscale))), reverse_right=reverse_right,
+            adaptive=adaptive, coarse_scale=coarse_scale, n_jobs=n_jobs, executor=executor, chunk_size=chunk_size,
+            cache=cache)
+        m = np.array([[abc_to_rgb(value) for value in line] for line in values], dtype=float)
+        self._set_data(m, n_evaluations)
         plt.imshow(m, origin='lower', extent=([0, 1, 0, 1]), aspect='auto', **kwargs)
         plt.annotate(x_left_label, (0, -0.025), verticalalignment='top', horizontalalignment='left',
                      annotation_clip=False)
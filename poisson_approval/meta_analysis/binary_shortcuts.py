@@ -1,6 +1,7 @@
 from fractions import Fraction
 import numpy as np
 from poisson_approval.meta_analysis.binary_plots import binary_figure
+from poisson_approval.meta_analysis.HeatmapCache import HeatmapCache
 from poisson_approval.profiles.ProfileNoisyDiscrete import ProfileNoisyDiscrete
 from poisson_approval.utils.Util import candidates_to_probabilities, one_over_log_t_plus_one, d_candidate_value_to_array
 
@@ -84,7 +85,7 @@ class XyyToProfile:
 
 
 def binary_plot_n_equilibria(xyy_to_profile, xscale, yscale, title='Number of equilibria',
-                             meth='analyzed_strategies_ordinal', reverse_right=False, **kwargs):
+                             meth='analyzed_strategies_ordinal', reverse_right=False, cache_dir=None, **kwargs):
     """Shortcut: binary plot for the number of equilibria.
 
     Parameters
@@ -102,6 +103,10 @@ def binary_plot_n_equilibria(xyy_to_profile, xscale, yscale, title='Number of eq
     reverse_right : bool
         If True, then the y-axis on the right goes decreasing from 1 to 0 (whereas the y-axis on the left goes
         increasing from 0 to 1).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`BinaryAxesSubplotPoisson.heatmap_intensity`.
 
@@ -113,6 +118,8 @@ def binary_plot_n_equilibria(xyy_to_profile, xscale, yscale, title='Number of eq
     def n_equilibria(x, y1, y2):
         profile = xyy_to_profile(x, y1, y2)
         return len(getattr(profile, meth).equilibria)
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='n_equilibria', xyy_to_profile=xyy_to_profile, meth=meth)
     figure, ax = binary_figure(xscale=xscale, yscale=yscale)
     ax.heatmap_intensity(n_equilibria,
                          x_left_label=xyy_to_profile.x_left_label,
@@ -120,6 +127,7 @@ def binary_plot_n_equilibria(xyy_to_profile, xscale, yscale, title='Number of eq
                          y_left_label=xyy_to_profile.y_left_label,
                          y_right_label=xyy_to_profile.y_right_label,
                          reverse_right=reverse_right,
+                         cache=cache,
                          **kwargs)
     ax.annotate_condorcet(left_order=xyy_to_profile.left_order,
                           right_order=xyy_to_profile.right_order,
@@ -130,7 +138,7 @@ def binary_plot_n_equilibria(xyy_to_profile, xscale, yscale, title='Number of eq
 
 def binary_plot_winners_at_equilibrium(xyy_to_profile, xscale, yscale, title='Winners at equilibrium',
                                        legend_title='Winners', meth='analyzed_strategies_ordinal',
-                                       reverse_right=False, **kwargs):
+                                       reverse_right=False, cache_dir=None, **kwargs):
     """Shortcut: binary plot for the winners at equilibrium.
 
     Parameters
@@ -150,6 +158,10 @@ def binary_plot_winners_at_equilibrium(xyy_to_profile, xscale, yscale, title='Wi
     reverse_right : bool
         If True, then the y-axis on the right goes decreasing from 1 to 0 (whereas the y-axis on the left goes
         increasing from 0 to 1).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`BinaryAxesSubplotPoisson.heatmap_candidates`.
 
@@ -161,6 +173,8 @@ def binary_plot_winners_at_equilibrium(xyy_to_profile, xscale, yscale, title='Wi
     def winners_at_equilibrium(x, y1, y2):
         profile = xyy_to_profile(x, y1, y2)
         return candidates_to_probabilities(getattr(profile, meth).winners_at_equilibrium)
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='winners_at_equilibrium', xyy_to_profile=xyy_to_profile, meth=meth)
     figure, ax = binary_figure(xscale=xscale, yscale=yscale)
     ax.heatmap_candidates(winners_at_equilibrium,
                           x_left_label=xyy_to_profile.x_left_label,
@@ -170,6 +184,7 @@ def binary_plot_winners_at_equilibrium(xyy_to_profile, xscale, yscale, title='Wi
                           reverse_right=reverse_right,
                           legend_style='color_patches',
                           legend_title=legend_title,
+                          cache=cache,
                           **kwargs)
     ax.annotate_condorcet(left_order=xyy_to_profile.left_order,
                           right_order=xyy_to_profile.right_order,
@@ -184,7 +199,7 @@ def binary_plot_winning_frequencies(xyy_to_profile, xscale, yscale,
                                     ballot_update_ratio=one_over_log_t_plus_one,
                                     winning_frequency_update_ratio=one_over_log_t_plus_one,
                                     title='Winning frequencies', legend_title='Winners',
-                                    meth='fictitious_play', reverse_right=False, **kwargs):
+                                    meth='fictitious_play', reverse_right=False, cache_dir=None, **kwargs):
     """Shortcut: binary plot for the winning frequencies in fictitious play / iterated voting.
 
     Parameters
@@ -213,6 +228,10 @@ def binary_plot_winning_frequencies(xyy_to_profile, xscale, yscale,
     reverse_right : bool
         If True, then the y-axis on the right goes decreasing from 1 to 0 (whereas the y-axis on the left goes
         increasing from 0 to 1).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`BinaryAxesSubplotPoisson.heatmap_candidates`.
 
@@ -232,6 +251,11 @@ def binary_plot_winning_frequencies(xyy_to_profile, xscale, yscale,
             a_candidate_value = a_candidate_value + d_candidate_value_to_array(results['d_candidate_winning_frequency'])
         return a_candidate_value / samples_per_point
 
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='winning_frequencies', xyy_to_profile=xyy_to_profile, meth=meth,
+        n_max_episodes=n_max_episodes, init=init, samples_per_point=samples_per_point,
+        perception_update_ratio=perception_update_ratio, ballot_update_ratio=ballot_update_ratio,
+        winning_frequency_update_ratio=winning_frequency_update_ratio)
     figure, ax = binary_figure(xscale=xscale, yscale=yscale)
     ax.heatmap_candidates(winning_frequencies,
                           x_left_label=xyy_to_profile.x_left_label,
@@ -241,6 +265,7 @@ def binary_plot_winning_frequencies(xyy_to_profile, xscale, yscale,
                           reverse_right=reverse_right,
                           legend_style='palette',
                           legend_title=legend_title,
+                          cache=cache,
                           **kwargs)
     ax.annotate_condorcet(left_order=xyy_to_profile.left_order,
                           right_order=xyy_to_profile.right_order,
@@ -254,7 +279,7 @@ def binary_plot_convergence(xyy_to_profile, xscale, yscale,
                             perception_update_ratio=one_over_log_t_plus_one,
                             ballot_update_ratio=one_over_log_t_plus_one,
                             title='Convergence frequency',
-                            meth='fictitious_play', reverse_right=False, **kwargs):
+                            meth='fictitious_play', reverse_right=False, cache_dir=None, **kwargs):
     """Shortcut: binary plot for the convergence frequency in fictitious play / iterated voting.
 
     Convergence frequency: out of `samples_per_points` trials, in which proportion of the cases did fictitious play or
@@ -284,6 +309,10 @@ def binary_plot_convergence(xyy_to_profile, xscale, yscale,
     reverse_right : bool
         If True, then the y-axis on the right goes decreasing from 1 to 0 (whereas the y-axis on the left goes
         increasing from 0 to 1).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`BinaryAxesSubplotPoisson.heatmap_intensity`.
 
@@ -303,6 +332,10 @@ def binary_plot_convergence(xyy_to_profile, xscale, yscale,
                 n_convergences += 1
         return n_convergences / samples_per_point
 
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='convergence_frequency', xyy_to_profile=xyy_to_profile, meth=meth,
+        n_max_episodes=n_max_episodes, init=init, samples_per_point=samples_per_point,
+        perception_update_ratio=perception_update_ratio, ballot_update_ratio=ballot_update_ratio)
     figure, ax = binary_figure(xscale=xscale, yscale=yscale)
     ax.heatmap_intensity(convergence_frequency,
                          x_left_label=xyy_to_profile.x_left_label,
@@ -311,6 +344,7 @@ def binary_plot_convergence(xyy_to_profile, xscale, yscale,
                          y_right_label=xyy_to_profile.y_right_label,
                          reverse_right=reverse_right,
                          vmin=0., vmax=1.,
+                         cache=cache,
                          **kwargs)
     ax.annotate_condorcet(left_order=xyy_to_profile.left_order,
                           right_order=xyy_to_profile.right_order,
@@ -0,0 +1,244 @@
+import numpy as np
+from fractions import Fraction
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.tau_vector.TauVectorArray import TauVectorArray
+from poisson_approval.utils.Util import one_over_t, to_callable, candidates_to_probabilities, \
+    candidates_to_d_candidate_probability, array_to_d_candidate_value
+
+
+def fictitious_play_batch(profiles, init, n_max_episodes,
+                          perception_update_ratio=one_over_t,
+                          ballot_update_ratio=1,
+                          winning_frequency_update_ratio=one_over_t,
+                          other_statistics_update_ratio=one_over_t,
+                          other_statistics_tau=None,
+                          other_statistics_strategy=None):
+    """Fictitious play for several profiles at once.
+
+    Parameters
+    ----------
+    profiles : list of ProfileCardinal
+        The profiles (e.g. :class:`ProfileHistogram` or :class:`ProfileDiscrete`). They may have different voting
+        rules.
+    init, n_max_episodes, perception_update_ratio, ballot_update_ratio, winning_frequency_update_ratio, \
+other_statistics_update_ratio, other_statistics_tau, other_statistics_strategy
+        Cf. :meth:`ProfileCardinal.fictitious_play`. The same arguments are used for all the profiles.
+
+    Returns
+    -------
+    list of dict
+        The results for each profile, in the same order as `profiles`. Cf. :meth:`ProfileCardinal.fictitious_play`.
+
+    Notes
+    -----
+    The profiles are processed in lockstep: at each episode, the perceived and actual tau-vectors of all the profiles
+    that have not converged yet are updated as arrays, and their best responses are computed with
+    :attr:`TauVectorArray.utility_thresholds`. The profiles that converge are retired from the computation.
+
+    The results are the same as with :meth:`ProfileCardinal.fictitious_play`, up to floating point approximations.
+    The computation is always numeric: the profiles must not be symbolic.
+
+    Examples
+    --------
+        >>> from poisson_approval import ProfileDiscrete, PLURALITY, ANTI_PLURALITY
+        >>> d_type_share = {('abc', 0.3): 0.6, ('bac', 0.6): 0.3, ('cab', 0.5): 0.1}
+        >>> profiles = [ProfileDiscrete(d_type_share),
+        ...             ProfileDiscrete(d_type_share, voting_rule=PLURALITY),
+        ...             ProfileDiscrete(d_type_share, voting_rule=ANTI_PLURALITY)]
+        >>> all_results = fictitious_play_batch(profiles, init='sincere', n_max_episodes=100,
+        ...                                     perception_update_ratio=1)
+        >>> [results['converges'] for results in all_results]
+        [True, True, False]
+        >>> [results['n_episodes'] for results in all_results]
+        [1, 2, 100]
+        >>> print(all_results[1]['strategy'])
+        <abc: a, bac: b, cab: a> ==> a (Plurality)
+    """
+    perception_update_ratio = to_callable(perception_update_ratio)
+    ballot_update_ratio = to_callable(ballot_update_ratio)
+    winning_frequency_update_ratio = to_callable(winning_frequency_update_ratio)
+    other_statistics_update_ratio = to_callable(other_statistics_update_ratio)
+    if other_statistics_tau is None:
+        other_statistics_tau = {}
+    if other_statistics_strategy is None:
+        other_statistics_strategy = {}
+    if any(profile.ce.symbolic for profile in profiles):
+        raise ValueError('fictitious_play_batch does not accept symbolic profiles.')
+
+    n = len(profiles)
+    all_results = [None] * n
+    taus_init = [None] * n
+    strategies = [None] * n
+    taus_full_response = [None] * n
+    perceived = np.zeros((n, len(BALLOTS_WITHOUT_INVERSIONS)))
+    actual = np.zeros((n, len(BALLOTS_WITHOUT_INVERSIONS)))
+    full_response = np.zeros((n, len(BALLOTS_WITHOUT_INVERSIONS)))
+    winning_frequencies = np.zeros((n, len(CANDIDATES)), dtype=object)
+    d_name_statistic_tau_averaged = [None] * n
+    d_name_statistic_strategy_actual = [None] * n
+    d_name_statistic_strategy_averaged = [None] * n
+    active = np.ones(n, dtype=bool)
+
+    # First episode: it starts from the tau-vectors given by the initialization, so it is done profile by profile.
+    for p, profile in enumerate(profiles):
+        _, tau_init = profile._initializer(init)
+        strategy = profile.best_responses_to_strategy(tau_init)
+        tau_full_response = strategy.tau
+        taus_init[p], strategies[p], taus_full_response[p] = tau_init, strategy, tau_full_response
+        perceived[p, :] = _shares(tau_init)
+        full_response[p, :] = _shares(tau_full_response)
+        actual[p, :] = full_response[p, :]
+        winning_frequencies[p, :] = candidates_to_probabilities(tau_full_response.winners)
+        d_name_statistic_tau_averaged[p] = {
+            statistic_name: statistic_f(tau_full_response)
+            for statistic_name, statistic_f in other_statistics_tau.items()}
+        d_name_statistic_strategy_actual[p] = {
+            statistic_name: statistic_f(strategy)
+            for statistic_name, statistic_f in other_statistics_strategy.items()}
+        d_name_statistic_strategy_averaged[p] = d_name_statistic_strategy_actual[p].copy()
+    _retire_converged_profiles(np.arange(n), 1, profiles, all_results, active, perceived, actual, full_response,
+                               taus_init, strategies, taus_full_response, [None] * n,
+                               other_statistics_tau, other_statistics_strategy)
+
+    for t in range(2, n_max_episodes + 1):
+        rows = np.flatnonzero(active)
+        if len(rows) == 0:
+            break
+        perceived[rows] = _normalize(_my_round(_barycenter(perceived[rows], actual[rows],
+                                                           perception_update_ratio(t))))
+        # Best responses, computed for all the profiles that share the same voting rule.
+        for voting_rule in VOTING_RULES:
+            rows_rule = [p for p in rows if profiles[p].voting_rule == voting_rule]
+            if not rows_rule:
+                continue
+            taus_perceived = TauVectorArray(perceived[rows_rule], voting_rule=voting_rule,
+                                            normalization_warning=False)
+            for p, thresholds, scores in zip(rows_rule, taus_perceived.utility_thresholds, taus_perceived.scores):
+                profile = profiles[p]
+                strategy = profile._strategy_from_utility_thresholds(
+                    {ranking: float(threshold) for ranking, threshold in zip(RANKINGS, thresholds)
+                     if profile.d_ranking_share[ranking] > 0},
+                    scores=dict(zip(CANDIDATES, scores)),
+                    ratio_optimistic=None if profile.is_continuous else Fraction(1, 2))
+                strategies[p] = strategy
+                taus_full_response[p] = strategy.tau
+                full_response[p, :] = _shares(taus_full_response[p])
+        bur = ballot_update_ratio(t)
+        wfur = winning_frequency_update_ratio(t)
+        osur = other_statistics_update_ratio(t)
+        actual_rounded = _my_round(_barycenter(actual[rows], full_response[rows], bur))
+        actual[rows] = _normalize(actual_rounded)
+        winners = _winners(actual[rows])
+        winning_frequencies[rows] = (
+            (1 - wfur) * winning_frequencies[rows]
+            + wfur * np.array([candidates_to_probabilities(w) for w in winners], dtype=object))
+        taus_actual = [None] * n
+        for p, shares_rounded in zip(rows, actual_rounded):
+            if other_statistics_tau:
+                taus_actual[p] = _tau_actual(profiles[p], shares_rounded)
+            for statistic_name, statistic_f in other_statistics_tau.items():
+                d_name_statistic_tau_averaged[p][statistic_name] = (
+                    (1 - osur) * d_name_statistic_tau_averaged[p][statistic_name]
+                    + osur * statistic_f(taus_actual[p]))
+            for statistic_name, statistic_f in other_statistics_strategy.items():
+                d_name_statistic_strategy_actual[p][statistic_name] = (
+                    (1 - bur) * d_name_statistic_strategy_actual[p][statistic_name]
+                    + bur * statistic_f(strategies[p]))
+                d_name_statistic_strategy_averaged[p][statistic_name] = (
+                    (1 - osur) * d_name_statistic_strategy_averaged[p][statistic_name]
+                    + osur * d_name_statistic_strategy_actual[p][statistic_name])
+            if taus_actual[p] is None:
+                # Only needed if the process converges.
+                taus_actual[p] = shares_rounded
+        _retire_converged_profiles(rows, t, profiles, all_results, active, perceived, actual, full_response,
+                                   taus_init, strategies, taus_full_response, taus_actual,
+                                   other_statistics_tau, other_statistics_strategy)
+
+    for p in np.flatnonzero(active):
+        results = {'converges': False, 'tau': None, 'strategy': None,
+                   'tau_init': taus_init[p], 'n_episodes': n_max_episodes,
+                   'd_candidate_winning_frequency': array_to_d_candidate_value(winning_frequencies[p])}
+        results.update(d_name_statistic_tau_averaged[p])
+        results.update(d_name_statistic_strategy_averaged[p])
+        all_results[p] = results
+    return all_results
+
+
+def _retire_converged_profiles(rows, t, profiles, all_results, active, perceived, actual, full_response,
+                               taus_init, strategies, taus_full_response, taus_actual,
+                               other_statistics_tau, other_statistics_strategy):
+    """Store the results of the profiles that converge at episode `t` and deactivate them.
+
+    The element ``taus_actual[p]`` is a :class:`TauVector`, or the (non-normalized) shares of the actual tau-vector,
+    or None if the actual tau-vector is the full response.
+    """
+    converged = (np.all(_isclose(full_response[rows], perceived[rows]), axis=1)
+                 & np.all(_isclose(actual[rows], full_response[rows]), axis=1))
+    for p in rows[converged]:
+        tau_actual = taus_actual[p]
+        if tau_actual is None:
+            tau_actual = taus_full_response[p]
+        elif not isinstance(tau_actual, TauVector):
+            tau_actual = _tau_actual(profiles[p], tau_actual)
+        strategy = strategies[p]
+        results = {'converges': True, 'tau': taus_full_response[p], 'strategy': strategy,
+                   'tau_init': taus_init[p], 'n_episodes': t,
+                   'd_candidate_winning_frequency': candidates_to_d_candidate_probability(tau_actual.winners)}
+        results.update({
+            statistic_name: statistic_f(tau_actual)
+            for statistic_name, statistic_f in other_statistics_tau.items()
+        })
+        results.update({
+            statistic_name: statistic_f(strategy)
+            for statistic_name, statistic_f in other_statistics_strategy.items()
+        })
+        all_results[p] = results
+        active[p] = False
+
+
+def _shares(tau):
+    """Shares of a tau-vector, as an array of floats."""
+    return [float(tau.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS]
+
+
+def _tau_actual(profile, shares):
+    """Actual tau-vector, as in :meth:`ProfileCardinal.fictitious_play`."""
+    return TauVector(dict(zip(BALLOTS_WITHOUT_INVERSIONS, shares)), normalization_warning=False,
+                     voting_rule=profile.voting_rule, symbolic=profile.symbolic)
+
+
+def _isclose(x, y):
+    """Vectorized version of ``math.isclose(x, y, abs_tol=1E-9)``."""
+    return np.abs(x - y) <= np.maximum(1E-9 * np.maximum(np.abs(x), np.abs(y)), 1E-9)
+
+
+def _barycenter(a, b, ratio_b):
+    """Vectorized version of :meth:`ComputationEngineNumeric.barycenter` (with an absorbing zero)."""
+    ratio_a = 1 - ratio_b
+    return (np.where((a == 0) | (ratio_a == 0), 0., ratio_a * a)
+            + np.where((b == 0) | (ratio_b == 0), 0., ratio_b * b))
+
+
+def _my_round(x):
+    """Vectorized version of the rounding used in :meth:`ProfileCardinal.fictitious_play`."""
+    close_to_one = np.abs(x - 1) <= 1E-9 * np.maximum(np.abs(x), 1)
+    return np.where(close_to_one, 1., np.where(np.abs(x) <= 1E-9, 0., x))
+
+
+def _normalize(shares):
+    """Normalize each row if necessary, as in the constructor of :class:`TauVector`."""
+    # Same order of summation as in :class:`TauVector`.
+    totals = shares[:, 0] + shares[:, 1] + shares[:, 2] + shares[:, 3] + shares[:, 4] + shares[:, 5]
+    not_normalized = ~(np.abs(totals - 1) <= 1E-9 * np.maximum(np.abs(totals), 1))
+    shares = shares.copy()
+    shares[not_normalized] /= totals[not_normalized, np.newaxis]
+    return shares
+
+
+def _winners(shares):
+    """List of the sets of winners, for each row of shares."""
+    a, b, c, ab, ac, bc = shares.T
+    scores = np.stack([a + ab + ac, b + ab + bc, c + ac + bc], axis=1)
+    is_winner = scores == scores.max(axis=1, keepdims=True)
+    return [{candidate for candidate, w in zip(CANDIDATES, row) if w} for row in is_winner]
@@ -1,9 +1,18 @@
 import numpy as np
 import pickle
+import time
 from copy import deepcopy
 from poisson_approval.constants.basic_constants import *
+from poisson_approval.meta_analysis.MonteCarloStream import MonteCarloStream
+from poisson_approval.meta_analysis.fictitious_play_batch import fictitious_play_batch
 from poisson_approval.random_factories.RandProfileHistogramUniform import RandProfileHistogramUniform
-from poisson_approval.utils.Util import one_over_log_t_plus_one
+from poisson_approval.utils.Util import one_over_log_t_plus_one, initialize_random_seeds
+from poisson_approval.utils.UtilCanonical import canonical_form
+from poisson_approval.utils.UtilParallel import effective_n_jobs, imap_parallel
+
+
+# Minimal time (in seconds) between two appends to the file of `file_stream` in :func:`monte_carlo_fictitious_play`.
+_STREAM_APPEND_PERIOD = 1.
 
 
 def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
@@ -14,7 +23,12 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
                                 statistics_update_ratio=one_over_log_t_plus_one,
                                 monte_carlo_settings=None,
                                 file_save=None,
-                                meth='fictitious_play'):
+                                meth='fictitious_play',
+                                batch_size=None,
+                                n_jobs=None,
+                                executor=None,
+                                seed=None,
+                                file_stream=None):
     """
     Monte-Carlo analysis of fictitious play (or iterated voting).
 
@@ -42,12 +56,41 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
         Name of the file where the results will be stored (using ``pickle``).
     meth : str
         The name of the method (``'fictitious_play'`` or ``'iterated_voting'``).
+    batch_size : int, optional
+        If specified (only for fictitious play), profiles are drawn by batches of `batch_size`, and each batch is
+        processed with :func:`fictitious_play_batch`, which is much faster for a large number of samples. The results
+        are the same as without batches, unless `init` or `factory` rely on the same random generator: in that case,
+        the random draws are not made in the same order.
+    n_jobs : int, optional
+        If specified, the samples are processed in parallel by a pool of `n_jobs` processes (-1 means the number of
+        CPUs).
+    executor : concurrent.futures.Executor, optional
+        If specified, the samples are processed by this executor, e.g. a
+        :class:`~concurrent.futures.ProcessPoolExecutor`. The arguments of the function (`factory`, the statistics,
+        etc.) are sent to the workers, hence must be picklable: for example, they cannot be lambda functions. The
+        executor must use processes, not threads, because the random generators are global. This parameter takes
+        precedence over `n_jobs`.
+    seed : int, optional
+        Master seed. If specified, each sample is drawn and analyzed with its own random seed, which is derived from
+        the master seed with :class:`numpy.random.SeedSequence`. Hence the results do not depend on the parallelism
+        (`n_jobs` or `executor`). In case of parallelism or with `file_stream`, if `seed` is None, then the master
+        seed is drawn with the global random generator of `numpy` (cf. :func:`initialize_random_seeds`).
+    file_stream : str, optional
+        Name of a file where the results of the samples are appended as they are computed (cf.
+        :class:`MonteCarloStream`), by groups of samples: at most about once per second, and when the computation
+        ends or is interrupted. They are not kept in memory: the lists in the output are loaded from the file when
+        they are accessed. If the file already exists (typically after an interruption), the samples that it already
+        contains are not computed again. In that case, the other parameters (including `factory` and the statistics)
+        must be the same, otherwise a ``ValueError`` is raised. Only `seed` may be omitted: then the master seed
+        stored in the file is used, so that the results are the same as without interruption.
 
     Returns
     -------
     dict
         Key: voting rule (or ``''`` if `voting_rule` is None). Value: a dictionary whose keys are keywords for the
         computed statistics, and whose values are the corresponding outputs. Cf. :class:`MonteCarloSetting`.
+        The results of the samples are always in the order of the samples, and the statistics of
+        `statistics_final_processing` are computed at the end, once all the samples are gathered.
 
     Examples
     --------
@@ -93,26 +136,78 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
         for voting_rule in voting_rules
     }
 
-    for _ in range(n_samples):
-        base_profile = factory()
-        for voting_rule in voting_rules:
-            profile = deepcopy(base_profile) if len(voting_rules) > 1 else base_profile
-            if voting_rule != '':
-                profile.voting_rule = voting_rule
-            results = getattr(profile, meth)(init=init, n_max_episodes=n_max_episodes,
-                                             perception_update_ratio=perception_update_ratio,
-                                             ballot_update_ratio=ballot_update_ratio,
-                                             winning_frequency_update_ratio=statistics_update_ratio,
-                                             other_statistics_update_ratio=statistics_update_ratio,
-                                             other_statistics_strategy=statistics_strategy,
-                                             other_statistics_tau=statistics_tau)
-            for statistic_name, statistic_f in statistics_tau.items():
-                meta_results[voting_rule][statistic_name].append(results[statistic_name])
-            for statistic_name, statistic_f in statistics_strategy.items():
-                meta_results[voting_rule][statistic_name].append(results[statistic_name])
-            for statistic_name, statistic_f in statistics_post_processing.items():
-                meta_results[voting_rule][statistic_name].append(statistic_f(results, profile))
-
+    if batch_size is not None and meth != 'fictitious_play':
+        raise ValueError('batch_size is only available with meth=\'fictitious_play\'.')
+    task = _MonteCarloTask(factory=factory, n_max_episodes=n_max_episodes, voting_rules=voting_rules, init=init,
+                           perception_update_ratio=perception_update_ratio,
+                           ballot_update_ratio=ballot_update_ratio,
+                           statistics_update_ratio=statistics_update_ratio,
+                           statistics_tau=statistics_tau, statistics_strategy=statistics_strategy,
+                           statistics_post_processing=statistics_post_processing,
+                           meth=meth, batch_size=batch_size)
+
+    stream = None if file_stream is None else MonteCarloStream(file_stream)
+    if seed is None and stream is not None and stream.header is not None:
+        # Resume with the same seeds.
+        seed = stream.header['seed']
+    parallel = n_jobs is not None or executor is not None
+    if seed is None and (parallel or stream is not None):
+        # The master seed is needed to have the same results whatever the parallelism, and to resume the stream.
+        seed = int(np.random.randint(2 ** 32, dtype=np.int64))
+    if seed is None:
+        seeds = [None] * n_samples
+    else:
+        seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(n_samples)]
+    samples = range(n_samples)
+    if stream is not None:
+        completed_samples = stream.start({
+            'n_samples': n_samples, 'voting_rules': voting_rules, 'meth': meth, 'seed': seed,
+            'factory': canonical_form(factory), 'n_max_episodes': n_max_episodes, 'init': canonical_form(init),
+            'perception_update_ratio': canonical_form(perception_update_ratio),
+            'ballot_update_ratio': canonical_form(ballot_update_ratio),
+            'statistics_update_ratio': canonical_form(statistics_update_ratio),
+            'statistic_names': [statistic_name
+                                for d in [statistics_tau, statistics_strategy, statistics_post_processing]
+                                for statistic_name in d.keys()],
+            'statistics': canonical_form([statistics_tau, statistics_strategy, statistics_post_processing])
+        })
+        samples = [i_sample for i_sample in samples if i_sample not in completed_samples]
+    if batch_size is not None:
+        chunk_size = batch_size
+    elif n_jobs is not None:
+        chunk_size = max(1, len(samples) // (4 * effective_n_jobs(n_jobs)))
+    else:
+        chunk_size = 1
+    chunks = [samples[i:i + chunk_size] for i in range(0, len(samples), chunk_size)]
+    chunks_seeds = [[seeds[i_sample] for i_sample in chunk] for chunk in chunks]
+
+    def process(records_by_chunk):
+        # The records of the stream are buffered, so that the file is not synchronized after each sample.
+        buffer = []
+        time_last_append = time.monotonic()
+        try:
+            for chunk, records in zip(chunks, records_by_chunk):
+                if stream is not None:
+                    buffer.extend(zip(chunk, records))
+                    if time.monotonic() - time_last_append >= _STREAM_APPEND_PERIOD:
+                        stream.append(buffer)
+                        buffer = []
+                        time_last_append = time.monotonic()
+                    continue
+                for record in records:
+                    for voting_rule, d_statistic_value in record.items():
+                        for statistic_name, value in d_statistic_value.items():
+                            meta_results[voting_rule][statistic_name].append(value)
+        finally:
+            # Also in case of interruption, so that the samples already computed are kept.
+            if buffer:
+                stream.append(buffer)
+
+    records_by_chunk = imap_parallel(task.run, chunks_seeds, n_jobs=n_jobs, executor=executor, chunk_size=1)
+    process(records for _, records in records_by_chunk)
+
+    if stream is not None:
+        meta_results = stream.meta_results()
     for voting_rule in voting_rules:
         meta_results[voting_rule]['n_samples'] = n_samples
         for statistic_name, statistic_f in statistics_final_processing.items():
@@ -120,11 +215,93 @@ def monte_carlo_fictitious_play(factory, n_samples, n_max_episodes,
 
     if file_save is not None:
         with open(file_save, "wb") as f:
-            pickle.dump(meta_results, f)
+            pickle.dump({voting_rule: dict(d_statistic_value)
+                         for voting_rule, d_statistic_value in meta_results.items()}, f)
 
     return meta_results
 
 
+class _MonteCarloTask:
+    """Analysis of some samples for :func:`monte_carlo_fictitious_play`.
+
+    The parameters are the same as in :func:`monte_carlo_fictitious_play`, except that the statistics are already
+    gathered by type.
+    """
+
+    def __init__(self, factory, n_max_episodes, voting_rules, init, perception_update_ratio, ballot_update_ratio,
+                 statistics_update_ratio, statistics_tau, statistics_strategy, statistics_post_processing,
+                 meth, batch_size):
+        self.factory = factory
+        self.n_max_episodes = n_max_episodes
+        self.voting_rules = voting_rules
+        self.init = init
+        self.perception_update_ratio = perception_update_ratio
+        self.ballot_update_ratio = ballot_update_ratio
+        self.statistics_update_ratio = statistics_update_ratio
+        self.statistics_tau = statistics_tau
+        self.statistics_strategy = statistics_strategy
+        self.statistics_post_processing = statistics_post_processing
+        self.meth = meth
+        self.batch_size = batch_size
+
+    def run(self, seeds):
+        """Analyze some samples.
+
+        Parameters
+        ----------
+        seeds : list
+            One element per sample: the random seed used for this sample, or None to use the current state of the
+            random generators.
+
+        Returns
+        -------
+        list of dict
+            One element per sample. Key: voting rule. Value: a dictionary whose keys are the names of the statistics
+            and whose values are the values of these statistics for this sample.
+        """
+        kwargs = dict(init=self.init, n_max_episodes=self.n_max_episodes,
+                      perception_update_ratio=self.perception_update_ratio,
+                      ballot_update_ratio=self.ballot_update_ratio,
+                      winning_frequency_update_ratio=self.statistics_update_ratio,
+                      other_statistics_update_ratio=self.statistics_update_ratio,
+                      other_statistics_strategy=self.statistics_strategy,
+                      other_statistics_tau=self.statistics_tau)
+        records = [dict() for _ in seeds]
+        if self.batch_size is None:
+            for record, seed in zip(records, seeds):
+                base_profile = self._draw(seed)
+                for voting_rule in self.voting_rules:
+                    profile = self._profile_with_voting_rule(base_profile, voting_rule)
+                    results = getattr(profile, self.meth)(**kwargs)
+                    record[voting_rule] = self._record(results, profile)
+        else:
+            base_profiles = [self._draw(seed) for seed in seeds]
+            for voting_rule in self.voting_rules:
+                profiles = [self._profile_with_voting_rule(base_profile, voting_rule)
+                            for base_profile in base_profiles]
+                for record, results, profile in zip(records, fictitious_play_batch(profiles, **kwargs), profiles):
+                    record[voting_rule] = self._record(results, profile)
+        return records
+
+    def _draw(self, seed):
+        if seed is not None:
+            initialize_random_seeds(seed)
+        return self.factory()
+
+    def _profile_with_voting_rule(self, base_profile, voting_rule):
+        profile = deepcopy(base_profile) if len(self.voting_rules) > 1 else base_profile
+        if voting_rule != '':
+            profile.voting_rule = voting_rule
+        return profile
+
+    def _record(self, results, profile):
+        record = {statistic_name: results[statistic_name] for statistic_name in self.statistics_tau.keys()}
+        record.update({statistic_name: results[statistic_name] for statistic_name in self.statistics_strategy.keys()})
+        record.update({statistic_name: statistic_f(results, profile)
+                       for statistic_name, statistic_f in self.statistics_post_processing.items()})
+        return record
+
+
 class MonteCarloSetting:
     """
     A setting for :func:`monte_carlo_fictitious_play`.
@@ -165,20 +342,52 @@ class MonteCarloSetting:
         self.statistics_final_processing = {} if statistics_final_processing is None else statistics_final_processing
 
 
+# The statistics of the predefined settings are module-level functions (and not lambda functions), so that they can
+# be pickled, e.g. to be sent to the workers of a process pool.
+
+
+class _MeanStatistic:
+    """Final processing: average of a statistic over all profiles."""
+
+    def __init__(self, statistic_name):
+        self.statistic_name = statistic_name
+
+    def __call__(self, meta_results):
+        return np.mean(meta_results[self.statistic_name])
+
+
+def _share_single_votes(strategy):
+    return strategy.share_single_votes
+
+
+def _share_sincere_votes(strategy):
+    return strategy.share_sincere
+
+
+# noinspection PyUnusedLocal
+def _share_double_votes(results, profile):
+    return 1 - results['share_single_votes']
+
+
+# noinspection PyUnusedLocal
+def _share_insincere_votes(results, profile):
+    return 1 - results['share_sincere_votes']
+
+
 MCS_BALLOT_STATISTICS = MonteCarloSetting(
     statistics_strategy={
-        'share_single_votes': (lambda strategy: strategy.share_single_votes),
-        'share_sincere_votes': (lambda strategy: strategy.share_sincere)
+        'share_single_votes': _share_single_votes,
+        'share_sincere_votes': _share_sincere_votes
     },
     statistics_post_processing={
-        'share_double_votes': (lambda results, profile: 1 - results['share_single_votes']),
-        'share_insincere_votes': (lambda results, profile: 1 - results['share_sincere_votes'])
+        'share_double_votes': _share_double_votes,
+        'share_insincere_votes': _share_insincere_votes
     },
     statistics_final_processing={
-        'mean_share_single_votes': (lambda meta_results: np.mean(meta_results['share_single_votes'])),
-        'mean_share_double_votes': (lambda meta_results: np.mean(meta_results['share_double_votes'])),
-        'mean_share_sincere_votes': (lambda meta_results: np.mean(meta_results['share_sincere_votes'])),
-        'mean_share_insincere_votes': (lambda meta_results: np.mean(meta_results['share_insincere_votes']))
+        'mean_share_single_votes': _MeanStatistic('share_single_votes'),
+        'mean_share_double_votes': _MeanStatistic('share_double_votes'),
+        'mean_share_sincere_votes': _MeanStatistic('share_sincere_votes'),
+        'mean_share_insincere_votes': _MeanStatistic('share_insincere_votes')
     }
 )
 """
@@ -197,14 +406,21 @@ Keywords ``'mean_share_single_votes'``, ``'mean_share_double_votes'``, ``'mean_s
 """
 
 
+# noinspection PyUnusedLocal
+def _d_candidate_winning_frequency(results, profile):
+    return results['d_candidate_winning_frequency']
+
+
+def _d_candidate_mean_winning_frequency(meta_results):
+    return {c: np.mean([d[c] for d in meta_results['d_candidate_winning_frequency']])
+            for c in CANDIDATES}
+
+
 MCS_CANDIDATE_WINNING_FREQUENCY = MonteCarloSetting(
     statistics_post_processing={
-        'd_candidate_winning_frequency': (lambda results, profile: results['d_candidate_winning_frequency'])},
+        'd_candidate_winning_frequency': _d_candidate_winning_frequency},
     statistics_final_processing={
-        'd_candidate_mean_winning_frequency': (
-            lambda meta_results: {c: np.mean([d[c] for d in meta_results['d_candidate_winning_frequency']])
-                                  for c in CANDIDATES}
-        )
+        'd_candidate_mean_winning_frequency': _d_candidate_mean_winning_frequency
     }
 )
 """
@@ -216,12 +432,17 @@ Keyword ``'d_candidate_mean_winning_frequency'``: average winning frequency for
 """
 
 
+# noinspection PyUnusedLocal
+def _converges(results, profile):
+    return results['converges']
+
+
 MCS_CONVERGES = MonteCarloSetting(
     statistics_post_processing={
-        'converges': (lambda results, profile: results['converges'])
+        'converges': _converges
     },
     statistics_final_processing={
-        'mean_converges': (lambda meta_results: np.mean(meta_results['converges']))
+        'mean_converges': _MeanStatistic('converges')
     }
 )
 """
@@ -233,14 +454,33 @@ Keyword ``'mean_converges'``: rate of convergence (over all profiles).
 """
 
 
+def _decreasing_scores(tau):
+    return np.array(sorted(tau.scores.values(), reverse=True))
+
+
+# noinspection PyUnusedLocal
+def _score_winner(results, profile):
+    return results['decreasing_scores'][0]
+
+
+# noinspection PyUnusedLocal
+def _score_second(results, profile):
+    return results['decreasing_scores'][1]
+
+
+# noinspection PyUnusedLocal
+def _score_loser(results, profile):
+    return results['decreasing_scores'][2]
+
+
 MCS_DECREASING_SCORES = MonteCarloSetting(
     statistics_tau={
-        'decreasing_scores': (lambda tau: np.array(sorted(tau.scores.values(), reverse=True)))
+        'decreasing_scores': _decreasing_scores
     },
     statistics_post_processing={
-        'score_winner': (lambda results, profile: results['decreasing_scores'][0]),
-        'score_second': (lambda results, profile: results['decreasing_scores'][1]),
-        'score_loser': (lambda results, profile: results['decreasing_scores'][2])
+        'score_winner': _score_winner,
+        'score_second': _score_second,
+        'score_loser': _score_loser
     }
 )
 """
@@ -264,7 +504,7 @@ def _frequency_cw_wins(results, profile):
 MCS_FREQUENCY_CW_WINS = MonteCarloSetting(
     statistics_post_processing={'frequency_cw_wins': _frequency_cw_wins},
     statistics_final_processing={
-        'mean_frequency_cw_wins': (lambda meta_results: np.mean(meta_results['frequency_cw_wins']))
+        'mean_frequency_cw_wins': _MeanStatistic('frequency_cw_wins')
     }
 )
 """
@@ -276,8 +516,13 @@ Keyword ``'mean_frequency_cw_wins'``: average winning frequency of the Condorcet
 """
 
 
+# noinspection PyUnusedLocal
+def _n_episodes(results, profile):
+    return results['n_episodes']
+
+
 MCS_N_EPISODES = MonteCarloSetting(
-    statistics_post_processing={'n_episodes': (lambda results, profile: results['n_episodes'])}
+    statistics_post_processing={'n_episodes': _n_episodes}
 )
 """
 MonteCarloSetting: Number of episodes.
@@ -286,8 +531,13 @@ Keyword ``'n_episodes'``: the number of episodes (for each profile).
 """
 
 
+# noinspection PyUnusedLocal
+def _profile(results, profile):
+    return profile
+
+
 MCS_PROFILE = MonteCarloSetting(
-    statistics_post_processing={'profile': (lambda results, profile: profile)}
+    statistics_post_processing={'profile': _profile}
 )
 """
 MonteCarloSetting: Profile.
@@ -296,8 +546,13 @@ Keyword ``'profile'``: the profile (for each profile).
 """
 
 
+# noinspection PyUnusedLocal
+def _tau_init(results, profile):
+    return results['tau_init']
+
+
 MCS_TAU_INIT = MonteCarloSetting(
-    statistics_post_processing={'tau_init': (lambda results, profile: results['tau_init'])}
+    statistics_post_processing={'tau_init': _tau_init}
 )
 """
 MonteCarloSetting: Tau-vector used at initialization.
@@ -306,26 +561,44 @@ Keyword ``'tau_init'``: the tau-vector used at initialization (for each profile)
 """
 
 
+def _utility_thresholds(strategy):
+    return np.array([strategy.d_ranking_threshold[ranking] for ranking in RANKINGS])
+
+
+# noinspection PyUnusedLocal
+def _weights_rankings(results, profile):
+    return [profile.d_ranking_share[ranking] for ranking in RANKINGS]
+
+
+def _p_utility_threshold_0(meta_results):
+    return float(np.tensordot(
+        np.array(meta_results['utility_thresholds']) == 0,
+        np.array(meta_results['weights_rankings']) / meta_results['n_samples']
+    ))
+
+
+def _p_utility_threshold_1(meta_results):
+    return float(np.tensordot(
+        np.array(meta_results['utility_thresholds']) == 1,
+        np.array(meta_results['weights_rankings']) / meta_results['n_samples']
+    ))
+
+
+def _p_utility_threshold_not_0_or_1(meta_results):
+    return 1 - meta_results['p_utility_threshold_0'] - meta_results['p_utility_threshold_1']
+
+
 MCS_UTILITY_THRESHOLDS = MonteCarloSetting(
     statistics_strategy={
-        'utility_thresholds': (lambda strategy: np.array([strategy.d_ranking_threshold[ranking]
-                                                           for ranking in RANKINGS]))
+        'utility_thresholds': _utility_thresholds
     },
     statistics_post_processing={
-        'weights_rankings': (lambda results, profile: [profile.d_ranking_share[ranking] for ranking in RANKINGS])
+        'weights_rankings': _weights_rankings
     },
     statistics_final_processing={
-        'p_utility_threshold_0': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['utility_thresholds']) == 0,
-            np.array(meta_results['weights_rankings']) / meta_results['n_samples']
-        ))),
-        'p_utility_threshold_1': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['utility_thresholds']) == 1,
-            np.array(meta_results['weights_rankings']) / meta_results['n_samples']
-        ))),
-        'p_utility_threshold_not_0_or_1': (
-            lambda meta_results: 1 - meta_results['p_utility_threshold_0'] - meta_results['p_utility_threshold_1']
-        ),
+        'p_utility_threshold_0': _p_utility_threshold_0,
+        'p_utility_threshold_1': _p_utility_threshold_1,
+        'p_utility_threshold_not_0_or_1': _p_utility_threshold_not_0_or_1,
     }
 )
 """
@@ -381,6 +654,19 @@ def _candidate_winning_frequencies(results, profile):
     ]
 
 
+class _MeanWelfareLoss:
+    """Final processing: average welfare loss over all profiles, weighted by the winning frequencies."""
+
+    def __init__(self, statistic_name):
+        self.statistic_name = statistic_name
+
+    def __call__(self, meta_results):
+        return float(np.tensordot(
+            np.array(meta_results['candidate_winning_frequencies']),
+            np.array(meta_results[self.statistic_name]) / meta_results['n_samples']
+        ))
+
+
 MCS_WELFARE_LOSSES = MonteCarloSetting(
     statistics_post_processing={
         'candidate_winning_frequencies': _candidate_winning_frequencies,
@@ -389,18 +675,9 @@ MCS_WELFARE_LOSSES = MonteCarloSetting(
         'anti_plurality_welfare_losses': _anti_plurality_welfare_losses,
     },
     statistics_final_processing={
-        'mean_utilitarian_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['utilitarian_welfare_losses']) / meta_results['n_samples']
-        ))),
-        'mean_plurality_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['plurality_welfare_losses']) / meta_results['n_samples']
-        ))),
-        'mean_anti_plurality_welfare_loss': (lambda meta_results: float(np.tensordot(
-            np.array(meta_results['candidate_winning_frequencies']),
-            np.array(meta_results['anti_plurality_welfare_losses']) / meta_results['n_samples']
-        ))),
+        'mean_utilitarian_welfare_loss': _MeanWelfareLoss('utilitarian_welfare_losses'),
+        'mean_plurality_welfare_loss': _MeanWelfareLoss('plurality_welfare_losses'),
+        'mean_anti_plurality_welfare_loss': _MeanWelfareLoss('anti_plurality_welfare_losses'),
     }
 )
 """
@@ -1,20 +1,266 @@
 import pickle
 import ternary
+import numpy as np
 from math import floor, ceil
 from fractions import Fraction
 from collections import Counter, namedtuple
-from scipy.spatial import distance
-from ternary.helpers import simplex_iterator
+from ternary.helpers import normalize, simplex_iterator
 from matplotlib import pyplot as plt
 from matplotlib.patches import Patch
 from poisson_approval.meta_analysis.ternary_condorcet import draw_condorcet_zones
 from poisson_approval.meta_analysis.colors import *
+from poisson_approval.meta_analysis.HeatmapCache import evaluate_on_inputs
 
 
 Point = namedtuple('Point', ['right', 'top', 'left'])
 
 
-def _generate_heatmap_data(f, scale):
+def _evaluate_on_points(f, points, n_jobs=None, executor=None, chunk_size=64, cache=None):
+    """Values of `f` on points of the simplex, possibly in parallel (cf. :func:`evaluate_on_inputs`).
+
+    Parameters
+    ----------
+    f : callable
+        Input: coordinates `right`, `top`, `left` in the simplex.
+    points : iterable
+        The points, as tuples `(right, top, left)`.
+    n_jobs, executor, chunk_size, cache
+        Cf. :func:`evaluate_on_inputs`.
+
+    Returns
+    -------
+    values : list
+        The values of `f`, in the order of `points`.
+    n_evaluations : int
+        Number of evaluations of `f`.
+    """
+    return evaluate_on_inputs(f, points, cache=cache, n_jobs=n_jobs, executor=executor, chunk_size=chunk_size)
+
+
+def _fraction_point(scaled_point, scale):
+    return Point(*(Fraction(coordinate, scale) for coordinate in scaled_point))
+
+
+def _float_point(scaled_point, scale):
+    # Same as ``heatmapf`` in `python-ternary`.
+    return tuple(normalize(scaled_point))
+
+
+def _grid_values(d_scaled_point_values, scale):
+    """Dense array of the values of a candidate heat map.
+
+    Parameters
+    ----------
+    d_scaled_point_values : dict
+        Key: a point `(i, j, k)` of the integer simplex defined by `scale`. Value: a list of 3 numbers.
+    scale : int
+        The scale of the grid.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size ``(scale + 1) * (scale + 1) * 3``. The values of the point `(i, j, k)` are in line `i`, column
+        `j`. The cells such that ``i + j > scale`` are not in the simplex and are filled with NaN.
+
+    Examples
+    --------
+        >>> a_grid_values = _grid_values({(0, 0, 1): [0, 0, 1], (0, 1, 0): [0, 1, 0], (1, 0, 0): [1, 0, 0]}, scale=1)
+        >>> a_grid_values[:, :, 0]
+        array([[ 0.,  0.],
+               [ 1., nan]])
+    """
+    a_grid_values = np.full((scale + 1, scale + 1, 3), np.nan)
+    scaled_points = np.array(list(d_scaled_point_values.keys()), dtype=int)
+    a_grid_values[scaled_points[:, 0], scaled_points[:, 1]] = np.array(list(d_scaled_point_values.values()),
+                                                                       dtype=float)
+    return a_grid_values
+
+
+def _nearest_grid_point(right, top, left, scale):
+    """Closest point of the integer simplex (same as :func:`_nearest_grid_points`, for a single point).
+
+    Examples
+    --------
+        >>> _nearest_grid_point(right=.52, top=.27, left=.21, scale=5)
+        (3, 1)
+    """
+    point = (float(right), float(top), float(left))
+    bounds = [(floor(x * scale), ceil(x * scale)) for x in point]
+    candidates = [(ri, to, le) for ri in bounds[0] for to in bounds[1] for le in bounds[2] if ri + to + le == scale]
+    if not candidates:
+        raise ValueError('The coordinates of each point must sum to 1.')
+    ri, to, le = min(candidates, key=lambda candidate: sum((x - coordinate / scale) ** 2
+                                                           for x, coordinate in zip(point, candidate)))
+    return ri, to
+
+
+def _nearest_grid_points(right, top, left, scale):
+    """Closest points of the integer simplex.
+
+    Parameters
+    ----------
+    right, top, left : Number or array_like
+        Coordinates of points in the simplex.
+    scale : int
+        The scale of the grid.
+
+    Returns
+    -------
+    i, j : numpy.ndarray
+        Coordinates `right` and `top` of the closest points of the grid, multiplied by `scale`. The candidates are the
+        points of the grid obtained by rounding each coordinate down or up.
+
+    Examples
+    --------
+        >>> _nearest_grid_points(right=[.52, .96], top=[.27, .02], left=[.21, .02], scale=5)
+        (array([3, 5]), array([1, 0]))
+    """
+    points = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (right, top, left)))
+    bounds = [(np.floor(x * scale).astype(int), np.ceil(x * scale).astype(int)) for x in points]
+    candidates = [(ri, to, le) for ri in bounds[0] for to in bounds[1] for le in bounds[2]]
+    distances = np.array([
+        np.where(ri + to + le == scale,
+                 sum((x - coordinate / scale) ** 2 for x, coordinate in zip(points, (ri, to, le))),
+                 np.inf)
+        for ri, to, le in candidates
+    ])
+    if np.any(np.isinf(distances.min(axis=0))):
+        raise ValueError('The coordinates of each point must sum to 1.')
+    best = distances.argmin(axis=0)
+    a_right = np.choose(best, [ri for ri, _, _ in candidates])
+    a_top = np.choose(best, [to for _, to, _ in candidates])
+    return a_right, a_top
+
+
+def _triangle_points(triangle):
+    """Points of a triangle of the integer grid.
+
+    A triangle is a tuple ``(sign, right, top, side)``. Its points are the ``(right + sign * x, top + sign * y)``,
+    where `x` and `y` are nonnegative integers such that ``x + y <= side``. The sign is 1 for an upward triangle and
+    -1 for a downward triangle.
+    """
+    sign, right, top, side = triangle
+    return [(right + sign * x, top + sign * y) for x in range(side + 1) for y in range(side + 1 - x)]
+
+
+def _triangle_corners(triangle):
+    sign, right, top, side = triangle
+    return [(right, top), (right + sign * side, top), (right, top + sign * side)]
+
+
+def _subdivide(triangle):
+    """Sub-triangles that cover a triangle (cf. :func:`_triangle_points`).
+
+    Three of them have the same orientation as `triangle` and half its side (rounded up), one in each corner. The
+    last one has the opposite orientation and is in the middle. This works for any side, even or odd.
+
+    Examples
+    --------
+        >>> _subdivide((1, 0, 0, 4))
+        [(1, 0, 0, 2), (1, 2, 0, 2), (1, 0, 2, 2), (-1, 2, 2, 2)]
+        >>> _subdivide((1, 0, 0, 5))
+        [(1, 0, 0, 3), (1, 2, 0, 3), (1, 0, 2, 3), (-1, 2, 2, 1)]
+    """
+    sign, right, top, side = triangle
+    side_corner = (side + 1) // 2
+    shift = side - side_corner
+    children = [(sign, right, top, side_corner), (sign, right + sign * shift, top, side_corner),
+                (sign, right, top + sign * shift, side_corner)]
+    side_middle = 2 * shift - side_corner
+    if side_middle > 0:
+        children.append((- sign, right + sign * shift, top + sign * shift, side_middle))
+    return children
+
+
+def _evaluate_on_grid(f, scale, to_point, boundary=True, adaptive=False, coarse_scale=8, n_jobs=None,
+                      executor=None, chunk_size=64, cache=None):
+    """Values of `f` on the integer simplex grid defined by `scale`.
+
+    Parameters
+    ----------
+    f : callable
+        Input: coordinates `right`, `top`, `left` in the simplex.
+    scale : int
+        The scale of the grid.
+    to_point : callable
+        Inputs: a point of the integer grid and `scale`. Output: the corresponding input of `f`.
+    boundary : bool
+        Whether the points of the boundary are included.
+    adaptive : bool
+        If True, use an adaptive mesh refinement. The grid is first divided into triangles of side about
+        ``scale / coarse_scale``. Then the triangles whose corners have different values are subdivided recursively
+        (cf. :func:`_subdivide`). When the three corners of a triangle have the same value, this value is assigned to
+        all the points of the triangle without computing `f`.
+    coarse_scale : int
+        Scale of the coarse grid in the adaptive mode.
+    n_jobs, executor, chunk_size
+        Cf. :func:`imap_parallel`. In the adaptive mode, the points of each step of the refinement are computed in
+        parallel.
+    cache : HeatmapCache, optional
+        If specified, the values of `f` are read from this cache when possible, and the new values are added to it.
+
+    Returns
+    -------
+    d_scaled_point_values : dict
+        Key: a point of the integer grid. Value: the value of `f`.
+    n_evaluations : int
+        Number of evaluations of `f`, i.e. without the values read from the cache.
+
+    Examples
+    --------
+        >>> def f(right, top, left):
+        ...     return 1 if right > Fraction(1, 2) else 0
+        >>> d_scaled_point_values, n_evaluations = _evaluate_on_grid(f, 40, _fraction_point, adaptive=True)
+        >>> all(value == f(*_fraction_point(scaled_point, 40))
+        ...     for scaled_point, value in d_scaled_point_values.items())
+        True
+        >>> len(d_scaled_point_values), n_evaluations
+        (861, 123)
+    """
+    scaled_points = list(simplex_iterator(scale, boundary))
+    if not adaptive:
+        values, n_evaluations = _evaluate_on_points(
+            f, [to_point(scaled_point, scale) for scaled_point in scaled_points],
+            n_jobs=n_jobs, executor=executor, chunk_size=chunk_size, cache=cache)
+        return dict(zip(scaled_points, values)), n_evaluations
+    if not boundary:
+        raise ValueError('The adaptive mode needs the boundary of the simplex.')
+    d_evaluated = dict()  # Key: a point (right, top). Value: the value of `f`.
+    d_filled = dict()  # Same, for the points where `f` was not computed.
+    n_evaluations = 0
+
+    def evaluate(points):
+        points = [point for point in dict.fromkeys(points) if point not in d_evaluated]
+        values, n_evaluations_step = _evaluate_on_points(
+            f, [to_point((right, top, scale - right - top), scale) for right, top in points],
+            n_jobs=n_jobs, executor=executor, chunk_size=chunk_size, cache=cache)
+        d_evaluated.update(zip(points, values))
+        return n_evaluations_step
+
+    coarse_side = max(scale // coarse_scale, 1)
+    triangles = [(1, 0, 0, scale)]
+    while any(triangle[3] > coarse_side for triangle in triangles):
+        triangles = [child for triangle in triangles
+                     for child in (_subdivide(triangle) if triangle[3] > coarse_side else [triangle])]
+    while triangles:
+        n_evaluations += evaluate(corner for triangle in triangles for corner in _triangle_corners(triangle))
+        next_triangles = []
+        for triangle in triangles:
+            corner_values = [d_evaluated[corner] for corner in _triangle_corners(triangle)]
+            if triangle[3] <= 1:
+                continue  # All the points are corners.
+            if all(np.array_equal(corner_values[0], value) for value in corner_values[1:]):
+                for point in _triangle_points(triangle):
+                    d_filled.setdefault(point, corner_values[0])
+            else:
+                next_triangles.extend(_subdivide(triangle))
+        triangles = next_triangles
+    d_filled.update(d_evaluated)
+    return {scaled_point: d_filled[scaled_point[:2]] for scaled_point in scaled_points}, n_evaluations
+
+
+def _generate_heatmap_data(f, scale, adaptive=False, coarse_scale=8, n_jobs=None, executor=None, chunk_size=64,
+                           cache=None):
     """Generate RGBA data for a ``simplex to 3D'' heatmap plot.
 
     Parameters
@@ -24,6 +270,8 @@ def _generate_heatmap_data(f, scale):
         list of 3 numbers between 0 and 1.
     scale
         The scale of the ternary plot.
+    adaptive, coarse_scale, n_jobs, executor, chunk_size, cache
+        Cf. :func:`_evaluate_on_grid`. By default, the computation is serial and `f` is computed at each point.
 
     Returns
     -------
@@ -32,28 +280,30 @@ def _generate_heatmap_data(f, scale):
         output of `f`.
     d_point_values : dict
         Key: a point of the simplex, with coordinates in (0, 1). Value: the values of function f(right, top, left).
+    n_evaluations : int
+        Number of evaluations of `f`, i.e. without the values read from the cache.
 
     Examples
     --------
         >>> def f(right, top, left):
         ...     return [right, 0, 0]
-        >>> d_scaled_point_color, d_point_values = _generate_heatmap_data(f, scale=2)
+        >>> d_scaled_point_color, d_point_values, n_evaluations = _generate_heatmap_data(f, scale=2)
         >>> d_scaled_point_color
         {(0, 0, 2): (0.5, 0.5, 0.5, 1.0), (0, 1, 1): (0.5, 0.5, 0.5, 1.0), (0, 2, 0): (0.5, 0.5, 0.5, 1.0), \
 (1, 0, 1): (0.75, 0.5, 0.5, 1.0), (1, 1, 0): (0.75, 0.5, 0.5, 1.0), (2, 0, 0): (1.0, 0.5, 0.5, 1.0)}
         >>> d_point_values  # doctest: +ELLIPSIS
         {Point(right=Fraction(0, 1), top=Fraction(0, 1), left=Fraction(1, 1)): [Fraction(0, 1), 0, 0], ...
     """
+    d_scaled_point_values, n_evaluations = _evaluate_on_grid(
+        f, scale, _fraction_point, adaptive=adaptive, coarse_scale=coarse_scale, n_jobs=n_jobs, executor=executor,
+        chunk_size=chunk_size, cache=cache)
     d_point_values = dict()
     d_scaled_point_color = dict()
-    for (right, top, left) in simplex_iterator(scale):
-        scaled_point = (right, top, left)
-        point = Point(Fraction(right, scale), Fraction(top, scale), Fraction(left, scale))
-        values = f(*point)
-        d_point_values[point] = values
+    for scaled_point, values in d_scaled_point_values.items():
+        d_point_values[_fraction_point(scaled_point, scale)] = values
         color = abc_to_rgb(values)
         d_scaled_point_color[scaled_point] = (float(color[0]), float(color[1]), float(color[2]), 1.)
-    return d_scaled_point_color, d_point_values
+    return d_scaled_point_color, d_point_values, n_evaluations
 
 
 def ternary_figure(size_inches='auto', scale=None, boundary_width=1.0, **kwargs):
@@ -116,6 +366,10 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
     def __init__(self, scale=None, size_inches='auto', **kwargs):
         self.size_inches = size_inches
         self.d_point_values_ = None  # Used for candidate maps
+        self._a_grid_values = None  # Cf. `a_grid_values_`
+        self._a_grid_values_source = None  # The `d_point_values_` from which `_a_grid_values` was computed
+        self.n_evaluations_ = None  # Number of evaluations of the function in the last heat map
+        self.n_evaluations_saved_ = None  # Number of points where the function was not computed in the last heat map
         super().__init__(scale=scale, **kwargs)
 
     def _scaled_number(self, x):
@@ -233,7 +487,8 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
         self.right_parallel_line(self._scaled_number(i), color=color, **kwargs)
 
     def heatmap_intensity(self, func, right_label, top_label, left_label,
-                          style='hexagonal', cmap='plasma', **kwargs):
+                          style='hexagonal', cmap='plasma', adaptive=False, coarse_scale=8, n_jobs=None, executor=None,
+                          chunk_size=64, cache=None, **kwargs):
         """Adaptation of ``heatmapf``.
 
         Parameters
@@ -251,6 +506,25 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
             Contrarily to default settings in `python-ternary`, the default is ``'hexagonal'``.
         cmap : str
             Colormap. Contrarily to default settings in `python-ternary`, the default is ``'plasma'``.
+        adaptive : bool
+            If True, use an adaptive mesh refinement: `func` is computed on a coarse grid, then only the triangles
+            whose corners have different values are subdivided, recursively, up to the scale of the plot. In the
+            triangles whose corners have the same value, this value is used without computing `func`. The number of
+            evaluations of `func` and the number of evaluations saved are stored in :attr:`n_evaluations_` and
+            :attr:`n_evaluations_saved_`. This is an approximation, which is suitable when `func` is piecewise constant
+            on large regions.
+        coarse_scale : int
+            Scale of the coarse grid in the adaptive mode.
+        n_jobs : int, optional
+            If specified, `func` is computed in a pool of `n_jobs` processes (-1 means the number of CPUs).
+        executor : concurrent.futures.Executor, optional
+            If specified, `func` is computed by this executor (it must be picklable if the executor is a pool of
+            processes). This parameter takes precedence over `n_jobs`.
+        chunk_size : int
+            Number of points sent at once to a worker.
+        cache : HeatmapCache, optional
+            If specified, the values of `func` are read from this on-disk cache when possible, and the new values are
+            added to it. The values read from the cache do not count in :attr:`n_evaluations_`.
         kwargs
             All other keywords arguments are passed to method ``heatmapf`` of `python-ternary`.
 
@@ -264,13 +538,25 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
             ...                       right_label='right',
             ...                       top_label='top')
             >>> tax.set_title_padded('An intensity heat map')
+
+        The computation can be made in parallel:
+
+            >>> figure, tax = ternary_figure(scale=10)
+            >>> tax.heatmap_intensity(f, left_label='left', right_label='right', top_label='top', n_jobs=2)
         """
         default_pad = 0.15
         if 'cb_kwargs' not in kwargs.keys():
             kwargs['cb_kwargs'] = {'pad': default_pad}
         elif 'pad' not in kwargs['cb_kwargs'].keys():
             kwargs['cb_kwargs']['pad'] = default_pad
-        self.heatmapf(lambda p: func(*p), style=style, cmap=cmap, **kwargs)
+        # Same as ``heatmapf`` of `python-ternary`, but the computation of `func` can be parallel.
+        scale = kwargs.pop('scale', None) or self.get_scale()
+        d_scaled_point_value, self.n_evaluations_ = _evaluate_on_grid(
+            func, scale, _float_point, boundary=kwargs.pop('boundary', True), adaptive=adaptive,
+            coarse_scale=coarse_scale, n_jobs=n_jobs, executor=executor, chunk_size=chunk_size, cache=cache)
+        self.n_evaluations_saved_ = len(d_scaled_point_value) - self.n_evaluations_
+        data = {(i, j): value for (i, j, k), value in d_scaled_point_value.items()}
+        self.heatmap(data, scale=scale, style=style, cmap=cmap, **kwargs)
         self.right_corner_label(right_label)
         self.top_corner_label(top_label)
         self.left_corner_label(left_label)
@@ -278,7 +564,8 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
             plt.gcf().set_size_inches(7, 5)
 
     def heatmap_candidates(self, func, right_label, top_label, left_label, legend_title='',
-                           legend_style='palette', style='hexagonal', colorbar=False, file_save_data = None,
+                           legend_style='palette', style='hexagonal', colorbar=False, file_save_data=None,
+                           adaptive=False, coarse_scale=8, n_jobs=None, executor=None, chunk_size=64, cache=None,
                            **kwargs):
         """Heatmap of a function from the simplex to 3D vectors.
 
@@ -304,6 +591,25 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
             Contrarily to default settings in `python-ternary`, the default is False.
         file_save_data : str
             File where the computed data will be saved (using ``pickle``).
+        adaptive : bool
+            If True, use an adaptive mesh refinement: `func` is computed on a coarse grid, then only the triangles
+            whose corners have different values are subdivided, recursively, up to the scale of the plot. In the
+            triangles whose corners have the same value, this value is used without computing `func`. The number of
+            evaluations of `func` and the number of evaluations saved are stored in :attr:`n_evaluations_` and
+            :attr:`n_evaluations_saved_`. This is an approximation, which is suitable when `func` is piecewise constant
+            on large regions.
+        coarse_scale : int
+            Scale of the coarse grid in the adaptive mode.
+        n_jobs : int, optional
+            If specified, `func` is computed in a pool of `n_jobs` processes (-1 means the number of CPUs).
+        executor : concurrent.futures.Executor, optional
+            If specified, `func` is computed by this executor (it must be picklable if the executor is a pool of
+            processes). This parameter takes precedence over `n_jobs`.
+        chunk_size : int
+            Number of points sent at once to a worker.
+        cache : HeatmapCache, optional
+            If specified, the values of `func` are read from this on-disk cache when possible, and the new values are
+            added to it. The values read from the cache do not count in :attr:`n_evaluations_`.
         kwargs
             All other keywords arguments are passed to method ``heatmap`` of `python-ternary`.
 
@@ -327,8 +633,20 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
 
             >>> tax.f_point_values_(right=0.5, top=0.3, left=0.2)
             [0.4472135954999579, 0.04000000000000001, 0.5127864045000421]
+
+        For a function that is piecewise constant, the adaptive mode saves most of the evaluations:
+
+            >>> def h(right, top, left):
+            ...     return [1, 0, 0] if right > top else [0, 1, 0]
+            >>> figure, tax = ternary_figure(scale=60)
+            >>> tax.heatmap_candidates(h, left_label='left', right_label='right', top_label='top', adaptive=True)
+            >>> tax.n_evaluations_, tax.n_evaluations_saved_
+            (409, 1482)
         """
-        d_scaled_point_color, self.d_point_values_ = _generate_heatmap_data(func, self.get_scale())
+        d_scaled_point_color, self.d_point_values_, self.n_evaluations_ = _generate_heatmap_data(
+            func, self.get_scale(), adaptive=adaptive, coarse_scale=coarse_scale, n_jobs=n_jobs, executor=executor,
+            chunk_size=chunk_size, cache=cache)
+        self.n_evaluations_saved_ = len(self.d_point_values_) - self.n_evaluations_
         if file_save_data is not None:
             with open(file_save_data, "wb") as f:
                 pickle.dump([d_scaled_point_color, self.d_point_values_], f)
@@ -343,6 +661,24 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
         else:
             self.legend_color_patches(title=legend_title, data=d_scaled_point_color)
 
+    @property
+    def a_grid_values_(self):
+        """numpy.ndarray : Values of the last candidate heatmap, as a dense array indexed by the scaled coordinates
+        `right` and `top` (cf. :func:`_grid_values`).
+
+        It is computed from :attr:`d_point_values_` when it is needed, hence it is also available when
+        :attr:`d_point_values_` is restored, e.g. from the file `file_save_data` of :meth:`heatmap_candidates`.
+        It is None if no candidate heatmap has been defined.
+        """
+        if self.d_point_values_ is None:
+            return None
+        if self._a_grid_values_source is not self.d_point_values_:
+            scale = self.get_scale()
+            self._a_grid_values = _grid_values({tuple(round(coordinate * scale) for coordinate in point): values
+                                                for point, values in self.d_point_values_.items()}, scale)
+            self._a_grid_values_source = self.d_point_values_
+        return self._a_grid_values
+
     def f_point_values_(self, right, top, left):
         """Data of a candidate heatmap.
 
@@ -353,28 +689,36 @@ class TernaryAxesSubplotPoisson(ternary.TernaryAxesSubplot):
 
         Parameters
         ----------
-        right : Number
-        top : Number
-        left : Number
+        right : Number or array_like
+        top : Number or array_like
+        left : Number or array_like
 
         Returns
         -------
-        list
-            List of size 3. The value associated respectively to each candidate `a`, `b`, `c`.
+        list or numpy.ndarray
+            If the inputs are numbers: a list of size 3, the value associated respectively to each candidate `a`,
+            `b`, `c`, as stored in :attr:`d_point_values_`. If the inputs are arrays: an array (of floats) with one
+            more dimension of size 3, with the values of all the points.
+
+        Examples
+        --------
+            >>> def f(right, top, left):
+            ...     return [right, top, left]
+            >>> figure, tax = ternary_figure(scale=10)
+            >>> tax.heatmap_candidates(f, left_label='left', right_label='right', top_label='top')
+            >>> tax.f_point_values_(right=0.52, top=0.31, left=0.17)
+            [Fraction(1, 2), Fraction(3, 10), Fraction(1, 5)]
+            >>> tax.f_point_values_(right=[0.52, 1.], top=[0.31, 0.], left=[0.17, 0.])
+            array([[0.5, 0.3, 0.2],
+                   [1. , 0. , 0. ]])
         """
         if self.d_point_values_ is None:
             raise ValueError("No candidate heatmap has been defined")
         scale = self.get_scale()
-        input_point = Point(right=right, top=top, left=left)
-        possible_approx_points = [
-            Point(right=ri, top=to, left=le)
-            for ri in [Fraction(floor(right * scale), scale), Fraction(ceil(right * scale), scale)]
-            for to in [Fraction(floor(top * scale), scale), Fraction(ceil(top * scale), scale)]
-            for le in [Fraction(floor(left * scale), scale), Fraction(ceil(left * scale), scale)]
-            if ri + to + le == 1
-        ]
-        best_approx_point = min(possible_approx_points, key=lambda p: distance.euclidean(input_point, p))
-        return self.d_point_values_[best_approx_point]
+        if np.ndim(right) == np.ndim(top) == np.ndim(left) == 0:
+            i, j = _nearest_grid_point(right, top, left, scale)
+            return self.d_point_values_[_fraction_point((i, j, scale - i - j), scale)]
+        return self.a_grid_values_[_nearest_grid_points(right, top, left, scale)]
 
     def annotate_condorcet(self, right_order, top_order, left_order, d_order_fixed_share=None):
         """Annotate who is the Condorcet winner depending on the region.
@@ -1,6 +1,7 @@
 from fractions import Fraction
 import numpy as np
 from poisson_approval.meta_analysis.ternary_plots import ternary_figure
+from poisson_approval.meta_analysis.HeatmapCache import HeatmapCache
 from poisson_approval.profiles.ProfileNoisyDiscrete import ProfileNoisyDiscrete
 from poisson_approval.utils.Util import candidates_to_probabilities, one_over_log_t_plus_one, d_candidate_value_to_array
 
@@ -81,7 +82,7 @@ class SimplexToProfile:
 
 
 def ternary_plot_n_equilibria(simplex_to_profile, scale, title='Number of equilibria',
-                              meth='analyzed_strategies_ordinal', **kwargs):
+                              meth='analyzed_strategies_ordinal', cache_dir=None, **kwargs):
     """Shortcut: ternary plot for the number of equilibria.
 
     Parameters
@@ -94,6 +95,10 @@ def ternary_plot_n_equilibria(simplex_to_profile, scale, title='Number of equili
         Title of the plot.
     meth : str
         The name of the :class:`AnalyzedStrategies` property used to count the equilibria. Cf. :class:`Profile`.
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`TernaryAxesSubplotPoisson.heatmap_intensity`.
 
@@ -107,11 +112,14 @@ def ternary_plot_n_equilibria(simplex_to_profile, scale, title='Number of equili
     def n_equilibria(right, top, left):
         profile = simplex_to_profile(right, top, left)
         return len(getattr(profile, meth).equilibria)
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='n_equilibria', simplex_to_profile=simplex_to_profile, meth=meth)
     figure, tax = ternary_figure(scale=scale)
     tax.heatmap_intensity(n_equilibria,
                           right_label=simplex_to_profile.label_r,
                           top_label=simplex_to_profile.label_t,
                           left_label=simplex_to_profile.label_l,
+                          cache=cache,
                           **kwargs)
     tax.annotate_condorcet(right_order=simplex_to_profile.order_r,
                            top_order=simplex_to_profile.order_t,
@@ -123,7 +131,7 @@ def ternary_plot_n_equilibria(simplex_to_profile, scale, title='Number of equili
 
 def ternary_plot_winners_at_equilibrium(simplex_to_profile, scale, title='Winners at equilibrium',
                                         legend_title='Winners', meth='analyzed_strategies_ordinal',
-                                        file_save_data=None,
+                                        file_save_data=None, cache_dir=None,
                                         **kwargs):
     """Shortcut: ternary plot for the winners at equilibrium.
 
@@ -141,6 +149,10 @@ def ternary_plot_winners_at_equilibrium(simplex_to_profile, scale, title='Winner
         The name of the :class:`AnalyzedStrategies` property used to study the equilibria. Cf. :class:`Profile`.
     file_save_data : str
         File where the computed data will be saved (using ``pickle``).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`TernaryAxesSubplotPoisson.heatmap_candidates`.
 
@@ -155,6 +167,8 @@ def ternary_plot_winners_at_equilibrium(simplex_to_profile, scale, title='Winner
     def winners_at_equilibrium(right, top, left):
         profile = simplex_to_profile(right, top, left)
         return candidates_to_probabilities(getattr(profile, meth).winners_at_equilibrium)
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='winners_at_equilibrium', simplex_to_profile=simplex_to_profile, meth=meth)
     figure, tax = ternary_figure(scale=scale)
     tax.heatmap_candidates(winners_at_equilibrium,
                            right_label=simplex_to_profile.label_r,
@@ -163,6 +177,7 @@ def ternary_plot_winners_at_equilibrium(simplex_to_profile, scale, title='Winner
                            legend_style='color_patches',
                            legend_title=legend_title,
                            file_save_data=file_save_data,
+                           cache=cache,
                            **kwargs)
     tax.annotate_condorcet(right_order=simplex_to_profile.order_r,
                            top_order=simplex_to_profile.order_t,
@@ -178,7 +193,7 @@ def ternary_plot_winning_frequencies(simplex_to_profile, scale,
                                      ballot_update_ratio=one_over_log_t_plus_one,
                                      winning_frequency_update_ratio=one_over_log_t_plus_one,
                                      title='Winning frequencies', legend_title='Winners',
-                                     meth='fictitious_play', file_save_data=None,
+                                     meth='fictitious_play', file_save_data=None, cache_dir=None,
                                      **kwargs):
     """Shortcut: ternary plot for the winning frequencies in fictitious play / iterated voting.
 
@@ -206,6 +221,10 @@ def ternary_plot_winning_frequencies(simplex_to_profile, scale,
         The name of the method (``'fictitious_play'`` or ``'iterated_voting'``).
     file_save_data : str
         File where the computed data will be saved (using ``pickle``).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`TernaryAxesSubplotPoisson.heatmap_candidates`.
 
@@ -227,6 +246,11 @@ def ternary_plot_winning_frequencies(simplex_to_profile, scale,
             a_candidate_value = a_candidate_value + d_candidate_value_to_array(results['d_candidate_winning_frequency'])
         return a_candidate_value / samples_per_point
 
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='winning_frequencies', simplex_to_profile=simplex_to_profile, meth=meth,
+        n_max_episodes=n_max_episodes, init=init, samples_per_point=samples_per_point,
+        perception_update_ratio=perception_update_ratio, ballot_update_ratio=ballot_update_ratio,
+        winning_frequency_update_ratio=winning_frequency_update_ratio)
     figure, tax = ternary_figure(scale=scale)
     tax.heatmap_candidates(winning_frequencies,
                            right_label=simplex_to_profile.label_r,
@@ -235,6 +259,7 @@ def ternary_plot_winning_frequencies(simplex_to_profile, scale,
                            legend_style='palette',
                            legend_title=legend_title,
                            file_save_data=file_save_data,
+                           cache=cache,
                            **kwargs)
     tax.annotate_condorcet(right_order=simplex_to_profile.order_r,
                            top_order=simplex_to_profile.order_t,
@@ -249,7 +274,7 @@ def ternary_plot_convergence(simplex_to_profile, scale,
                              perception_update_ratio=one_over_log_t_plus_one,
                              ballot_update_ratio=one_over_log_t_plus_one,
                              title='Convergence frequency',
-                             meth='fictitious_play', **kwargs):
+                             meth='fictitious_play', cache_dir=None, **kwargs):
     """Shortcut: ternary plot for the convergence frequency in fictitious play / iterated voting.
 
     Convergence frequency: out of `samples_per_points` trials, in which proportion of the cases did fictitious play or
@@ -275,6 +300,10 @@ def ternary_plot_convergence(simplex_to_profile, scale,
         Title of the plot.
     meth : str
         The name of the method (``'fictitious_play'`` or ``'iterated_voting'``).
+    cache_dir : str, optional
+        If specified, the value computed at each point is stored in an on-disk cache in this directory
+        (cf. :class:`HeatmapCache`). Any later plot with the same parameters, even with another scale, reuses these
+        values and computes only the new points.
     kwargs
         Other keyword arguments are passed to the function :meth:`TernaryAxesSubplotPoisson.heatmap_intensity`.
 
@@ -296,12 +325,17 @@ def ternary_plot_convergence(simplex_to_profile, scale,
                 n_convergences += 1
         return n_convergences / samples_per_point
 
+    cache = None if cache_dir is None else HeatmapCache(
+        cache_dir, statistic='convergence_frequency', simplex_to_profile=simplex_to_profile, meth=meth,
+        n_max_episodes=n_max_episodes, init=init, samples_per_point=samples_per_point,
+        perception_update_ratio=perception_update_ratio, ballot_update_ratio=ballot_update_ratio)
     figure, tax = ternary_figure(scale=scale)
     tax.heatmap_intensity(convergence_frequency,
                           right_label=simplex_to_profile.label_r,
                           top_label=simplex_to_profile.label_t,
                           left_label=simplex_to_profile.label_l,
                           vmin=0., vmax=1.,
+                          cache=cache,
                           **kwargs)
     tax.annotate_condorcet(right_order=simplex_to_profile.order_r,
                            top_order=simplex_to_profile.order_t,
@@ -1,6 +1,7 @@
 import random
 import numpy as np
 from fractions import Fraction
+from functools import partial
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.constants.EquilibriumStatus import EquilibriumStatus
 from poisson_approval.containers.AnalyzedStrategies import AnalyzedStrategies
@@ -10,12 +11,14 @@ from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
 from poisson_approval.utils.computation_engine import computation_engine
 from poisson_approval.utils.SetPrintingInOrder import SetPrintingInOrder
 from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.tau_vector.TauVectorCache import TauVectorCache
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 from poisson_approval.utils.SuperclassMeta import SuperclassMeta
 from poisson_approval.utils.Util import my_division, normalize_dict_to_0_1
 from poisson_approval.utils.UtilPreferences import is_lover, d_candidate_ordinal_utility
 from poisson_approval.utils.UtilBallots import sort_ballot, ballot_high_u, ballot_low_u
 from poisson_approval.utils.UtilCache import cached_property, DeleteCacheMixin, property_deleting_cache
+from poisson_approval.utils.UtilParallel import imap_parallel
 
 
 # noinspection PyUnresolvedReferences
@@ -26,8 +29,8 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
     ----------
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
     """
 
     def __init__(self, voting_rule=APPROVAL, symbolic=False):
@@ -381,6 +384,32 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             The conversion of the best responses into a strategy. Only the rankings present in this profile are
             mentioned in the strategy.
         """
+        return self._strategy_from_utility_thresholds(
+            {
+                ranking: best_response.utility_threshold
+                for ranking, best_response in tau.d_ranking_best_response.items()
+                if self.d_ranking_share[ranking] > 0
+            },
+            scores=tau.scores, ratio_optimistic=ratio_optimistic
+        )
+
+    def _strategy_from_utility_thresholds(self, d_ranking_threshold, scores, ratio_optimistic):
+        """Convert utility thresholds to a :class:`StrategyThreshold`.
+
+        Parameters
+        ----------
+        d_ranking_threshold : dict
+            Key: ranking. Value: utility threshold.
+        scores : dict
+            Key: candidate. Value: her score. This is used to choose the ballots of the voters with weak orders.
+        ratio_optimistic
+            The value of `ratio_optimistic` to use.
+
+        Returns
+        -------
+        StrategyThreshold
+            The strategy.
+        """
         # Deal with weak orders
         d_weak_order_ballot = {}
         if self.voting_rule == APPROVAL:
@@ -389,9 +418,9 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             for weak_order in WEAK_ORDERS_HATE_WITHOUT_INVERSIONS:  # i~j>k
                 if self.d_weak_order_share[weak_order] > 0:
                     i, j = weak_order[0], weak_order[2]
-                    if tau.scores[i] > tau.scores[j]:
+                    if scores[i] > scores[j]:
                         d_weak_order_ballot[weak_order] = i
-                    elif tau.scores[i] < tau.scores[j]:
+                    elif scores[i] < scores[j]:
                         d_weak_order_ballot[weak_order] = j
                     else:
                         d_weak_order_ballot[weak_order] = SPLIT
@@ -399,22 +428,15 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
             for weak_order in WEAK_ORDERS_LOVE_WITHOUT_INVERSIONS:  # i>j~k
                 if self.d_weak_order_share[weak_order] > 0:
                     i, j, k = weak_order[0], weak_order[2], weak_order[4]
-                    if tau.scores[j] > tau.scores[k]:  # Then vote against `j`
+                    if scores[j] > scores[k]:  # Then vote against `j`
                         d_weak_order_ballot[weak_order] = sort_ballot(i + k)
-                    elif tau.scores[j] < tau.scores[k]:  # Then vote against `k`
+                    elif scores[j] < scores[k]:  # Then vote against `k`
                         d_weak_order_ballot[weak_order] = sort_ballot(i + j)
                     else:
                         d_weak_order_ballot[weak_order] = SPLIT
         # Finish the job
-        return StrategyThreshold(
-            {
-                ranking: best_response.utility_threshold
-                for ranking, best_response in tau.d_ranking_best_response.items()
-                if self.d_ranking_share[ranking] > 0
-            },
-            d_weak_order_ballot=d_weak_order_ballot, ratio_optimistic=ratio_optimistic,
-            profile=self, voting_rule=self.voting_rule
-        )
+        return StrategyThreshold(d_ranking_threshold, d_weak_order_ballot=d_weak_order_ballot,
+                                 ratio_optimistic=ratio_optimistic, profile=self, voting_rule=self.voting_rule)
 
     @property
     def strategies_ordinal(self):
@@ -463,40 +485,140 @@ class Profile(DeleteCacheMixin, metaclass=SuperclassMeta):
         """
         raise NotImplementedError
 
-    def analyzed_strategies(self, strategies):
+    def iter_analyzed_strategies(self, strategies, n_jobs=None, executor=None, chunk_size=64):
+        """Analyze strategies for the profile, lazily.
+
+        Parameters
+        ----------
+        strategies : iterable
+            An iterator of strategies, such as a list of strategies.
+        n_jobs : int, optional
+            If specified, the strategies are analyzed in parallel by a pool of `n_jobs` processes (-1 means the number
+            of CPUs).
+        executor : concurrent.futures.Executor, optional
+            If specified, the strategies are analyzed by this executor. This parameter takes precedence over `n_jobs`.
+        chunk_size : int
+            In case of parallelism, number of strategies sent to a worker at once.
+
+        Yields
+        ------
+        tuple
+            A pair ``(strategy, status)``, where `strategy` is a copy of an input strategy, with this profile attached,
+            and `status` is an :class:`EquilibriumStatus`. The pairs are yielded in the order of `strategies`.
+
+        Notes
+        -----
+        The strategies are consumed lazily: in case of parallelism, only a few chunks are submitted in advance (cf.
+        :func:`imap_parallel`). If the generator is closed early, the remaining strategies are not analyzed.
+
+        Many strategies may lead to the same tau-vector, e.g. threshold strategies whose thresholds lie between the
+        same consecutive utilities. Hence the tau-vectors are shared through a :class:`TauVectorCache` during the
+        analysis (one per worker in case of parallelism): the best responses are computed only once per distinct
+        tau-vector, as long as it stays in the cache. The cache has its default size, so that the memory used does
+        not grow with the number of strategies.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileOrdinal
+            >>> profile = ProfileOrdinal({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)})
+            >>> for strategy, status in profile.iter_analyzed_strategies(profile.strategies_ordinal):
+            ...     if status == EquilibriumStatus.EQUILIBRIUM:
+            ...         print(strategy)
+            <abc: a, bac: b, cab: ac> ==> b
+            <abc: a, bac: ab, cab: c> ==> a
+        """
+        for strategy, status, _, _ in self._iter_analyzed_strategies(strategies, n_jobs, executor, chunk_size):
+            yield strategy, status
+
+    def _iter_analyzed_strategies(self, strategies, n_jobs, executor, chunk_size):
+        """Same as :meth:`iter_analyzed_strategies`, but yields tuples ``(strategy, status, n_best_responses,
+        tau_key)``, where `n_best_responses` is the number of best responses computed to analyze this strategy, and
+        `tau_key` is the key of its tau-vector (cf. :meth:`TauVectorCache.key`).
+        """
+        parallel = n_jobs is not None or executor is not None
+        if not parallel:
+            # The copies are analyzed directly, so that they keep their tau-vector and their best responses. In case
+            # of parallelism, the strategies are sent without the profile, and copied again when they come back.
+            strategies = (s.deepcopy_with_attached_profile(profile=self) for s in strategies)
+        # In case of parallelism, each worker has its own copy of the cache.
+        analyze = partial(_analyze_strategy, self, TauVectorCache())
+        for s, (status, n_best_responses, tau_key) in imap_parallel(analyze, strategies, n_jobs=n_jobs,
+                                                                    executor=executor, chunk_size=chunk_size):
+            strategy = s.deepcopy_with_attached_profile(profile=self) if parallel else s
+            yield strategy, status, n_best_responses, tau_key
+
+    def analyzed_strategies(self, strategies, drop_non_equilibria=False, stop_at_first_equilibrium=False,
+                            n_jobs=None, executor=None, chunk_size=64):
         """Analyze a list of strategies for the profile.
 
         Parameters
         ----------
         strategies : iterable
             An iterator of strategies, such as a list of strategies.
+        drop_non_equilibria : bool
+            If True, then the non-equilibria are not stored (the corresponding list is empty), which saves memory.
+        stop_at_first_equilibrium : bool
+            If True, then the analysis stops as soon as an equilibrium is found. This is useful when one only needs to
+            know whether there is an equilibrium. In that case, the lists of the output are incomplete.
+        n_jobs, executor, chunk_size
+            Cf. :meth:`iter_analyzed_strategies`.
 
         Returns
         -------
         AnalyzedStrategies
-            The analyzed strategies of the profile.
+            The analyzed strategies of the profile. Its attribute `n_distinct_taus` is the number of distinct
+            tau-vectors among the analyzed strategies. Its attributes `n_best_responses_computed` and
+            `n_best_responses_avoided` give the number of best responses that were computed, and the number of best
+            responses that were avoided, compared to computing the best responses of the 6 rankings for each strategy
+            (cf. :attr:`TauVector.n_best_responses_computed`).
 
         Examples
         --------
             Cf. :meth:`ProfileOrdinal.analyzed_strategies_ordinal`.
+
+        When we only need to know whether there is an equilibrium:
+
+            >>> from fractions import Fraction
+            >>> from poisson_approval import ProfileOrdinal
+            >>> profile = ProfileOrdinal({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)})
+            >>> analyzed_strategies = profile.analyzed_strategies(
+            ...     profile.strategies_ordinal, drop_non_equilibria=True, stop_at_first_equilibrium=True)
+            >>> analyzed_strategies.equilibria
+            [StrategyOrdinal({'abc': 'a', 'bac': 'b', 'cab': 'ac'})]
+            >>> analyzed_strategies.non_equilibria
+            []
         """
         equilibria = []
         utility_dependent = []
         inconclusive = []
         non_equilibria = []
-        for s in strategies:
-            strategy = s.deepcopy_with_attached_profile(profile=self)
-            status = strategy.is_equilibrium
-            if status == EquilibriumStatus.EQUILIBRIUM:
-                equilibria.append(strategy)
-            elif status == EquilibriumStatus.UTILITY_DEPENDENT:
-                utility_dependent.append(strategy)
-            elif status == EquilibriumStatus.INCONCLUSIVE:  # pragma: no cover - Should never happen
-                inconclusive.append(strategy)
-                raise AssertionError('Met an inconclusive case: \nprofile = %r\nstrategy = %r' % (self, strategy))
-            else:
-                non_equilibria.append(strategy)
-        return AnalyzedStrategies(equilibria, utility_dependent, inconclusive, non_equilibria)
+        tau_keys = set()
+        n_strategies = 0
+        n_best_responses_computed = 0
+        iterator = self._iter_analyzed_strategies(strategies, n_jobs, executor, chunk_size)
+        try:
+            for strategy, status, n_best_responses, tau_key in iterator:
+                n_strategies += 1
+                n_best_responses_computed += n_best_responses
+                tau_keys.add(tau_key)
+                if status == EquilibriumStatus.EQUILIBRIUM:
+                    equilibria.append(strategy)
+                    if stop_at_first_equilibrium:
+                        break
+                elif status == EquilibriumStatus.UTILITY_DEPENDENT:
+                    utility_dependent.append(strategy)
+                elif status == EquilibriumStatus.INCONCLUSIVE:  # pragma: no cover - Should never happen
+                    inconclusive.append(strategy)
+                    raise AssertionError('Met an inconclusive case: \nprofile = %r\nstrategy = %r' % (self, strategy))
+                elif not drop_non_equilibria:
+                    non_equilibria.append(strategy)
+        finally:
+            iterator.close()
+        return AnalyzedStrategies(equilibria, utility_dependent, inconclusive, non_equilibria,
+                                  n_distinct_taus=len(tau_keys),
+                                  n_best_responses_computed=n_best_responses_computed,
+                                  n_best_responses_avoided=6 * n_strategies - n_best_responses_computed)
 
     @cached_property
     def analyzed_strategies_ordinal(self):
@@ -619,3 +741,25 @@ def make_property_ranking_share(ranking, doc):
 
 for my_ranking in RANKINGS:
     setattr(Profile, my_ranking, make_property_ranking_share(my_ranking, 'Number : Share of voters with this ranking.'))
+
+
+def _analyze_strategy(profile, cache, s):
+    """Analyze a strategy, sharing the tau-vectors through `cache`.
+
+    If `s` is already attached to `profile`, it is analyzed directly. Otherwise, a copy of `s` with `profile`
+    attached is analyzed.
+
+    Returns
+    -------
+    tuple
+        The :class:`EquilibriumStatus` of `s` for `profile`, the number of best responses that were computed to obtain
+        it, and the key of its tau-vector (cf. :meth:`TauVectorCache.key`). The key is computed here, so that in case
+        of parallelism, the parent process does not need to compute the tau-vector.
+    """
+    strategy = s if s.profile is profile else s.deepcopy_with_attached_profile(profile=profile)
+    with TauVector.using_cache(cache):
+        tau = strategy.tau
+        n_best_responses_before = tau.n_best_responses_computed
+        status = strategy.is_equilibrium
+        tau_key = TauVectorCache.key(tau.d_ballot_share, voting_rule=tau.voting_rule, symbolic=tau.symbolic)
+        return status, tau.n_best_responses_computed - n_best_responses_before, tau_key
@@ -1,6 +1,7 @@
 import warnings
 import math
 import numpy as np
+from collections import deque
 from fractions import Fraction
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.constants.EquilibriumStatus import EquilibriumStatus
@@ -30,8 +31,8 @@ class ProfileCardinal(Profile):
         and `ratio_fanatic` must not exceed 1.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
     """
 
     def __init__(self, ratio_sincere=0, ratio_fanatic=0, voting_rule=APPROVAL, symbolic=False):
@@ -102,6 +103,34 @@ class ProfileCardinal(Profile):
         """
         raise NotImplementedError
 
+    def have_rankings_with_utility_below(self, thresholds):
+        """Share of voters who have each ranking and a utility for their middle candidate that is strictly below a
+        given value.
+
+        Parameters
+        ----------
+        thresholds : list or numpy.ndarray
+            Utilities between 0 and 1 (included). The last axis has size 6 and corresponds to the rankings, in the
+            order of ``RANKINGS``. There may be other axes, e.g. to ask for several vectors of thresholds at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            Same shape as `thresholds`. Each element is the share of voters who have the corresponding ranking and a
+            utility for their middle candidate strictly lower than the corresponding threshold, as given by
+            :meth:`have_ranking_with_utility_below_u`.
+
+        Notes
+        -----
+        This generic implementation simply calls :meth:`have_ranking_with_utility_below_u` for each element.
+        Subclasses may implement it in a vectorized way.
+        """
+        thresholds = np.asarray(thresholds)
+        results = np.empty(thresholds.shape, dtype=object)
+        for index in np.ndindex(*thresholds.shape):
+            results[index] = self.have_ranking_with_utility_below_u(RANKINGS[index[-1]], thresholds[index])
+        return results
+
     @cached_property
     def d_ranking_share(self):
         return DictPrintingInOrderIgnoringZeros({
@@ -426,7 +455,7 @@ class ProfileCardinal(Profile):
         tau : TauVector
             The initial tau-vector.
         """
-        if self.symbolic:
+        if self.ce.symbolic:
             warnings.warn('Using fictitious play or iterated voting with symbolic=True is strongly discouraged. '
                           'Consider defining the profile with symbolic=False.')
         if isinstance(init, Strategy):
@@ -455,7 +484,8 @@ class ProfileCardinal(Profile):
                         other_statistics_update_ratio=one_over_t,
                         other_statistics_tau=None,
                         other_statistics_strategy=None,
-                        verbose=False):
+                        verbose=False,
+                        max_history=None):
         """Seek for convergence by iterated voting.
 
         Parameters
@@ -500,6 +530,10 @@ class ProfileCardinal(Profile):
             function whose input is a strategy, and whose output is a number or a `numpy` array.
         verbose : bool
             If True, print all intermediate steps.
+        max_history : int, optional
+            If specified, only the last `max_history` episodes are kept in memory. This bounds the memory used by long
+            runs, but a cycle that is longer than `max_history` cannot be detected. By default, the whole history is
+            kept.
 
         Returns
         -------
@@ -538,6 +572,9 @@ class ProfileCardinal(Profile):
 
         In general, you should use :meth:`iterated_voting` only if you care about cycles, with the constraint
         that it implies having constant update ratios.
+
+        Each state (i.e. the pair of the actual and the perceived tau-vectors) is stored in a dictionary with the
+        episode where it was first seen, so that detecting an exact cycle costs a constant time per episode.
         """
         winning_frequency_update_ratio = to_callable(winning_frequency_update_ratio)
         other_statistics_update_ratio = to_callable(other_statistics_update_ratio)
@@ -553,9 +590,11 @@ class ProfileCardinal(Profile):
             print('t = %s' % 0)
             print('strategy: %s' % strategy)
             print('tau_actual: %s' % tau_actual)
-        strategies = []
-        taus_actual = []
-        taus_perceived = []
+        strategies = deque(maxlen=max_history)
+        taus_actual = deque(maxlen=max_history)
+        taus_perceived = deque(maxlen=max_history)
+        d_state_t = dict()  # Key: (tau_actual, tau_perceived). Value: episode where this state was seen.
+        begin_exact = None
         array_candidate_winning_frequency = None
         d_name_statistic_tau_averaged = {name: None for name in other_statistics_tau.keys()}
         d_name_statistic_strategy_actual = {name: None for name in other_statistics_strategy.keys()}
@@ -614,18 +653,28 @@ class ProfileCardinal(Profile):
                 print('tau_full_response: %s' % tau_full_response)
                 print('tau_actual: %s' % tau_actual)
             # If there is an exact cycle, it is useless to continue looping.
-            break_ = (tau_actual, tau_perceived) in zip(taus_actual, taus_perceived)
-
+            state = (tau_actual, tau_perceived)
+            t_previous = d_state_t.get(state)
+            if t_previous is None:
+                d_state_t[state] = t
+                if max_history is not None and t > max_history:
+                    # The oldest state is about to be discarded from the history.
+                    state_forgotten = (taus_actual[0], taus_perceived[0])
+                    if d_state_t.get(state_forgotten) == t - max_history:
+                        del d_state_t[state_forgotten]
             taus_actual.append(tau_actual)
             taus_perceived.append(tau_perceived)
             strategies.append(strategy)
-            if break_:
+            if t_previous is not None:
+                begin_exact = t_previous - 1 - (t - len(taus_actual))
                 n_episodes = t
                 break
+        taus_actual, taus_perceived, strategies = list(taus_actual), list(taus_perceived), list(strategies)
         try:
             end = len(taus_actual) - 1
+            # In case of an exact cycle, it is sufficient to search within the cycle.
             begin = next(begin
-                         for begin in range(end - 1, -1, -1)
+                         for begin in range(end - 1, -1 if begin_exact is None else begin_exact - 1, -1)
                          if taus_actual[begin].isclose(taus_actual[end], abs_tol=1E-9)
                          and taus_perceived[begin].isclose(taus_perceived[end], abs_tol=1E-9))
             cycle_taus_actual = taus_actual[begin + 1:end + 1]
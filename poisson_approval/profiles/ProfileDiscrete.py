@@ -31,8 +31,8 @@ class ProfileDiscrete(ProfileCardinal):
         and `ratio_fanatic` must not exceed 1.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
     Attributes
     ----------
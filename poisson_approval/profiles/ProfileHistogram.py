@@ -1,7 +1,6 @@
 import warnings
 import numpy as np
 from fractions import Fraction
-from matplotlib import pyplot as plt
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
 from poisson_approval.profiles.ProfileCardinalContinuous import ProfileCardinalContinuous
@@ -40,8 +39,8 @@ class ProfileHistogram(ProfileCardinalContinuous):
         and `ratio_fanatic` must not exceed 1.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
     Notes
     -----
@@ -203,6 +202,11 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
                 if normalization_warning:
                     warnings.warn(NORMALIZATION_WARNING)
                 self.d_ranking_histogram[ranking] = np.array([my_division(v, total) for v in histogram])
+        # Cumulative sums of the histograms: ``cumulative[k] = sum(histogram[0:k])``.
+        self._d_ranking_cumulative_histogram = {
+            ranking: np.concatenate(([0], np.cumsum(histogram)))
+            for ranking, histogram in self.d_ranking_histogram.items()
+        }
 
     @cached_property
     def d_ranking_share(self):
@@ -262,13 +266,48 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
         if u == 1:
             return self.ce.simplify(share_ranking)
         histogram = self.d_ranking_histogram[ranking]
+        cumulative_histogram = self._d_ranking_cumulative_histogram[ranking]
         n_bins = len(histogram)
         k = int(u * n_bins)
         if histogram[k] == 0:
             # Not really an exception, but handles fractions more nicely.
-            return self.ce.simplify(share_ranking * np.sum(histogram[0:k]))
+            return self.ce.simplify(share_ranking * cumulative_histogram[k])
         else:
-            return self.ce.simplify(share_ranking * (np.sum(histogram[0:k]) + histogram[k] * (u * n_bins - k)))
+            return self.ce.simplify(share_ranking * (cumulative_histogram[k] + histogram[k] * (u * n_bins - k)))
+
+    def have_rankings_with_utility_below(self, thresholds):
+        """Share of voters who have each ranking and a utility for their middle candidate that is strictly below a
+        given value.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_below`.
+
+        Examples
+        --------
+            >>> profile = ProfileHistogram({'abc': 0.4, 'bac': 0.6}, {'abc': [0.5, 0.5], 'bac': [1]})
+            >>> profile.have_rankings_with_utility_below([0.25, 0.5, 0.5, 1, 1, 1])
+            array([0.1, 0. , 0.3, 0. , 0. , 0. ])
+            >>> profile.have_rankings_with_utility_below([[0.25, 0.5, 0.5, 1, 1, 1], [1, 0, 0, 0, 0, 0]])
+            array([[0.1, 0. , 0.3, 0. , 0. , 0. ],
+                   [0.4, 0. , 0. , 0. , 0. , 0. ]])
+        """
+        thresholds = np.asarray(thresholds)
+        results = []
+        for i, ranking in enumerate(RANKINGS):
+            u = thresholds[..., i]
+            share_ranking = self.d_ranking_share[ranking]
+            if share_ranking == 0:
+                results.append(np.zeros(u.shape))
+                continue
+            histogram = self.d_ranking_histogram[ranking]
+            n_bins = len(histogram)
+            position = u * n_bins
+            k = np.minimum((position // 1).astype(int), n_bins - 1)
+            results.append(np.where(
+                u == 1,
+                share_ranking,
+                share_ranking * (self._d_ranking_cumulative_histogram[ranking][k] + histogram[k] * (position - k))
+            ))
+        return np.stack(results, axis=-1)
 
     def __repr__(self):
         """
@@ -418,9 +457,14 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
             share_ranking = self.d_ranking_share[ranking]
             d[ranking[0]] += share_ranking
             n_bins = len(histogram)
-            for i, relative_share in enumerate(histogram):
-                utility = (i + Fraction(1, 2)) / n_bins
-                d[ranking[1]] += utility * share_ranking * relative_share
+            if n_bins == 0:
+                continue
+            if histogram.dtype.kind == 'f':
+                utilities = (np.arange(n_bins) + .5) / n_bins
+            else:
+                # Keep exact computations with fractions.
+                utilities = np.array([(i + Fraction(1, 2)) / n_bins for i in range(n_bins)], dtype=object)
+            d[ranking[1]] += share_ranking * np.dot(histogram, utilities)
         for weak_order in self.support_in_weak_orders:
             share = self.d_weak_order_share[weak_order]
             d[weak_order[0]] += share
@@ -456,7 +500,8 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
             y_label = 'Cumulative proportion of the voters %s' % ranking
         n_bins = len(self.d_ranking_histogram[ranking])
         x = np.array(range(0, n_bins + 1)) / n_bins
-        y = np.concatenate(([0], np.cumsum(self.d_ranking_histogram[ranking])))
+        y = self._d_ranking_cumulative_histogram[ranking]
+        from matplotlib import pyplot as plt
         plt.plot(x, y, **kwargs)
         plt.xlabel(x_label)
         plt.ylabel(y_label)
@@ -492,6 +537,7 @@ d_weak_order_share={'a~c>b': Fraction(3, 10)})
         n_bins = len(self.d_ranking_histogram[ranking])
         x = np.array(range(0, n_bins + 1)) / n_bins
         y = np.concatenate(([0], self.d_ranking_histogram[ranking]))
+        from matplotlib import pyplot as plt
         plt.step(x, y, **kwargs)
         plt.xlabel(x_label)
         plt.ylabel(y_label)
@@ -1,4 +1,7 @@
 import warnings
+import numpy as np
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from poisson_approval.constants.basic_constants import *
 from poisson_approval.profiles.ProfileCardinalContinuous import ProfileCardinalContinuous
 from poisson_approval.strategies.StrategyThreshold import StrategyThreshold
@@ -30,8 +33,8 @@ class ProfileNoisyDiscrete(ProfileCardinalContinuous):
         and `ratio_fanatic` must not exceed 1.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
     Attributes
     ----------
@@ -222,19 +225,36 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
     def d_weak_order_share(self):
         return self._d_weak_order_share
 
+    @cached_property
+    def _d_ranking_index(self):
+        """dict: Dictionary that maps a ranking to the :class:`_GroupsIndex` of its groups of voters."""
+        return {ranking: _GroupsIndex(
+                    d_umin_umax_share,
+                    utilities=[utility for utility, noise in self.d_ranking_utility_noise_share[ranking].keys()])
+                for ranking, d_umin_umax_share in self.d_ranking_umin_umax_share.items()}
+
     def have_ranking_with_utility_above_u(self, ranking, u):
-        d_umin_umax_share = self.d_ranking_umin_umax_share[ranking]
-        return sum([
-            _crop(my_division(umax - u, umax - umin)) * share
-            for (umin, umax), share in d_umin_umax_share.items()
-        ])
+        return self._d_ranking_index[ranking].above(u)
 
     def have_ranking_with_utility_below_u(self, ranking, u):
-        d_umin_umax_share = self.d_ranking_umin_umax_share[ranking]
-        return sum([
-            _crop(my_division(u - umin, umax - umin)) * share
-            for (umin, umax), share in d_umin_umax_share.items()
-        ])
+        return self._d_ranking_index[ranking].below(u)
+
+    def have_rankings_with_utility_below(self, thresholds):
+        """Share of voters who have each ranking and a utility for their middle candidate that is strictly below a
+        given value.
+
+        Cf. :meth:`ProfileCardinal.have_rankings_with_utility_below`.
+
+        Examples
+        --------
+            >>> profile = ProfileNoisyDiscrete({('abc', 0.3): 0.25, ('abc', 0.8): 0.5, ('bac', 0.1): 0.25}, noise=0.1)
+            >>> profile.have_rankings_with_utility_below([[0.3, 0.3, 0.3, 0.3, 0.3, 0.3], [0.75, 0, 1, 0, 0, 0]])
+            array([[0.125, 0.   , 0.25 , 0.   , 0.   , 0.   ],
+                   [0.375, 0.   , 0.25 , 0.   , 0.   , 0.   ]])
+        """
+        thresholds = np.asarray(thresholds, dtype=float)
+        return np.stack([self._d_ranking_index[ranking].below_array(thresholds[..., i])
+                         for i, ranking in enumerate(RANKINGS)], axis=-1)
 
     def __repr__(self):
         """
@@ -376,10 +396,9 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
     @cached_property
     def d_candidate_welfare(self):
         d = DictPrintingInOrder({candidate: 0 for candidate in CANDIDATES})
-        for ranking, d_umin_umax_share in self.d_ranking_umin_umax_share.items():
-            for (u_min, u_max), share in d_umin_umax_share.items():
-                d[ranking[0]] += share
-                d[ranking[1]] += share * (u_min + u_max) / 2
+        for ranking, index in self._d_ranking_index.items():
+            d[ranking[0]] += index.share
+            d[ranking[1]] += index.share_times_mean_utility
         for weak_order in self.support_in_weak_orders:
             share = self.d_weak_order_share[weak_order]
             d[weak_order[0]] += share
@@ -399,8 +418,7 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
         def possible_thresholds(ranking):
             if self.d_ranking_share[ranking] == 0:
                 return [None]
-            d_utility_noise_share = self.d_ranking_utility_noise_share[ranking]
-            utilities = sorted([utility for utility, noise in d_utility_noise_share.keys()])
+            utilities = self._d_ranking_index[ranking].sorted_utilities
             return [0] + [my_division(x + y, 2) for x, y in zip(utilities[:-1], utilities[1:])] + [1]
 
         d_ranking_possible_thresholds = {ranking: possible_thresholds(ranking) for ranking in RANKINGS}
@@ -436,6 +454,112 @@ d_weak_order_share={'a~b>c': Fraction(53, 100)})
             return cls.order_and_label_weak(t)
 
 
+class _GroupsIndex:
+    """Sorted-breakpoint index of the groups of voters that have a given ranking.
+
+    Parameters
+    ----------
+    d_umin_umax_share : dict
+        Key: a tuple `(u_min, u_max)`. Value: the share of voters whose utility for their middle candidate is
+        uniformly distributed in `[u_min, u_max]`.
+    utilities : list
+        The central utilities of the groups (before cropping to [0, 1]).
+
+    Notes
+    -----
+    The groups are sorted by `u_min` on the one hand, and by `u_max` on the other hand. For each order, we store the
+    cumulative sums of the shares and of the quantities that define the piecewise-linear CDF. For a utility `u`, the
+    groups such that `u_max <= u` are entirely below `u`, and the groups such that `u_min < u < u_max` are partially
+    below `u`: both sets are found by a binary search, so that a query costs O(log(number of groups)).
+
+    When no group is partially below `u`, only the cumulative shares are used, so that the result is exact
+    (e.g. with fractions).
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> index = _GroupsIndex({(0.2, 0.4): Fraction(1, 4), (0.7, 0.9): Fraction(3, 4)}, utilities=[0.8, 0.3])
+        >>> index.below(0.5)
+        Fraction(1, 4)
+        >>> index.above(0.5)
+        Fraction(3, 4)
+        >>> print('%.4f' % index.below(0.3))
+        0.1250
+        >>> index.below_array(np.array([0.3, 0.5, 0.8, 1.]))
+        array([0.125, 0.25 , 0.625, 1.   ])
+        >>> index.sorted_utilities
+        [0.3, 0.8]
+    """
+
+    def __init__(self, d_umin_umax_share, utilities):
+        groups = list(d_umin_umax_share.items())
+        self.share = sum([share for _, share in groups])
+        self.share_times_mean_utility = sum([share * (u_min + u_max) / 2 for (u_min, u_max), share in groups])
+        self.sorted_utilities = sorted(utilities)
+        groups_by_u_min = sorted(groups, key=lambda group: group[0][0])
+        groups_by_u_max = sorted(groups, key=lambda group: group[0][1])
+        self.sorted_u_min = [u_min for (u_min, _), _ in groups_by_u_min]
+        self.sorted_u_max = [u_max for (_, u_max), _ in groups_by_u_max]
+
+        def cumulative_sums(f, sorted_groups):
+            return [0] + list(accumulate([f(u_min, u_max, share) for (u_min, u_max), share in sorted_groups]))
+
+        def f_share(u_min, u_max, share):
+            return share
+
+        def f_density(u_min, u_max, share):
+            return my_division(share, u_max - u_min)
+
+        def f_density_u_min(u_min, u_max, share):
+            return my_division(share * u_min, u_max - u_min)
+
+        def f_density_u_max(u_min, u_max, share):
+            return my_division(share * u_max, u_max - u_min)
+
+        # Key: name of the quantity. Value: cumulative sums, in the order of `u_min` and in the order of `u_max`.
+        self._d_name_cumulative_sums = {
+            name: (cumulative_sums(f, groups_by_u_min), cumulative_sums(f, groups_by_u_max))
+            for name, f in [('share', f_share), ('density', f_density),
+                            ('density_u_min', f_density_u_min), ('density_u_max', f_density_u_max)]
+        }
+
+    def _straddling(self, name, i, j):
+        """Sum of a quantity over the groups `i_min < i` and `i_max >= j` in the respective orders."""
+        cumulative_by_u_min, cumulative_by_u_max = self._d_name_cumulative_sums[name]
+        return cumulative_by_u_min[i] - cumulative_by_u_max[j]
+
+    def below(self, u):
+        """Share of voters whose utility is strictly below `u`."""
+        i = bisect_left(self.sorted_u_min, u)  # Groups with `u_min < u`.
+        j = bisect_right(self.sorted_u_max, u)  # Groups with `u_max <= u`.
+        result = self._d_name_cumulative_sums['share'][1][j]
+        if i != j:
+            result += u * self._straddling('density', i, j) - self._straddling('density_u_min', i, j)
+        return result
+
+    def above(self, u):
+        """Share of voters whose utility is strictly above `u`."""
+        i = bisect_left(self.sorted_u_min, u)  # Groups with `u_min < u`.
+        j = bisect_right(self.sorted_u_max, u)  # Groups with `u_max <= u`.
+        cumulative_shares_by_u_min = self._d_name_cumulative_sums['share'][0]
+        result = cumulative_shares_by_u_min[-1] - cumulative_shares_by_u_min[i]
+        if i != j:
+            result += self._straddling('density_u_max', i, j) - u * self._straddling('density', i, j)
+        return result
+
+    def below_array(self, u):
+        """Vectorized version of :meth:`below` (with floats)."""
+        i = np.searchsorted(np.array(self.sorted_u_min, dtype=float), u, side='left')
+        j = np.searchsorted(np.array(self.sorted_u_max, dtype=float), u, side='right')
+
+        def straddling(name):
+            cumulative_by_u_min, cumulative_by_u_max = self._d_name_cumulative_sums[name]
+            return np.array(cumulative_by_u_min, dtype=float)[i] - np.array(cumulative_by_u_max, dtype=float)[j]
+
+        partial = u * straddling('density') - straddling('density_u_min')
+        return np.array(self._d_name_cumulative_sums['share'][1], dtype=float)[j] + np.where(i != j, partial, 0.)
+
+
 def _crop(x, low=0, high=1):
     """Crop a number to an interval.
 
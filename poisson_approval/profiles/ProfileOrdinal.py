@@ -13,7 +13,7 @@ from poisson_approval.utils.UtilPreferences import sort_weak_order
 from poisson_approval.utils.UtilBallots import ballot_one, ballot_two, ballot_one_two, ballot_one_three, ballot_low_u, \
     ballot_high_u
 from poisson_approval.utils.UtilCache import cached_property, property_deleting_cache
-from poisson_approval.utils.UtilMasks import masks_area, masks_distribution, winners_distribution
+from poisson_approval.utils.UtilMasks import masks_cells
 
 
 # noinspection PyUnresolvedReferences
@@ -38,8 +38,8 @@ class ProfileOrdinal(Profile):
         The ratio of fanatic voters, in the interval [0, 1]. This is used for :meth:`tau`.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
 
     Notes
     -----
@@ -391,6 +391,64 @@ well_informed_voters=False, ratio_fanatic=Fraction(1, 10))
                 return EquilibriumStatus.NOT_EQUILIBRIUM
         return status
 
+    @cached_property
+    def decomposition_equilibria(self):
+        """Decomposition of the space of utilities according to the utility-dependent equilibria.
+
+        Returns
+        -------
+        dict
+            Key: a frozenset of indices in ``analyzed_strategies_ordinal.utility_dependent``. Value: the probability
+            that exactly these utility-dependent strategies are equilibria (events of null probability are omitted).
+
+        Notes
+        -----
+        The space of utilities is the unit cube whose dimensions are the rankings of the support. It is decomposed
+        once (cf. :meth:`masks_cells`), then :meth:`proba_equilibrium`, :meth:`distribution_equilibria` and
+        :meth:`distribution_winners` are computed from this decomposition, whatever the `test` condition.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> profile = ProfileOrdinal({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)})
+            >>> profile.analyzed_strategies_ordinal.utility_dependent
+            [StrategyOrdinal({'abc': 'ab', 'bac': 'b', 'cab': 'c'})]
+            >>> decomposition = profile.decomposition_equilibria
+            >>> for covering in sorted(decomposition.keys(), key=sorted):
+            ...     print(sorted(covering), '%.4f' % decomposition[covering])
+            [] 0.8629
+            [0] 0.1371
+        """
+        support = sorted(self.support_in_rankings)
+        dim = len(support)
+        masks = [
+            [(strategy.d_ranking_best_response[ranking].utility_threshold, len(strategy.d_ranking_ballot[ranking]) == 2)
+             for ranking in support]
+            for strategy in self.analyzed_strategies_ordinal.utility_dependent
+        ]
+        return masks_cells(inf=self.ce.zeros(dim), sup=self.ce.ones(dim), masks=masks)
+
+    def _decomposition_equilibria_passing(self, test):
+        """Decomposition of the space of utilities, restricted to the strategies that meet a condition.
+
+        Parameters
+        ----------
+        test : callable
+            A function ``StrategyOrdinal -> bool``.
+
+        Returns
+        -------
+        list of tuple
+            Each element is a pair ``(strategies, probability)``, where `strategies` is the list of utility-dependent
+            strategies that are equilibria and meet the `test` condition in this cell.
+        """
+        utility_dependent = self.analyzed_strategies_ordinal.utility_dependent
+        passing = [test(strategy) for strategy in utility_dependent]
+        if not any(passing):
+            return [([], 1)]
+        return [([utility_dependent[i] for i in sorted(covering) if passing[i]], probability)
+                for covering, probability in self.decomposition_equilibria.items()]
+
     def proba_equilibrium(self, test=None):
         """Probability that an equilibrium exists (depending on the utilities).
 
@@ -421,14 +479,8 @@ well_informed_voters=False, ratio_fanatic=Fraction(1, 10))
                 return True
         if any([test(strategy) for strategy in self.analyzed_strategies_ordinal.equilibria]):
             return 1
-        support = sorted(self.support_in_rankings)
-        dim = len(support)
-        masks = [
-            [(strategy.d_ranking_best_response[ranking].utility_threshold, len(strategy.d_ranking_ballot[ranking]) == 2)
-             for ranking in support]
-            for strategy in self.analyzed_strategies_ordinal.utility_dependent if test(strategy)
-        ]
-        return self.ce.simplify(masks_area(inf=self.ce.zeros(dim), sup=self.ce.ones(dim), masks=masks))
+        return self.ce.simplify(sum([probability for strategies, probability
+                                     in self._decomposition_equilibria_passing(test) if strategies]))
 
     def distribution_equilibria(self, test=None):
         """Distribution of numbers of equilibria (depending on the utilities).
@@ -459,16 +511,12 @@ well_informed_voters=False, ratio_fanatic=Fraction(1, 10))
             def test(strategy):
                 return True
         cover_alls = np.sum([test(strategy) for strategy in self.analyzed_strategies_ordinal.equilibria], dtype=int)
-        support = sorted(self.support_in_rankings)
-        dim = len(support)
-        masks = [
-            [(strategy.d_ranking_best_response[ranking].utility_threshold, len(strategy.d_ranking_ballot[ranking]) == 2)
-             for ranking in support]
-            for strategy in self.analyzed_strategies_ordinal.utility_dependent if test(strategy)
-        ]
-        return self.ce.simplify_vector(masks_distribution(inf=self.ce.zeros(dim),
-                                                          sup=self.ce.ones(dim),
-                                                          masks=masks, cover_alls=cover_alls))
+        histogram = [0 for _ in range(cover_alls + len(self.analyzed_strategies_ordinal.utility_dependent) + 1)]
+        for strategies, probability in self._decomposition_equilibria_passing(test):
+            histogram[cover_alls + len(strategies)] += probability
+        while len(histogram) > 1 and histogram[-1] == 0:
+            histogram.pop()
+        return self.ce.simplify_vector(np.array(histogram))
 
     def distribution_winners(self, test=None):
         """Distribution of the number of equilibrium winners (depending on the utilities).
@@ -503,21 +551,11 @@ well_informed_voters=False, ratio_fanatic=Fraction(1, 10))
             strategy.winners for strategy in self.analyzed_strategies_ordinal.equilibria
             if test(strategy)
         ]))
-        support = sorted(self.support_in_rankings)
-        dim = len(support)
-        masks_winners = [
-            (
-                [(strategy.d_ranking_best_response[ranking].utility_threshold,
-                  len(strategy.d_ranking_ballot[ranking]) == 2)
-                 for ranking in support],
-                strategy.winners
-            )
-            for strategy in self.analyzed_strategies_ordinal.utility_dependent if test(strategy)
-        ]
-        return self.ce.simplify_vector(winners_distribution(inf=self.ce.zeros(dim),
-                                                            sup=self.ce.ones(dim),
-                                                            masks_winners=masks_winners,
-                                                            cover_alls=cover_alls))
+        histogram = [0, 0, 0, 0]
+        for strategies, probability in self._decomposition_equilibria_passing(
+                lambda strategy: test(strategy) and not strategy.winners.issubset(cover_alls)):
+            histogram[len(cover_alls.union(*[strategy.winners for strategy in strategies]))] += probability
+        return self.ce.simplify_vector(np.array(histogram))
 
     @property
     def strategies_pure(self):
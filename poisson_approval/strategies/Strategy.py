@@ -47,9 +47,12 @@ class Strategy(DeleteCacheMixin, metaclass=SuperclassMeta):
         Returns
         -------
         Strategy
-            A deep copy of this strategy, with `profile` attached to it.
+            A deep copy of this strategy, with `profile` attached to it. The profile that was attached to this
+            strategy, if any, is not copied.
         """
-        strategy = deepcopy(self)
+        # The memo replaces the previous profile by the new one, instead of copying it.
+        memo = {} if self.profile is None else {id(self.profile): profile}
+        strategy = deepcopy(self, memo)
         strategy.profile = profile
         strategy.voting_rule = profile.voting_rule
         return strategy
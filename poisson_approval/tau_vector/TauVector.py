@@ -1,5 +1,7 @@
 import math
+import threading
 import warnings
+from contextlib import contextmanager
 from functools import partial
 from poisson_approval.best_response.BestResponseAntiPlurality import BestResponseAntiPlurality
 from poisson_approval.best_response.BestResponseApproval import BestResponseApproval
@@ -15,6 +17,7 @@ from poisson_approval.events.EventTrio import EventTrio
 from poisson_approval.events.EventTrio1t import EventTrio1t
 from poisson_approval.events.EventTrio2t import EventTrio2t
 from poisson_approval.events.EventPivotWeak import EventPivotWeak
+from poisson_approval.tau_vector.TauVectorCache import TauVectorCache
 from poisson_approval.utils.computation_engine import computation_engine
 from poisson_approval.utils.DictPrintingInOrder import DictPrintingInOrder
 from poisson_approval.utils.DictPrintingInOrderIgnoringZeros import DictPrintingInOrderIgnoringZeros
@@ -23,8 +26,33 @@ from poisson_approval.utils.UtilBallots import sort_ballot
 from poisson_approval.utils.UtilCache import cached_property
 
 
+# The caches of :meth:`TauVector.using_cache`, specific to each thread.
+_thread_local = threading.local()
+
+
+class _TauVectorMeta(type):
+    """Meta-class of :class:`TauVector`: when the cache is enabled, an instance is taken from the cache if possible.
+
+    Cf. :meth:`TauVector.enable_cache`. This is implemented in the meta-class so that it does not interfere with the
+    initialization nor with the pickling of tau-vectors.
+    """
+
+    def __call__(cls, d_ballot_share, voting_rule=APPROVAL, symbolic=False, normalization_warning=True):
+        # Read the cache only once, in case another thread changes it meanwhile.
+        cache = getattr(_thread_local, 'cache', cls.cache)
+        if cache is None:
+            return super().__call__(d_ballot_share, voting_rule=voting_rule, symbolic=symbolic,
+                                    normalization_warning=normalization_warning)
+        tau = cache.get(d_ballot_share, voting_rule=voting_rule, symbolic=symbolic)
+        if tau is None:
+            tau = super().__call__(d_ballot_share, voting_rule=voting_rule, symbolic=symbolic,
+                                   normalization_warning=normalization_warning)
+            cache.put(d_ballot_share, tau=tau, voting_rule=voting_rule, symbolic=symbolic)
+        return tau
+
+
 # noinspection PyUnresolvedReferences
-class TauVector:
+class TauVector(metaclass=_TauVectorMeta):
     """A vector `tau` (ballot distribution).
 
     Parameters
@@ -33,8 +61,8 @@ class TauVector:
         Ballot distribution, e.g. ``{'a': 0.1, 'ab': 0.6, 'c':0.3}``.
     voting_rule : str
         The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
-    symbolic : bool
-        Whether the computations are symbolic or numeric.
+    symbolic : bool or str
+        Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
     normalization_warning : bool
         Whether a warning should be issued if the input distribution is not normalized.
 
@@ -167,6 +195,13 @@ phi_ab = 0.707107>
         <asymptotic = exp(- 0.151472 n + 0.5 log n - 3.1394 + o(1)), phi_a = 0, phi_c = 1.41421, phi_ab = 0.707107>
     """
 
+    #: TauVectorCache or None: the process-wide cache of tau-vectors, if enabled (cf. :meth:`enable_cache`).
+    cache = None
+
+    #: bool: if True, the events and the best responses of all tau-vectors are computed on their
+    #: :attr:`standardized_version`, then the candidates are renamed (cf. :attr:`is_symmetry_reduced`).
+    symmetry_reduction = False
+
     def __init__(self, d_ballot_share: dict, voting_rule=APPROVAL, symbolic=False,
                  normalization_warning: bool = True):
         self.symbolic = symbolic
@@ -176,6 +211,9 @@ phi_ab = 0.707107>
             ballot: 0 for ballot in BALLOTS_WITHOUT_INVERSIONS})
         for ballot, share in d_ballot_share.items():
             self.d_ballot_share[sort_ballot(ballot)] += share
+        if symbolic == FLOAT:
+            for ballot in self.d_ballot_share.keys():
+                self.d_ballot_share[ballot] = float(self.d_ballot_share[ballot])
         # Normalize if necessary
         total = sum(self.d_ballot_share.values())
         if not self.ce.look_equal(total, 1):
@@ -190,6 +228,90 @@ phi_ab = 0.707107>
         elif self.voting_rule == ANTI_PLURALITY:
             assert self.a == self.b == self.c == 0
 
+    @classmethod
+    def enable_cache(cls, max_size=1024):
+        """Enable the process-wide cache of tau-vectors.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximal number of tau-vectors kept in the cache (the least recently used are discarded first).
+
+        Returns
+        -------
+        TauVectorCache
+            The cache. It gives access to the counters of hits and misses.
+
+        Notes
+        -----
+        When the cache is enabled, constructing a tau-vector that is equal to a tau-vector of the cache (with the same
+        voting rule and the same argument `symbolic`) returns the instance of the cache, with all the events and
+        best responses that were already computed. This is useful for processes that revisit the same tau-vectors
+        many times, such as :meth:`ProfileCardinal.iterated_voting` or :meth:`ProfileCardinal.fictitious_play`.
+
+        Since the instances are shared, tau-vectors must not be modified when the cache is enabled.
+
+        Examples
+        --------
+            >>> cache = TauVector.enable_cache(max_size=100)
+            >>> tau = TauVector({'a': 0.25, 'ab': 0.75})
+            >>> tau.pivot_weak_ab
+            <asymptotic = exp(- 0.25 n + o(1)), phi_a = 0, phi_ab = 1>
+            >>> TauVector({'ab': 0.75, 'a': 0.25}) is tau
+            True
+            >>> cache
+            TauVectorCache(max_size=100, size=1, hits=1, misses=1)
+            >>> TauVector.disable_cache()
+            >>> TauVector({'a': 0.25, 'ab': 0.75}) is tau
+            False
+        """
+        cls.cache = TauVectorCache(max_size=max_size)
+        return cls.cache
+
+    @classmethod
+    def disable_cache(cls):
+        """Disable the process-wide cache of tau-vectors (cf. :meth:`enable_cache`)."""
+        cls.cache = None
+
+    @classmethod
+    @contextmanager
+    def using_cache(cls, cache):
+        """Context manager that uses a given cache of tau-vectors (cf. :meth:`enable_cache`).
+
+        Parameters
+        ----------
+        cache : TauVectorCache
+            The cache used inside the context. When the context is exited, the previous cache (or the absence of
+            cache) is restored.
+
+        Notes
+        -----
+        The cache is used only by the current thread, and it takes precedence over the process-wide cache
+        :attr:`cache`, which is not modified. Hence several threads can use their own contexts at the same time.
+
+        Examples
+        --------
+            >>> cache = TauVectorCache(max_size=100)
+            >>> with TauVector.using_cache(cache):
+            ...     tau = TauVector({'a': 0.25, 'ab': 0.75})
+            ...     TauVector({'ab': 0.75, 'a': 0.25}) is tau
+            True
+            >>> TauVector.cache is None
+            True
+            >>> cache
+            TauVectorCache(max_size=100, size=1, hits=1, misses=1)
+        """
+        has_previous_cache = hasattr(_thread_local, 'cache')
+        previous_cache = getattr(_thread_local, 'cache', None)
+        _thread_local.cache = cache
+        try:
+            yield cache
+        finally:
+            if has_previous_cache:
+                _thread_local.cache = previous_cache
+            else:
+                del _thread_local.cache
+
     def __repr__(self):
         arguments = repr(self.d_ballot_share)
         if self.voting_rule != APPROVAL:
@@ -257,6 +379,20 @@ phi_ab = 0.707107>
                 and self.d_ballot_share == other.d_ballot_share
                 and self.voting_rule == other.voting_rule)
 
+    def __hash__(self):
+        """Hash, consistent with :meth:`__eq__`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> tau = TauVector({'a': Fraction(1, 2), 'ab': Fraction(1, 2)})
+            >>> hash(tau) == hash(TauVector({'a': 0.5, 'ab': 0.5}))
+            True
+            >>> len({tau, TauVector({'a': 0.5, 'ab': 0.5})})
+            1
+        """
+        return hash((tuple(self.d_ballot_share.values()), self.voting_rule))
+
     @cached_property
     def has_two_consecutive_zeros(self):
         """bool
@@ -312,20 +448,83 @@ phi_ab = 0.707107>
             >>> tau.standardized_version
             TauVector({'a': Fraction(3, 10), 'b': Fraction(1, 10), 'bc': Fraction(3, 5)})
         """
+        d_candidate_standardized = self._d_candidate_standardized
+        return TauVector({''.join(d_candidate_standardized[candidate] for candidate in ballot): share
+                          for ballot, share in self.d_ballot_share.items()},
+                         voting_rule=self.voting_rule, symbolic=self.symbolic)
+
+    @cached_property
+    def _d_candidate_standardized(self):
+        """dict : Key: a candidate. Value: the name of this candidate in the :attr:`standardized_version`.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> tau._d_candidate_standardized
+            {'a': 'b', 'b': 'c', 'c': 'a'}
+        """
         def translate(s, permute):
             return ''.join(sorted(s.replace('a', permute[0]).replace('b', permute[1]).replace('c', permute[2])))
 
-        best_d = {}
+        best_perm = None
         best_signature = []
         for perm in XYZ_PERMUTATIONS:
             d_test = {translate(ballot, perm): share for ballot, share in self.d_ballot_share.items()}
             signature_test = [d_test[ballot] for ballot in XYZ_BALLOTS_WITHOUT_INVERSION]
             if signature_test > best_signature:
                 best_signature = signature_test
-                best_d = d_test
-        return TauVector({ballot: best_d[xyz_ballot]
-                          for ballot, xyz_ballot in zip(BALLOTS_WITHOUT_INVERSIONS, XYZ_BALLOTS_WITHOUT_INVERSION)},
-                         voting_rule=self.voting_rule)
+                best_perm = perm
+        d_xyz_candidate = dict(zip(XYZ_BALLOTS_WITHOUT_INVERSION, BALLOTS_WITHOUT_INVERSIONS))
+        return {candidate: d_xyz_candidate[xyz] for candidate, xyz in zip(CANDIDATES, best_perm)}
+
+    @cached_property
+    def is_symmetry_reduced(self):
+        """bool : Whether the events and best responses are obtained from the :attr:`standardized_version`.
+
+        This is the case when :attr:`symmetry_reduction` is True and the tau-vector is not standardized. Then each
+        event is computed only once for the standardized version, then the candidates are renamed (cf.
+        :meth:`Event.permuted`); similarly for the best responses. If the cache is enabled (cf. :meth:`enable_cache`),
+        the standardized version is shared by all the tau-vectors that are equal up to a permutation of the
+        candidates, so that the computations are done only once for all of them.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> TauVector.symmetry_reduction = True
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> tau.is_symmetry_reduced
+            True
+            >>> tau.pivot_weak_ac
+            <asymptotic = exp(- 0.0834849 n - 0.5 log n - 0.87535 + o(1)), phi_a = 0.654654, phi_c = 1.52753, \
+phi_ab = 0.654654>
+            >>> tau.d_ranking_best_response['abc']
+            <ballot = a, utility_threshold = 1, justification = Asymptotic method>
+            >>> TauVector.symmetry_reduction = False
+        """
+        return self.symmetry_reduction and not self.is_standardized
+
+    def _event_by_symmetry(self, name):
+        """Event computed on the standardized version, then permuted.
+
+        Parameters
+        ----------
+        name : str
+            The name of the event, e.g. ``'trio'``, ``'duo_ab'``, ``'pivot_tij_abc'``, ``'trio_1t_a'``.
+
+        Returns
+        -------
+        Event
+            The event.
+        """
+        d_candidate_standardized = self._d_candidate_standardized
+        d_standardized_candidate = {value: key for key, value in d_candidate_standardized.items()}
+        if name == 'trio':
+            name_standardized = name
+        else:
+            prefix, suffix = name.rsplit('_', 1)
+            name_standardized = prefix + '_' + ''.join(d_candidate_standardized[candidate] for candidate in suffix)
+        return getattr(self.standardized_version, name_standardized).permuted(d_standardized_candidate, tau=self)
 
     @cached_property
     def is_standardized(self):
@@ -371,6 +570,8 @@ phi_ab = 0.707107>
     @cached_property
     def trio(self):
         """Event: Trio."""
+        if self.is_symmetry_reduced:
+            return self._event_by_symmetry('trio')
         return EventTrio(candidate_x='a', candidate_y='b', candidate_z='c', tau=self)
 
     @property
@@ -526,15 +727,50 @@ phi_ab = 0.707107>
             <ballot = a, utility_threshold = 1, justification = Asymptotic method>
         """
         if self.voting_rule == APPROVAL:
-            return DictPrintingInOrder({
-                ranking: BestResponseApproval(tau=self, ranking=ranking) for ranking in RANKINGS})
-        if self.voting_rule == PLURALITY:
-            return DictPrintingInOrder({
-                ranking: BestResponsePlurality(tau=self, ranking=ranking) for ranking in RANKINGS})
-        if self.voting_rule == ANTI_PLURALITY:
-            return DictPrintingInOrder({
-                ranking: BestResponseAntiPlurality(tau=self, ranking=ranking) for ranking in RANKINGS})
-        raise NotImplementedError
+            best_response_class = BestResponseApproval
+        elif self.voting_rule == PLURALITY:
+            best_response_class = BestResponsePlurality
+        elif self.voting_rule == ANTI_PLURALITY:
+            best_response_class = BestResponseAntiPlurality
+        else:
+            raise NotImplementedError
+        d_ranking_best_response = DictPrintingInOrder({
+            ranking: best_response_class(tau=self, ranking=ranking) for ranking in RANKINGS})
+        if self.is_symmetry_reduced:
+            # The utility threshold and its justification do not depend on the names of the candidates. They are
+            # taken from the standardized version only when needed.
+            d_ranking_best_response_standardized = self.standardized_version.d_ranking_best_response
+            for ranking, best_response in d_ranking_best_response.items():
+                ranking_standardized = ''.join(self._d_candidate_standardized[candidate] for candidate in ranking)
+                best_response._cached_properties = _ResultsBySymmetry(
+                    d_ranking_best_response_standardized[ranking_standardized])
+        return d_ranking_best_response
+
+    @property
+    def n_best_responses_computed(self):
+        """int : Number of rankings whose best response has been computed so far.
+
+        The best responses are computed lazily: e.g. checking whether a strategy is an equilibrium stops at the first
+        ranking whose best response disagrees with the strategy, so the best responses of the other rankings (and the
+        events they need) are never computed.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> tau = TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)})
+            >>> tau.n_best_responses_computed
+            0
+            >>> tau.d_ranking_best_response['abc'].ballot
+            'a'
+            >>> tau.n_best_responses_computed
+            1
+        """
+        try:
+            d_ranking_best_response = self._cached_properties['d_ranking_best_response']
+        except (AttributeError, KeyError):
+            return 0
+        return sum(['results' in getattr(best_response, '_cached_properties', {})
+                    for best_response in d_ranking_best_response.values()])
 
     @cached_property
     def score_ab_in_duo_ab(self):
@@ -645,6 +881,23 @@ phi_ab = 0.707107>
         return self.pivot_bc_easy_or_tight
 
 
+class _ResultsBySymmetry(dict):
+    """Cache of a best response, whose results are taken lazily from a best response of the standardized version.
+
+    Cf. :meth:`TauVector.d_ranking_best_response`.
+    """
+
+    def __init__(self, best_response_standardized):
+        super().__init__()
+        self.best_response_standardized = best_response_standardized
+
+    def __missing__(self, key):
+        if key != 'results':
+            raise KeyError(key)
+        self[key] = self.best_response_standardized.results
+        return self[key]
+
+
 def _f_ballot_share(self, ballot):
     """Share of this ballot"""
     # This function is used to define an attribute for each ballot.
@@ -664,6 +917,8 @@ for my_ballot in BALLOTS_WITH_INVERSIONS:
 
 def _f_duo(self, candidate_x, candidate_y, candidate_z, cls, stub):
     if candidate_x < candidate_y:
+        if self.is_symmetry_reduced:
+            return self._event_by_symmetry(stub + '_%s%s' % (candidate_x, candidate_y))
         return cls(candidate_x=candidate_x, candidate_y=candidate_y, candidate_z=candidate_z, tau=self)
     else:
         return getattr(self, stub + '_%s%s' % (candidate_y, candidate_x))
@@ -691,7 +946,9 @@ for event_class, event_stub, event_doc in [
 # Events based on a permutation: create cached properties like pivot_tij_abc, etc.
 
 
-def _f_ranking(self, candidate_x, candidate_y, candidate_z, cls):
+def _f_ranking(self, candidate_x, candidate_y, candidate_z, cls, name):
+    if self.is_symmetry_reduced:
+        return self._event_by_symmetry(name)
     return cls(candidate_x=candidate_x, candidate_y=candidate_y, candidate_z=candidate_z, tau=self)
 
 
@@ -703,9 +960,11 @@ for event_class, event_stub, event_doc in [
     for x, y, z in RANKINGS:
         name = event_stub + '_%s%s%s' % (x, y, z)
         if event_stub == 'pivot_tjk':
-            setattr(TauVector, name, partial(_f_ranking, candidate_x=z, candidate_y=y, candidate_z=x, cls=event_class))
+            setattr(TauVector, name, partial(_f_ranking, candidate_x=z, candidate_y=y, candidate_z=x, cls=event_class,
+                                             name=name))
         else:
-            setattr(TauVector, name, partial(_f_ranking, candidate_x=x, candidate_y=y, candidate_z=z, cls=event_class))
+            setattr(TauVector, name, partial(_f_ranking, candidate_x=x, candidate_y=y, candidate_z=z, cls=event_class,
+                                             name=name))
         getattr(TauVector, name).__name__ = name
         setattr(TauVector, name, cached_property(getattr(TauVector, name)))
         getattr(TauVector, name).__doc__ = event_doc
@@ -720,7 +979,8 @@ for event_class, event_stub, event_doc in [
         if y > z:
             continue
         name = event_stub + '_%s' % x
-        setattr(TauVector, name, partial(_f_ranking, candidate_x=x, candidate_y=y, candidate_z=z, cls=event_class))
+        setattr(TauVector, name, partial(_f_ranking, candidate_x=x, candidate_y=y, candidate_z=z, cls=event_class,
+                                         name=name))
         getattr(TauVector, name).__name__ = name
         setattr(TauVector, name, cached_property(getattr(TauVector, name)))
         getattr(TauVector, name).__doc__ = event_doc
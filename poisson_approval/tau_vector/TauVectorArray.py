@@ -0,0 +1,533 @@
+import warnings
+import numpy as np
+from functools import partial
+from poisson_approval.best_response.BestResponseAntiPlurality import BestResponseAntiPlurality
+from poisson_approval.best_response.BestResponseApproval import BestResponseApproval
+from poisson_approval.best_response.BestResponsePlurality import BestResponsePlurality
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.events.AsymptoticArray import AsymptoticArray, _look_equal
+from poisson_approval.events.EventArray import EventArray
+from poisson_approval.tau_vector.TauVector import TauVector
+from poisson_approval.utils.UtilBallots import sort_ballot
+from poisson_approval.utils.UtilCache import cached_property
+from poisson_approval.utils.UtilTrio import trio_minimize
+
+
+# noinspection PyUnresolvedReferences
+class TauVectorArray:
+    """An array of tau-vectors (ballot distributions), whose events are computed in a vectorized way.
+
+    Parameters
+    ----------
+    shares : array-like
+        Array of size `N` * 6. Each row is a ballot distribution, given in the order of
+        ``BALLOTS_WITHOUT_INVERSIONS``, i.e. ``'a'``, ``'b'``, ``'c'``, ``'ab'``, ``'ac'``, ``'bc'``.
+    voting_rule : str
+        The voting rule. Possible values are ``APPROVAL``, ``PLURALITY`` and ``ANTI_PLURALITY``.
+    normalization_warning : bool
+        Whether a warning should be issued if some rows of the input are not normalized.
+
+    Notes
+    -----
+    The computations are always numeric (with floats). The events (``duo_ab``, ``pivot_weak_ab``, ``trio``,
+    ``trio_1t_a``, ``pivot_tij_abc``, etc.) have the same names as in :class:`TauVector`, but they are
+    :class:`EventArray` objects, whose magnitudes, offsets and coefficients are arrays with one coefficient per
+    tau-vector.
+
+    The computation is vectorized for all the tau-vectors in the interior of the simplex (i.e. where all the ballots
+    have a positive share), including the generic case of the trio (cf. :meth:`trio_minimize`). For the other
+    tau-vectors, the results are given by the corresponding :class:`TauVector`, which can be accessed by indexing
+    (cf. below).
+
+    Examples
+    --------
+        >>> taus = TauVectorArray([[0.1, 0, 0.3, 0.6, 0, 0],
+        ...                        [0.125, 0.25, 0.125, 0.25, 0.125, 0.125]])
+        >>> len(taus)
+        2
+        >>> taus.ab
+        array([0.6 , 0.25])
+        >>> taus.scores
+        array([[0.7  , 0.6  , 0.3  ],
+               [0.5  , 0.625, 0.375]])
+        >>> taus.winners
+        array([[ True, False, False],
+               [False,  True, False]])
+        >>> taus.duo_ab.mu
+        array([-0.1       , -0.01262756])
+        >>> taus.pivot_weak_ab[1]
+        <asymptotic = exp(- 0.0126276 n - 0.5 log n - 0.673731 + o(1)), phi_a = 1.22474, phi_b = 0.816497, \
+phi_c = 1, phi_ab = 1, phi_ac = 1.22474, phi_bc = 0.816497>
+
+    Indexing gives a usual :class:`TauVector`:
+
+        >>> print(taus[0])
+        <a: 0.1, ab: 0.6, c: 0.3> ==> a
+        >>> taus[0].pivot_weak_ab
+        <asymptotic = exp(- 0.1 n + o(1)), phi_a = 0, phi_c = 1, phi_ab = 1>
+        >>> taus.pivot_weak_ab[0]
+        <asymptotic = exp(- 0.1 n + o(1)), phi_a = 0, phi_c = 1, phi_ab = 1>
+    """
+
+    #: tuple of str: The possible justifications of the best responses. Cf. :attr:`justification_codes`.
+    JUSTIFICATIONS = (
+        BestResponseApproval.ASYMPTOTIC,
+        BestResponseApproval.ASYMPTOTIC_SIMPLIFIED,
+        BestResponseApproval.EASY_VS_DIFFICULT,
+        BestResponseApproval.DIFFICULT_VS_EASY,
+        BestResponseApproval.OFFSET_METHOD,
+        BestResponseApproval.OFFSET_METHOD_WITH_TRIO_APPROXIMATION_CORRECTION,
+        BestResponsePlurality.PLURALITY_ANALYSIS,
+        BestResponseAntiPlurality.ANTI_PLURALITY_ANALYSIS,
+    )
+
+    def __init__(self, shares, voting_rule=APPROVAL, normalization_warning=True):
+        shares = np.array(shares, dtype=float)
+        if shares.ndim != 2 or shares.shape[1] != len(BALLOTS_WITHOUT_INVERSIONS):
+            raise ValueError('Expected an array of shape (N, %d), got: %s.'
+                             % (len(BALLOTS_WITHOUT_INVERSIONS), shares.shape))
+        # Normalize if necessary
+        totals = shares.sum(axis=1)
+        not_normalized = ~np.isclose(totals, 1, rtol=1e-9, atol=0)
+        if np.any(not_normalized):
+            if normalization_warning and np.any(~np.isclose(totals, 1, rtol=1e-5, atol=0)):
+                warnings.warn(NORMALIZATION_WARNING)
+            shares[not_normalized, :] /= totals[not_normalized, np.newaxis]
+        self.shares = shares
+        self.voting_rule = voting_rule
+        if self.voting_rule == PLURALITY:
+            assert np.all(self.shares[:, 3:] == 0)
+        elif self.voting_rule == ANTI_PLURALITY:
+            assert np.all(self.shares[:, :3] == 0)
+        self._rows = dict()
+
+    @classmethod
+    def from_tau_vectors(cls, taus):
+        """Build an array from tau-vectors.
+
+        Parameters
+        ----------
+        taus : iterable of TauVector
+            The tau-vectors. They must all have the same voting rule.
+
+        Returns
+        -------
+        TauVectorArray
+            The corresponding array.
+
+        Examples
+        --------
+            >>> from fractions import Fraction
+            >>> taus = TauVectorArray.from_tau_vectors([
+            ...     TauVector({'a': Fraction(1, 10), 'ab': Fraction(3, 5), 'c': Fraction(3, 10)}),
+            ...     TauVector({'b': Fraction(1, 2), 'ac': Fraction(1, 2)})
+            ... ])
+            >>> taus.shares
+            array([[0.1, 0. , 0.3, 0.6, 0. , 0. ],
+                   [0. , 0.5, 0. , 0. , 0.5, 0. ]])
+        """
+        taus = list(taus)
+        voting_rules = {tau.voting_rule for tau in taus}
+        if len(voting_rules) > 1:
+            raise ValueError('All the tau-vectors must have the same voting rule.')
+        voting_rule = voting_rules.pop() if voting_rules else APPROVAL
+        return cls([[float(tau.d_ballot_share[ballot]) for ballot in BALLOTS_WITHOUT_INVERSIONS] for tau in taus],
+                   voting_rule=voting_rule, normalization_warning=False)
+
+    def __len__(self):
+        return self.shares.shape[0]
+
+    def __getitem__(self, i):
+        """TauVector : the `i`-th tau-vector.
+
+        The object is created once, then stored: its own cached properties are therefore computed only once.
+        """
+        if i < 0:
+            i += len(self)
+        try:
+            return self._rows[i]
+        except KeyError:
+            tau = TauVector({ballot: float(share) for ballot, share in zip(BALLOTS_WITHOUT_INVERSIONS, self.shares[i])},
+                            voting_rule=self.voting_rule, normalization_warning=False)
+            self._rows[i] = tau
+            return tau
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        arguments = repr(self.shares.tolist())
+        if self.voting_rule != APPROVAL:
+            arguments += ', voting_rule=%r' % self.voting_rule
+        return 'TauVectorArray(%s)' % arguments
+
+    @cached_property
+    def scores(self):
+        """numpy.ndarray : Array of size `N` * 3. The scores of candidates `a`, `b` and `c`."""
+        # Same order of summation as in :attr:`TauVector.scores`, so that ties are detected in the same way.
+        return np.stack([self.a + self.ab + self.ac, self.b + self.ab + self.bc, self.c + self.ac + self.bc], axis=1)
+
+    @cached_property
+    def winners(self):
+        """numpy.ndarray : Array of Booleans of size `N` * 3. Whether `a`, `b` and `c` are winners."""
+        return self.scores == self.scores.max(axis=1, keepdims=True)
+
+    @cached_property
+    def is_interior(self):
+        """numpy.ndarray : Array of Booleans of size `N`. Whether all the ballots have a positive share.
+
+        These are the tau-vectors for which the computation of the events is vectorized.
+        """
+        return np.all(self.shares > 0, axis=1)
+
+    # Events
+
+    def _taus_xyz(self, x, y, z):
+        """Shares with the notations of :class:`Event`: tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz."""
+        return tuple(getattr(self, sort_ballot(label)) for label in [x, y, z, x + y, x + z, y + z])
+
+    def _event_array(self, name, x, y, z, asymptotic, phi_xyz, vectorized):
+        """Build an :class:`EventArray`, using the :class:`TauVector` of each row that is not `vectorized`.
+
+        `phi_xyz` is a list of the offsets in the order x, y, z, xy, xz, yz.
+        """
+        labels = [sort_ballot(label) for label in [x, y, z, x + y, x + z, y + z]]
+        mu, nu, xi = (np.array(coefficient, dtype=float)
+                      for coefficient in [asymptotic.mu, asymptotic.nu, asymptotic.xi])
+        phi = {label: np.array(values, dtype=float) for label, values in zip(labels, phi_xyz)}
+        for i in np.flatnonzero(~vectorized):
+            event = getattr(self[i], name)
+            mu[i], nu[i], xi[i] = float(event.mu), float(event.nu), float(event.xi)
+            for label in labels:
+                phi[label][i] = float(event.phi[label])
+        return EventArray(x, y, z, mu=mu, nu=nu, xi=xi, phi=phi)
+
+    @cached_property
+    def trio(self):
+        """EventArray: Trio."""
+        tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz = self._taus_xyz('a', 'b', 'c')
+        n = len(self)
+        # Natural general tie
+        natural = self.is_interior & (tau_x - tau_yz == tau_y - tau_xz) & (tau_y - tau_xz == tau_z - tau_xy)
+        # Generic case: all the trios are solved at once. When all the shares are positive, the objective function
+        # reaches its minimum in the interior of (0, inf), so the bounds of :class:`EventTrio` are not needed.
+        generic = self.is_interior & ~natural
+        mu, x_2 = np.zeros(n), np.ones(n)
+        if np.any(generic):
+            mu[generic], x_2[generic] = trio_minimize(tau_x[generic], tau_y[generic], tau_z[generic],
+                                                      tau_xy[generic], tau_xz[generic], tau_yz[generic])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_1 = np.where(generic, np.sqrt((tau_yz / x_2 + tau_y) / (tau_x * x_2 + tau_xz)), 1.)
+        return self._event_array(
+            'trio', 'a', 'b', 'c', AsymptoticArray(mu=mu, nu=np.nan, xi=np.nan),
+            phi_xyz=[x_1 * x_2, 1 / x_1, 1 / x_2, x_2, x_1, 1 / (x_1 * x_2)], vectorized=self.is_interior)
+
+    # Best responses
+
+    def _score_pair_and_other_in_duo(self, x, y, z):
+        """Common score of `x` and `y` in duo `xy`, and score of `z` (cf. e.g. :attr:`TauVector.score_ab_in_duo_ab`).
+        """
+        tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz = self._taus_xyz(x, y, z)
+        duo = getattr(self, 'duo_%s%s' % (x, y))
+        with np.errstate(invalid='ignore'):
+            score_xy = (_multiply_with_absorbing_zero(tau_x, duo.phi[x])
+                        + _multiply_with_absorbing_zero(tau_xy, duo.phi[sort_ballot(x + y)])
+                        + _multiply_with_absorbing_zero(tau_xz, duo.phi[sort_ballot(x + z)]))
+            score_z = (_multiply_with_absorbing_zero(tau_z, duo.phi[z])
+                       + _multiply_with_absorbing_zero(tau_xz, duo.phi[sort_ballot(x + z)])
+                       + _multiply_with_absorbing_zero(tau_yz, duo.phi[sort_ballot(y + z)]))
+        return score_xy, score_z
+
+    def _best_responses_approval(self, ranking):
+        """Best responses of the voters with this ranking in Approval, according to the limit pivot theorem.
+
+        This is a vectorized version of :meth:`BestResponseApproval.results_limit_pivot_theorem`, which is valid for
+        the tau-vectors without two consecutive zeros.
+
+        Returns
+        -------
+        thresholds : numpy.ndarray
+            The utility thresholds.
+        codes : numpy.ndarray
+            The justification codes (cf. :attr:`justification_codes`).
+        computed : numpy.ndarray
+            Array of Booleans. False in the (exceptional) cases where the offset method would need the trio
+            approximation correction.
+        """
+        i, j, k = ranking
+        easy_ij = getattr(self, 'pivot_%s_easy_or_tight' % sort_ballot(i + j))
+        easy_jk = getattr(self, 'pivot_%s_easy_or_tight' % sort_ballot(j + k))
+        thresholds = np.full(len(self), np.nan)
+        codes = np.full(len(self), -1)
+        computed = np.ones(len(self), dtype=bool)
+        both_easy = easy_ij & easy_jk
+        if np.any(both_easy):
+            # Both pivots are easy => We can forget the trios.
+            half_pivot_tij = getattr(self, 'pivot_tij_' + ranking).asymptotics * .5
+            half_pivot_tjk = getattr(self, 'pivot_tjk_' + ranking).asymptotics * .5
+            thresholds[both_easy] = (half_pivot_tij / (half_pivot_tij + half_pivot_tjk)).limit[both_easy]
+            codes[both_easy] = self._code(BestResponseApproval.ASYMPTOTIC_SIMPLIFIED)
+        thresholds[easy_ij & ~easy_jk] = 1.
+        codes[easy_ij & ~easy_jk] = self._code(BestResponseApproval.EASY_VS_DIFFICULT)
+        thresholds[~easy_ij & easy_jk] = 0.
+        codes[~easy_ij & easy_jk] = self._code(BestResponseApproval.DIFFICULT_VS_EASY)
+        both_difficult = ~easy_ij & ~easy_jk
+        if np.any(both_difficult):
+            # Offset method.
+            psi = self.trio.psi
+            psi_i, psi_j, psi_k = psi[i], psi[j], psi[k]
+            psi_ij, psi_ik = psi[sort_ballot(i + j)], psi[sort_ballot(i + k)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pij = (1 + psi_ik) / (1 - psi_k)
+                pjk = (1 + psi_j) * psi_i ** 2 / (1 - psi_i)
+                offset_thresholds = ((pij / 2 + psi_i / 3 + psi_ij / 6)
+                                     / (pij / 2 + pjk / 2 + psi_i * 2 / 3 + psi_ij / 3))
+            thresholds[both_difficult] = offset_thresholds[both_difficult]
+            codes[both_difficult] = self._code(BestResponseApproval.OFFSET_METHOD)
+            computed &= ~(both_difficult & ((psi_k >= 1) | (psi_i >= 1)))
+        return thresholds, codes, computed
+
+    def _best_responses_plurality(self, ranking):
+        """Vectorized version of :meth:`BestResponsePlurality.results`. Same outputs as
+        :meth:`_best_responses_approval`."""
+        tau_i, tau_j, tau_k = (getattr(self, candidate) for candidate in ranking)
+        thresholds = np.where((tau_i < tau_j) & (tau_i < tau_k), 0.,
+                              np.where((0 < tau_i) & (tau_i == tau_k) & (tau_k < tau_j), .5, 1.))
+        codes = np.full(len(self), self._code(BestResponsePlurality.PLURALITY_ANALYSIS))
+        return thresholds, codes, np.ones(len(self), dtype=bool)
+
+    def _best_responses_anti_plurality(self, ranking):
+        """Vectorized version of :meth:`BestResponseAntiPlurality.results`. Same outputs as
+        :meth:`_best_responses_approval`."""
+        i, j, k = ranking
+        tau_minus_i = getattr(self, sort_ballot(j + k))
+        tau_minus_j = getattr(self, sort_ballot(i + k))
+        tau_minus_k = getattr(self, sort_ballot(i + j))
+        thresholds = np.where((tau_minus_k > tau_minus_i) & (tau_minus_k > tau_minus_j), 1.,
+                              np.where((tau_minus_i == tau_minus_k) & (tau_minus_k > tau_minus_j), .5, 0.))
+        codes = np.full(len(self), self._code(BestResponseAntiPlurality.ANTI_PLURALITY_ANALYSIS))
+        return thresholds, codes, np.ones(len(self), dtype=bool)
+
+    @classmethod
+    def _code(cls, justification):
+        return cls.JUSTIFICATIONS.index(justification)
+
+    @cached_property
+    def _best_responses(self):
+        """tuple : Arrays of size `N` * 6: the utility thresholds and the justification codes."""
+        n = len(self)
+        thresholds = np.full((n, len(RANKINGS)), np.nan)
+        codes = np.full((n, len(RANKINGS)), -1)
+        if self.voting_rule == APPROVAL:
+            f, vectorized = self._best_responses_approval, self.is_interior
+        elif self.voting_rule == PLURALITY:
+            f, vectorized = self._best_responses_plurality, np.ones(n, dtype=bool)
+        elif self.voting_rule == ANTI_PLURALITY:
+            f, vectorized = self._best_responses_anti_plurality, np.ones(n, dtype=bool)
+        else:
+            raise NotImplementedError
+        if np.any(vectorized):
+            for r, ranking in enumerate(RANKINGS):
+                thresholds[:, r], codes[:, r], computed = f(ranking)
+                vectorized = vectorized & computed
+        for i in np.flatnonzero(~vectorized):
+            d_ranking_best_response = self[i].d_ranking_best_response
+            thresholds[i, :] = [float(d_ranking_best_response[ranking].utility_threshold) for ranking in RANKINGS]
+            codes[i, :] = [self._code(d_ranking_best_response[ranking].justification) for ranking in RANKINGS]
+        return thresholds, codes
+
+    @property
+    def utility_thresholds(self):
+        """numpy.ndarray : Array of size `N` * 6. The utility thresholds of the best responses, for the rankings in
+        the order of ``RANKINGS``. Cf. :attr:`BestResponse.utility_threshold`.
+
+        In Plurality and Anti-plurality, the computation is vectorized for all the tau-vectors. In Approval, it is
+        vectorized for all the tau-vectors in the interior of the simplex (except in the exceptional cases where the
+        offset method needs a correction of the trio approximation). For the other tau-vectors, the results are given
+        by :attr:`TauVector.d_ranking_best_response`.
+
+        Examples
+        --------
+            >>> taus = TauVectorArray([[0.1, 0, 0.3, 0.6, 0, 0],
+            ...                        [0.3, 0.1, 0.2, 0.1, 0.1, 0.2]])
+            >>> taus.utility_thresholds.round(6)
+            array([[1.      , 1.      , 0.      , 0.      , 1.      , 0.      ],
+                   [0.371516, 1.      , 0.      , 0.      , 1.      , 0.628484]])
+            >>> taus = TauVectorArray([[0.4, 0.4, 0.2, 0, 0, 0],
+            ...                        [0.2, 0.3, 0.5, 0, 0, 0]], voting_rule=PLURALITY)
+            >>> taus.utility_thresholds
+            array([[1., 1., 1., 1., 0., 0.],
+                   [0., 0., 1., 1., 1., 1.]])
+        """
+        return self._best_responses[0]
+
+    @property
+    def justification_codes(self):
+        """numpy.ndarray : Array of integers of size `N` * 6. The justifications of the best responses, for the
+        rankings in the order of ``RANKINGS``, given by their index in :attr:`JUSTIFICATIONS`. Cf.
+        :attr:`BestResponse.justification`.
+
+        Examples
+        --------
+            >>> taus = TauVectorArray([[0.1, 0, 0.3, 0.6, 0, 0],
+            ...                        [0.3, 0.1, 0.2, 0.1, 0.1, 0.2]])
+            >>> taus.justification_codes
+            array([[0, 0, 0, 0, 0, 0],
+                   [4, 2, 3, 3, 2, 4]])
+            >>> TauVectorArray.JUSTIFICATIONS[4]
+            'Offset method'
+        """
+        return self._best_responses[1]
+
+
+def _f_ballot_share(self, ballot):
+    """Shares of this ballot"""
+    # This function is used to define an attribute for each ballot.
+    return self.shares[:, BALLOTS_WITHOUT_INVERSIONS.index(sort_ballot(ballot))]
+
+
+for my_ballot in BALLOTS_WITH_INVERSIONS:
+    setattr(TauVectorArray, my_ballot, property(partial(_f_ballot_share, ballot=my_ballot)))
+    getattr(TauVectorArray, my_ballot).__doc__ = "numpy.ndarray: Shares of the ballot ``'%s'``." % sort_ballot(
+        my_ballot)
+
+
+# Vectorized formulas. The inputs are arrays where all the shares are positive.
+
+
+def _multiply_with_absorbing_zero(x, y):
+    """Vectorized version of :meth:`ComputationEngine.multiply_with_absorbing_zero`."""
+    return np.where((x == 0) | (y == 0), 0., x * y)
+
+
+def _f_duo(self, candidate_x, candidate_y, candidate_z, stub):
+    if candidate_x > candidate_y:
+        return getattr(self, stub + '_%s%s' % (candidate_y, candidate_x))
+    x, y, z = candidate_x, candidate_y, candidate_z
+    tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz = self._taus_xyz(x, y, z)
+    interior = self.is_interior
+    n = len(self)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w_x = tau_x + tau_xz
+        w_y = tau_y + tau_yz
+        asymptotic = AsymptoticArray.poisson_eq(w_x, w_y)
+        ratio_x = np.sqrt(w_y / w_x)
+        ratio_y = np.sqrt(w_x / w_y)
+        if stub == 'duo':
+            return self._event_array(stub + '_%s%s' % (x, y), x, y, z, asymptotic,
+                                     [ratio_x, ratio_y, np.ones(n), np.ones(n), ratio_x, ratio_y], vectorized=interior)
+        if stub == 'trio_2t':
+            trio = self.trio
+            psi_xy = trio.psi[sort_ballot(x + y)]
+            return self._event_array(
+                stub + '_%s%s' % (x, y), x, y, z, trio.asymptotics * psi_xy,
+                phi_xyz=[trio.phi[sort_ballot(label)] for label in [x, y, z, x + y, x + z, y + z]], vectorized=interior)
+        # Weak or strict pivot
+        s_x = tau_xy + tau_x * ratio_x
+        s_z = tau_z + tau_yz * ratio_y
+        tight = np.isclose(s_x, s_z, rtol=1e-9, atol=0)
+        easy_or_tight = tight | (s_x > s_z)
+        if np.any(interior & ~easy_or_tight):
+            trio = self.trio
+        else:
+            # No difficult pivot: the trio is not needed.
+            trio = EventArray(x, y, z, mu=np.full(n, np.nan), nu=np.full(n, np.nan), xi=np.full(n, np.nan),
+                              phi={label: np.full(n, np.nan) for label in BALLOTS_WITHOUT_INVERSIONS})
+        psi_z = trio.psi[z]
+        # The inputs of Asymptotic are: 1 / 2 for a tight pivot, and a function of psi_z for a difficult pivot.
+        if stub == 'pivot_weak':
+            factor = np.where(easy_or_tight, np.where(tight, 0.5, 1.), 1 / (1 - psi_z))
+        else:  # stub == 'pivot_strict'
+            factor = np.where(easy_or_tight, np.where(tight, 0.5, 1.), psi_z / (1 - psi_z))
+        asymptotic = AsymptoticArray(mu=np.where(easy_or_tight, asymptotic.mu, trio.mu),
+                                     nu=np.where(easy_or_tight, asymptotic.nu, trio.nu),
+                                     xi=np.where(easy_or_tight, asymptotic.xi, trio.xi)) * factor
+        phi_xyz = [
+            np.where(easy_or_tight, phi_easy, trio.phi[sort_ballot(label)])
+            for phi_easy, label in zip([ratio_x, ratio_y, np.ones(n), np.ones(n), ratio_x, ratio_y],
+                                       [x, y, z, x + y, x + z, y + z])
+        ]
+    return self._event_array(stub + '_%s%s' % (x, y), x, y, z, asymptotic, phi_xyz, vectorized=interior)
+
+
+for event_stub, event_doc in [
+        ('duo', 'EventArray : Event where these two candidates have the same score.'),
+        ('pivot_weak',
+            'EventArray : Event where these two candidates have the same score, at least as high as the remaining '
+            'candidate.'),
+        ('pivot_strict',
+            'EventArray : Event where these two candidates have the same score, strictly higher than the remaining '
+            'candidate.'),
+        ('trio_2t', 'EventArray : Event where these candidates have one vote less than the remaining candidate.')]:
+    for my_x, my_y, my_z in RANKINGS:
+        name = event_stub + '_%s%s' % (my_x, my_y)
+        setattr(TauVectorArray, name, partial(_f_duo, candidate_x=my_x, candidate_y=my_y, candidate_z=my_z,
+                                              stub=event_stub))
+        getattr(TauVectorArray, name).__name__ = name
+        setattr(TauVectorArray, name, cached_property(getattr(TauVectorArray, name)))
+        getattr(TauVectorArray, name).__doc__ = event_doc
+
+
+def _f_ranking(self, candidate_x, candidate_y, candidate_z, name):
+    x, y, z = candidate_x, candidate_y, candidate_z
+    stub = name.rsplit('_', 1)[0]
+    if stub == 'trio_1t':
+        base = self.trio
+        factor = base.psi[x]
+    else:
+        base = getattr(self, 'pivot_weak_' + sort_ballot(x + y))
+        if stub == 'pivot_tij':
+            factor = 1 + base.phi[sort_ballot(x + z)]
+        else:  # stub == 'pivot_tjk'
+            factor = base.phi[z] ** 2 * (1 + base.phi[y])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return self._event_array(
+            name, x, y, z, base.asymptotics * factor,
+            phi_xyz=[base.phi[sort_ballot(label)] for label in [x, y, z, x + y, x + z, y + z]],
+            vectorized=self.is_interior)
+
+
+for event_stub, event_doc in [
+        ('pivot_tij', 'EventArray: Personalized pivot of type Tij (between the two most-liked candidates).'),
+        ('pivot_tjk', 'EventArray: Personalized pivot of type Tjk (between the two least-liked candidates).')]:
+    for my_x, my_y, my_z in RANKINGS:
+        name = event_stub + '_%s%s%s' % (my_x, my_y, my_z)
+        if event_stub == 'pivot_tjk':
+            setattr(TauVectorArray, name, partial(_f_ranking, candidate_x=my_z, candidate_y=my_y, candidate_z=my_x,
+                                                  name=name))
+        else:
+            setattr(TauVectorArray, name, partial(_f_ranking, candidate_x=my_x, candidate_y=my_y, candidate_z=my_z,
+                                                  name=name))
+        getattr(TauVectorArray, name).__name__ = name
+        setattr(TauVectorArray, name, cached_property(getattr(TauVectorArray, name)))
+        getattr(TauVectorArray, name).__doc__ = event_doc
+
+
+for my_x, my_y, my_z in RANKINGS:
+    if my_y > my_z:
+        continue
+    name = 'trio_1t_%s' % my_x
+    setattr(TauVectorArray, name, partial(_f_ranking, candidate_x=my_x, candidate_y=my_y, candidate_z=my_z,
+                                          name=name))
+    getattr(TauVectorArray, name).__name__ = name
+    setattr(TauVectorArray, name, cached_property(getattr(TauVectorArray, name)))
+    getattr(TauVectorArray, name).__doc__ = 'EventArray : Event where this candidate has one vote less than the two ' \
+                                            'others.'
+
+
+def _f_pivot_easy_or_tight(self, candidate_x, candidate_y, candidate_z):
+    score_xy, score_z = self._score_pair_and_other_in_duo(candidate_x, candidate_y, candidate_z)
+    return (score_xy > score_z) | _look_equal(score_xy, score_z)
+
+
+for my_x, my_y, my_z in RANKINGS:
+    if my_x > my_y:
+        continue
+    name = 'pivot_%s%s_easy_or_tight' % (my_x, my_y)
+    setattr(TauVectorArray, name, partial(_f_pivot_easy_or_tight, candidate_x=my_x, candidate_y=my_y,
+                                          candidate_z=my_z))
+    getattr(TauVectorArray, name).__name__ = name
+    setattr(TauVectorArray, name, cached_property(getattr(TauVectorArray, name)))
+    getattr(TauVectorArray, name).__doc__ = ('numpy.ndarray : Array of Booleans. True if the pivot `%s%s` is easy or '
+                                             'tight, False if it is difficult.' % (my_x, my_y))
@@ -0,0 +1,164 @@
+import threading
+from collections import OrderedDict
+from poisson_approval.constants.basic_constants import *
+from poisson_approval.utils.UtilBallots import sort_ballot
+
+
+class TauVectorCache:
+    """A bounded LRU cache of tau-vectors.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximal number of tau-vectors kept in the cache. When the cache is full, the least recently used
+        tau-vector is discarded.
+
+    Attributes
+    ----------
+    hits : int
+        Number of times a tau-vector was found in the cache.
+    misses : int
+        Number of times a tau-vector was not found in the cache.
+
+    Notes
+    -----
+    The key of a tau-vector is the tuple of its (non-normalized) ballot shares, in the order of
+    ``BALLOTS_WITHOUT_INVERSIONS``, together with the voting rule and the argument `symbolic`. The type of each share
+    is also part of the key, so that e.g. ``Fraction(1, 2)`` and ``0.5`` give different tau-vectors.
+
+    The cache can be shared between threads. When it is pickled, e.g. to be sent to a worker process, the copy is
+    independent.
+
+    In general, you do not need to use this class directly: cf. :meth:`TauVector.enable_cache`.
+
+    Examples
+    --------
+        >>> from poisson_approval import TauVector
+        >>> cache = TauVectorCache(max_size=2)
+        >>> tau = TauVector({'a': 0.5, 'b': 0.5})
+        >>> cache.get({'a': 0.5, 'b': 0.5}) is None
+        True
+        >>> cache.put({'a': 0.5, 'b': 0.5}, tau=tau)
+        >>> cache.get({'b': 0.5, 'a': 0.5}) is tau
+        True
+        >>> cache.put({'a': 0.2, 'b': 0.8}, tau=TauVector({'a': 0.2, 'b': 0.8}))
+        >>> cache.put({'a': 0.6, 'b': 0.4}, tau=TauVector({'a': 0.6, 'b': 0.4}))
+        >>> cache.get({'a': 0.5, 'b': 0.5}) is None
+        True
+        >>> cache
+        TauVectorCache(max_size=2, size=2, hits=1, misses=2)
+        >>> cache.clear()
+        >>> cache
+        TauVectorCache(max_size=2, size=0, hits=0, misses=0)
+    """
+
+    def __init__(self, max_size=1024):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        self.max_size = max_size
+        self._d_key_tau = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # The lock cannot be pickled, e.g. to send the cache to a worker process.
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(d_ballot_share, voting_rule=APPROVAL, symbolic=False):
+        """Key of a tau-vector.
+
+        Parameters
+        ----------
+        d_ballot_share : dict
+            Ballot distribution, as in :class:`TauVector`.
+        voting_rule : str
+            The voting rule.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
+
+        Returns
+        -------
+        tuple
+            The key.
+
+        Examples
+        --------
+            >>> TauVectorCache.key({'a': 0.25, 'ba': 0.75})
+            (('float', 0.25), ('int', 0), ('int', 0), ('float', 0.75), ('int', 0), ('int', 0), 'Approval', False)
+        """
+        d_ballot_share_sorted = {ballot: 0 for ballot in BALLOTS_WITHOUT_INVERSIONS}
+        for ballot, share in d_ballot_share.items():
+            d_ballot_share_sorted[sort_ballot(ballot)] += share
+        return tuple((type(share).__name__, share) for share in d_ballot_share_sorted.values()) + (
+            voting_rule, symbolic)
+
+    def get(self, d_ballot_share, voting_rule=APPROVAL, symbolic=False):
+        """Get a tau-vector from the cache.
+
+        Parameters
+        ----------
+        d_ballot_share : dict
+            Ballot distribution, as in :class:`TauVector`.
+        voting_rule : str
+            The voting rule.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
+
+        Returns
+        -------
+        TauVector or None
+            The tau-vector if it is in the cache, None otherwise.
+        """
+        key = self.key(d_ballot_share, voting_rule, symbolic)
+        with self._lock:
+            try:
+                tau = self._d_key_tau[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._d_key_tau.move_to_end(key)
+            self.hits += 1
+            return tau
+
+    def put(self, d_ballot_share, tau, voting_rule=APPROVAL, symbolic=False):
+        """Put a tau-vector in the cache.
+
+        Parameters
+        ----------
+        d_ballot_share : dict
+            Ballot distribution, as in :class:`TauVector`.
+        tau : TauVector
+            The tau-vector.
+        voting_rule : str
+            The voting rule.
+        symbolic : bool or str
+            Whether the computations are symbolic or numeric (cf. :func:`computation_engine`).
+        """
+        key = self.key(d_ballot_share, voting_rule, symbolic)
+        with self._lock:
+            self._d_key_tau[key] = tau
+            self._d_key_tau.move_to_end(key)
+            while len(self._d_key_tau) > self.max_size:
+                self._d_key_tau.popitem(last=False)
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        with self._lock:
+            self._d_key_tau.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._d_key_tau)
+
+    def __repr__(self):
+        return 'TauVectorCache(max_size=%s, size=%s, hits=%s, misses=%s)' % (
+            self.max_size, len(self), self.hits, self.misses)
@@ -22,6 +22,9 @@ class ComputationEngine(ABC):
     pi = None
     """Pi."""
 
+    symbolic = None
+    """Whether the computation is symbolic."""
+
     # Functions
 
     @classmethod
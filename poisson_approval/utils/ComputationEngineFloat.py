@@ -0,0 +1,145 @@
+import math
+import numpy as np
+from poisson_approval.utils.ComputationEngine import ComputationEngine
+
+
+class ComputationEngineFloat(ComputationEngine):
+    """Computation engine: computation with floats only.
+
+    This engine converts all the numbers to floats and never tries to simplify them. It is less exact than
+    :class:`ComputationEngineNumeric`, which preserves fractions when possible, but faster:
+
+        >>> ce = ComputationEngineFloat
+        >>> ce.inf
+        inf
+        >>> ce.nan
+        nan
+        >>> ce.exp(3)
+        20.085536923187668
+        >>> ce.log(3)
+        1.0986122886681098
+        >>> ce.Rational(1, 3)
+        0.3333333333333333
+        >>> ce.S(1)
+        1.0
+        >>> ce.simplify(- ce.Rational(1, 10) - (- ce.sqrt(15) / 5 + ce.sqrt(30) / 10)**2)
+        -0.151471862576143
+        >>> ce.sqrt(3)
+        1.7320508075688772
+        >>> ce.factorial(3)
+        6.0
+
+    Usage of :meth:`look_equal`:
+
+        >>> ce.look_equal(1, 0.999999999999)
+        True
+        >>> ce.look_equal(ce.Rational(1, 3), 1 / 3)
+        True
+
+    Usage of :meth:`multiply_with_absorbing_zero`:
+
+        >>> ce.multiply_with_absorbing_zero(0, ce.nan)
+        0.0
+        >>> ce.multiply_with_absorbing_zero(2, 3)
+        6.0
+
+    To use this engine, define a tau-vector or a profile with ``symbolic=FLOAT``. In that case, the shares are
+    converted to floats:
+
+        >>> from poisson_approval import TauVector, FLOAT
+        >>> from fractions import Fraction
+        >>> tau = TauVector({'a': Fraction(1, 4), 'ab': Fraction(3, 4)}, symbolic=FLOAT)
+        >>> tau.a
+        0.25
+        >>> tau.ce.__name__
+        'ComputationEngineFloat'
+    """
+
+    # Constants
+
+    inf = np.inf
+    nan = np.nan
+    pi = math.pi
+    symbolic = False
+
+    # Functions
+
+    @classmethod
+    def barycenter(cls, a, b, ratio_b):
+        """Barycenter.
+
+        Parameters
+        ----------
+        a : Number
+        b : Number or iterable
+        ratio_b : Number or iterable
+            The ratio of `b` in the result. If an iterable, must be the same size as `b`.
+
+        Returns
+        -------
+        float
+            The result of `(1 - ratio_b) * a + ratio_b * b`. If `b` and `ratio_b` are iterable, return
+            `(1 - sum(ratio_b)) * a + sum(ratio_b * b)`. As in the other engines, 0 is absorbing, even if the other
+            factor is infinite or `nan`.
+
+        Examples
+        --------
+            >>> ComputationEngineFloat.barycenter(0.1, 0.7, 0)
+            0.1
+            >>> ComputationEngineFloat.barycenter(0, [-1, 1], [0.25, 0.5])
+            0.25
+        """
+        return super().barycenter(a, b, ratio_b)
+
+    @classmethod
+    def exp(cls, x):
+        return math.exp(x)
+
+    @classmethod
+    def factorial(cls, x):
+        return float(math.factorial(x))
+
+    @classmethod
+    def log(cls, x):
+        return math.log(x)
+
+    @classmethod
+    def look_equal(cls, x, y, *args, **kwargs):
+        """Test if two numbers can reasonably be considered as equal.
+
+        Return ``math.isclose(x, y, *args, **kwargs)``, whatever the types of `x` and `y`.
+        """
+        return math.isclose(x, y, *args, **kwargs)
+
+    @classmethod
+    def multiply_with_absorbing_zero(cls, x, y):
+        """Multiplication with absorbing zero.
+
+        Cf. :meth:`ComputationEngine.multiply_with_absorbing_zero`. The only difference is that the numbers are not
+        simplified before the test.
+        """
+        return 0. if x == 0 or y == 0 else float(x * y)
+
+    @classmethod
+    def ones(cls, *args, **kwargs):
+        return np.ones(*args, **kwargs, dtype=float)
+
+    @classmethod
+    def Rational(cls, x, y):
+        return x / y
+
+    @classmethod
+    def S(cls, x):
+        return float(x)
+
+    @classmethod
+    def simplify(cls, x):
+        return x
+
+    @classmethod
+    def sqrt(cls, x):
+        return math.sqrt(x)
+
+    @classmethod
+    def zeros(cls, *args, **kwargs):
+        return np.zeros(*args, **kwargs, dtype=float)
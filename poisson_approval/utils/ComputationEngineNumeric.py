@@ -1,6 +1,5 @@
 import math
 import numpy as np
-import sympy as sp
 from fractions import Fraction
 from poisson_approval.utils.ComputationEngine import ComputationEngine
 
@@ -30,6 +29,7 @@ class ComputationEngineNumeric(ComputationEngine):
 
     Usage of :meth:`look_equal`:
 
+        >>> import sympy as sp
         >>> ce.look_equal(1, 0.999999999999)
         True
         >>> ce.look_equal(1, np.float(0.999999999999))
@@ -47,6 +47,7 @@ class ComputationEngineNumeric(ComputationEngine):
     inf = np.inf
     nan = np.nan
     pi = math.pi
+    symbolic = False
 
     # Functions
 
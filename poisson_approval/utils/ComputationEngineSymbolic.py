@@ -47,6 +47,7 @@ class ComputationEngineSymbolic(ComputationEngine):
     inf = sp.oo
     nan = sp.nan
     pi = sp.pi
+    symbolic = True
 
     # Functions
 
@@ -1,8 +1,8 @@
+import sys
 import math
 import random
 import itertools
 import numpy as np
-import sympy as sp
 from fractions import Fraction
 from decimal import Decimal
 from poisson_approval.constants.basic_constants import *
@@ -261,6 +261,15 @@ def image_distribution(factory, n_samples, f, conditional_on=None):
                                 for result, occurrences in d_result_occurrences.items()})
 
 
+def _sympy():
+    """The module `sympy` if it is already imported, None otherwise.
+
+    If `sympy` is not imported, no object can be a `sympy` expression: hence there is no need to import it, which is
+    slow.
+    """
+    return sys.modules.get('sympy')
+
+
 def _false_for_fraction(f):
     """Decorator to return False when the input is a Fraction (cf. usages below)."""
     def _f(x):
@@ -290,6 +299,7 @@ def isnan(x):
 
     Examples
     --------
+        >>> import sympy as sp
         >>> values = [sp.sqrt(3) - sp.sqrt(2), sp.nan,
         ...           sp.oo, - sp.oo,
         ...           sp.Rational(3, 5), Fraction(3, 5),
@@ -297,7 +307,8 @@ def isnan(x):
         >>> print([x for x in values if isnan(x)])
         [nan, nan]
     """
-    if isinstance(x, sp.Expr):
+    sp = _sympy()
+    if sp is not None and isinstance(x, sp.Expr):
         return x == sp.nan
     else:
         return np.isnan(x)
@@ -322,6 +333,7 @@ def isposinf(x):
 
     Examples
     --------
+        >>> import sympy as sp
         >>> values = [sp.sqrt(3) - sp.sqrt(2), sp.nan,
         ...           sp.oo, - sp.oo,
         ...           sp.Rational(3, 5), Fraction(3, 5),
@@ -329,7 +341,8 @@ def isposinf(x):
         >>> print([x for x in values if isposinf(x)])
         [oo, inf]
     """
-    if isinstance(x, sp.Expr):
+    sp = _sympy()
+    if sp is not None and isinstance(x, sp.Expr):
         return x == sp.oo
     else:
         return np.isposinf(x)
@@ -354,6 +367,7 @@ def isneginf(x):
 
     Examples
     --------
+        >>> import sympy as sp
         >>> values = [sp.sqrt(3) - sp.sqrt(2), sp.nan,
         ...           sp.oo, - sp.oo,
         ...           sp.Rational(3, 5), Fraction(3, 5),
@@ -361,7 +375,8 @@ def isneginf(x):
         >>> print([x for x in values if isneginf(x)])
         [-oo, -inf]
     """
-    if isinstance(x, sp.Expr):
+    sp = _sympy()
+    if sp is not None and isinstance(x, sp.Expr):
         return x == - sp.oo
     else:
         return np.isneginf(x)
@@ -696,6 +711,7 @@ def my_division(x, y):
         Fraction(4, 5)
         >>> my_division(Decimal('0.1'), Fraction(5, 2))
         Fraction(1, 25)
+        >>> import sympy as sp
         >>> my_division(sp.sqrt(3), 2)
         sqrt(3)/2
 
@@ -713,12 +729,13 @@ def my_division(x, y):
         raise ZeroDivisionError('division by zero')
     if isinstance(x, float) or isinstance(y, float):
         return x / y
-    if not isinstance(x, sp.Rational):
+    sp = _sympy()
+    if sp is None or not isinstance(x, sp.Rational):
         try:
             x = Fraction(x)
         except (TypeError, ValueError):
             pass
-    if not isinstance(y, sp.Rational):
+    if sp is None or not isinstance(y, sp.Rational):
         try:
             y = Fraction(y)
         except (TypeError, ValueError):
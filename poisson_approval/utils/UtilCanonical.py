@@ -0,0 +1,64 @@
+import hashlib
+import types
+import numpy as np
+from functools import partial
+
+
+def canonical_form(o, _seen=None):
+    """Canonical representation of an object, that does not depend on the session.
+
+    It is used to identify the parameters of a computation across sessions, e.g. for the files of
+    :class:`HeatmapCache` or of :class:`MonteCarloStream`.
+
+    Dictionaries and sets are sorted. Classes and built-in functions are identified by their qualified name. Python
+    functions (including lambdas and closures) are identified by their qualified name, their code, their default
+    arguments and the contents of their closure; note that the global variables they use are not taken into account.
+    Partial functions and bound methods are identified by their components. Numpy arrays are identified by their
+    type, their shape and a hash of their data. Other objects with attributes and without a specific ``__repr__``
+    (such as :class:`SimplexToProfile`) are identified by their class and their attributes.
+
+    Examples
+    --------
+        >>> from fractions import Fraction
+        >>> canonical_form({'b': Fraction(1, 2), 'a': [1, 2.5]})
+        (("'a'", ('1', '2.5')), ("'b'", 'Fraction(1, 2)'))
+        >>> canonical_form(lambda x: x + 1) == canonical_form(lambda x: x + 2)
+        False
+        >>> canonical_form(np.zeros(2000)) == canonical_form(np.concatenate((np.zeros(1999), [1])))
+        False
+    """
+    if _seen is None:
+        _seen = set()
+    if id(o) in _seen:
+        # Recursive structure, e.g. a local function that calls itself.
+        return 'recursion'
+    if isinstance(o, dict):
+        return tuple(sorted(((canonical_form(k, _seen), canonical_form(v, _seen)) for k, v in o.items()), key=repr))
+    if isinstance(o, (set, frozenset)):
+        return tuple(sorted((canonical_form(x, _seen) for x in o), key=repr))
+    if isinstance(o, (list, tuple)):
+        return tuple(canonical_form(x, _seen) for x in o)
+    if isinstance(o, np.ndarray):
+        if o.dtype == object:
+            return 'ndarray', o.shape, canonical_form(o.tolist(), _seen)
+        return 'ndarray', o.dtype.str, o.shape, hashlib.sha256(np.ascontiguousarray(o).tobytes()).hexdigest()
+    if isinstance(o, types.CodeType):
+        return ('code', hashlib.sha256(o.co_code).hexdigest(), o.co_names,
+                tuple(canonical_form(x, _seen) for x in o.co_consts))
+    if isinstance(o, types.FunctionType):
+        _seen = _seen | {id(o)}
+        closure = tuple(cell.cell_contents for cell in o.__closure__ or ())
+        return ('function', o.__module__, o.__qualname__, canonical_form(o.__code__, _seen),
+                canonical_form(o.__defaults__, _seen), canonical_form(o.__kwdefaults__, _seen),
+                canonical_form(closure, _seen))
+    if isinstance(o, partial):
+        return ('partial', canonical_form(o.func, _seen), canonical_form(o.args, _seen),
+                canonical_form(o.keywords, _seen))
+    if isinstance(o, types.MethodType):
+        return 'method', canonical_form(o.__func__, _seen), canonical_form(o.__self__, _seen | {id(o)})
+    if isinstance(o, type) or callable(o) and hasattr(o, '__qualname__'):
+        return '%s.%s' % (o.__module__, o.__qualname__)
+    if type(o).__repr__ is object.__repr__ and hasattr(o, '__dict__'):
+        _seen = _seen | {id(o)}
+        return canonical_form(type(o), _seen), canonical_form(vars(o), _seen)
+    return repr(o)
@@ -7,7 +7,7 @@ from poisson_approval.utils.Util import my_division
 
 
 def masks_area_naive(inf, sup, masks):
-    """Area of some masks. Naive implementation (used as a sanity test for the recursive implementation)
+    """Area of some masks. Naive implementation (used as a sanity test for :meth:`masks_area`)
 
     Notes
     -----
@@ -37,7 +37,7 @@ def masks_area_naive(inf, sup, masks):
 
 
 def masks_area(inf, sup, masks):
-    """Area of some masks (recursive `divide and conquer` implementation).
+    """Area of some masks (deterministic sweep with memoization).
 
     We denote by `d` the dimension of the Euclidean space under study.
 
@@ -57,6 +57,11 @@ def masks_area(inf, sup, masks):
     float
         The area of `Intersection(bounding rectangle, Union(masks))`.
 
+    Notes
+    -----
+    Cf. :class:`_MasksSweep` for the algorithm. The result is exact with fractions, and the cost does not depend
+    on any random choice.
+
     Examples
     --------
     In the following example, the bounding rectangle is the set of points where `0 <= x_1 <= 1` and `0 <= x_2 <= 2`.
@@ -71,26 +76,47 @@ def masks_area(inf, sup, masks):
         >>> Fraction(8, 10) * Fraction(6, 10) + Fraction(3, 10) * Fraction(16, 10) - Fraction(1, 10) * Fraction(2, 10)
         Fraction(47, 50)
     """
-    dim = len(inf)
-    # Is there a mask covering everything?
-    if any([all([(mask[d][0] <= inf[d]) if mask[d][1] else (mask[d][0] >= sup[d]) for d in range(dim)])
-            for mask in masks]):
-        return np.prod([high - low for (low, high) in zip(inf, sup)])
-    # Eliminate empty masks
-    new_masks = [mask for mask in masks
-                 if not any([(mask[d][0] >= sup[d]) if mask[d][1] else (mask[d][0] <= inf[d]) for d in range(dim)])]
-    if not new_masks:
-        return 0
-    mask = random.choice(new_masks)
-    d_lim = random.choice([d for d in range(dim) if inf[d] < mask[d][0] < sup[d]])
-    lim = mask[d_lim][0]
-    return (masks_area(inf, [lim if d == d_lim else sup[d] for d in range(dim)], new_masks)
-            + masks_area([lim if d == d_lim else inf[d] for d in range(dim)], sup, new_masks))
+    return _MasksSweep(inf, sup, masks).area()
+
+
+def masks_cells(inf, sup, masks):
+    """Decomposition of the bounding rectangle according to the masks that cover each point.
+
+    Parameters
+    ----------
+    inf, sup, masks
+        Cf. :meth:`masks_area`.
+
+    Returns
+    -------
+    dict
+        Key: a frozenset of indices of masks. Value: the area of the set of points of the bounding rectangle that
+        are covered by exactly these masks. Keys with a null area are omitted.
+
+    Notes
+    -----
+    Cf. :class:`_MasksSweep` for the algorithm. This decomposition is sufficient to compute :meth:`masks_area`,
+    :meth:`masks_distribution` and :meth:`winners_distribution`, but also any other statistic that depends only on the
+    set of masks that cover each point.
+
+    Examples
+    --------
+        >>> cells = masks_cells(inf=[0, 0], sup=[1, 2],
+        ...                     masks=[[(Fraction(2, 10), True), (Fraction(6, 10), False)],
+        ...                            [(Fraction(3, 10), False), (Fraction(4, 10), True)]])
+        >>> for covering in sorted(cells.keys(), key=sorted):
+        ...     print(sorted(covering), cells[covering])
+        [] 53/50
+        [0] 23/50
+        [0, 1] 1/50
+        [1] 23/50
+    """
+    return _MasksSweep(inf, sup, masks).cells()
 
 
 def masks_distribution_naive(inf, sup, masks):
-    """Distribution of the number of masks. Naive implementation (used as a sanity test for the recursive
-    implementation)
+    """Distribution of the number of masks. Naive implementation (used as a sanity test for
+    :meth:`masks_distribution`)
 
     Notes
     -----
@@ -115,7 +141,7 @@ def masks_distribution_naive(inf, sup, masks):
         [(my_division(limits[d][i + 1] + limits[d][i], 2),
           limits[d][i + 1] - limits[d][i]) for i in range(len(limits[d]) - 1)]
         for d in range(dim)]
-    histogram = [0 for _ in range(dim + 1)]
+    histogram = [0 for _ in range(len(masks) + 1)]
     for point in product(*medians_and_lengths):
         n_masks = np.sum([all([(point[d][0] > mask[d][0]) == mask[d][1] for d in range(dim)]) for mask in masks])
         area = np.prod([point[d][1] for d in range(dim)])
@@ -124,7 +150,7 @@ def masks_distribution_naive(inf, sup, masks):
 
 
 def masks_distribution(inf, sup, masks, cover_alls=0):
-    """Distribution of the number of masks (recursive `divide and conquer` implementation).
+    """Distribution of the number of masks (deterministic sweep with memoization).
 
     We denote by `d` the dimension of the Euclidean space under study.
 
@@ -147,6 +173,10 @@ def masks_distribution(inf, sup, masks, cover_alls=0):
     list
         A list. The `i`-th coefficient is the area covered by `i` masks exactly (and in the bounding rectangle).
 
+    Notes
+    -----
+    Cf. :class:`_MasksSweep` for the algorithm.
+
     Examples
     --------
     In the following example, the bounding rectangle is the set of points where `0 <= x_1 <= 1 and 0 <= x_2 <= 2`.
@@ -164,68 +194,19 @@ def masks_distribution(inf, sup, masks, cover_alls=0):
         >>> histogram
         array([1.06, 0.92, 0.02])
     """
-    result = _masks_distribution_aux(inf, sup, masks, histogram=None, cover_alls=cover_alls)
+    cells = masks_cells(inf, sup, masks)
+    result = [0 for _ in range(cover_alls + len(masks) + 1)]
+    for covering, area in cells.items():
+        result[cover_alls + len(covering)] += area
+    result = np.array(result)
     last_non_zero = result.size - 1
     while result[last_non_zero] == 0:
         last_non_zero -= 1
     return result[:last_non_zero + 1]
 
 
-def _masks_distribution_aux(inf, sup, masks, histogram=None, cover_alls=0):
-    """Distribution of the number of masks (recursive `divide and conquer` implementation).
-
-    We denote by `d` the dimension of the Euclidean space under study.
-
-    Parameters
-    ----------
-    inf : list of Number
-        A list of `d` numbers. The inf limit of the bounding rectangle in each dimension.
-    sup : list of Number
-        A list of `d` numbers. The sup limit of the bounding rectangle in each dimension.
-    masks : list of list of tuple
-        A list of masks. Each mask is a list of `d` pairs `(lim, direction)`, where `lim` is the limit
-        of the mask, and `direction` is a Boolean: `True` (resp `False`) means that the points of the mask
-        meet the condition `x_d >= lim` (resp. `x_d <= lim`).
-    histogram : list, optional
-        This parameter should only be used for recursive calls. If specified, then instead of creating a new list for
-        the output, it is added to the given list `histogram`.
-    cover_alls : int, optional
-        This parameter should only be used for recursive calls. If specified, then we consider that we have this number
-        of implicit masks (i.e. not given in the argument `masks`) that cover the whole area.
-
-    Returns
-    -------
-    list
-        A list of length `d + 1`. The `i`-th coefficient is the area covered by `i` masks exactly (and in the bounding
-        rectangle).
-    """
-    dim = len(inf)
-    if histogram is None:
-        histogram = [0 for _ in range(dim + 1)]
-    # Eliminate empty masks
-    new_masks = [mask for mask in masks
-                 if not any([(mask[d][0] >= sup[d]) if mask[d][1] else (mask[d][0] <= inf[d]) for d in range(dim)])]
-    # Detect the new cover-alls (masks covering everything)
-    cover_alls += np.sum([all([(mask[d][0] <= inf[d]) if mask[d][1] else (mask[d][0] >= sup[d]) for d in range(dim)])
-                          for mask in new_masks], dtype=int)
-    new_masks = [mask for mask in new_masks
-                 if not all([(mask[d][0] <= inf[d]) if mask[d][1] else (mask[d][0] >= sup[d]) for d in range(dim)])]
-    if not new_masks:
-        area = np.prod([high - low for (low, high) in zip(inf, sup)])
-        histogram[cover_alls] += area
-    else:
-        mask = random.choice(new_masks)
-        d_lim = random.choice([d for d in range(dim) if inf[d] < mask[d][0] < sup[d]])
-        lim = mask[d_lim][0]
-        _masks_distribution_aux(inf, [lim if d == d_lim else sup[d] for d in range(dim)], new_masks,
-                                histogram, cover_alls)
-        _masks_distribution_aux([lim if d == d_lim else inf[d] for d in range(dim)], sup, new_masks,
-                                histogram, cover_alls)
-    return np.array(histogram)
-
-
 def winners_distribution(inf, sup, masks_winners, histogram=None, cover_alls=None):
-    """Distribution of the number of winners (recursive `divide and conquer` implementation).
+    """Distribution of the number of winners (deterministic sweep with memoization).
 
     We denote by `d` the dimension of the Euclidean space under study.
 
@@ -239,17 +220,19 @@ def winners_distribution(inf, sup, masks_winners, histogram=None, cover_alls=Non
         A list of pairs `(mask, winners)`. A mask is defined as usual (cf. :meth:`masks_area` for instance).
         A winner is a set of winning candidates in this mask, e.g. ``{'a', 'b'}``.
     histogram : list
-        This parameter should only be used for recursive calls. If specified, then instead of creating a new list for
-        the output, it is added to the given list `histogram`.
+        If specified, then instead of creating a new list for the output, it is added to the given list `histogram`.
     cover_alls : set
-        E.g. {'a', 'b'}. This parameter should only be used for recursive calls. If specified, then we consider that
-        we have all these candidates winning in the whole area.
+        E.g. {'a', 'b'}. If specified, then we consider that we have all these candidates winning in the whole area.
 
     Returns
     -------
     list
         A list of length 4. The `i`-th coefficient is the area where `i` candidates may win.
 
+    Notes
+    -----
+    Cf. :class:`_MasksSweep` for the algorithm.
+
     Examples
     --------
     In the following example, the bounding rectangle is the set of points where `0 <= x_1 <= 1 and 0 <= x_2 <= 2`.
@@ -270,36 +253,191 @@ def winners_distribution(inf, sup, masks_winners, histogram=None, cover_alls=Non
         >>> histogram
         array([1.06, 0.46, 0.48, 0.  ])
     """
-    dim = len(inf)
     if histogram is None:
         histogram = [0, 0, 0, 0]
     if cover_alls is None:
         cover_alls = set()
-    # Eliminate empty masks
-    new_mw = [(mask, winners) for mask, winners in masks_winners
-              if not any([(mask[d][0] >= sup[d]) if mask[d][1] else (mask[d][0] <= inf[d]) for d in range(dim)])
-              and not winners.issubset(cover_alls)]
-    # Detect the new cover-alls (masks covering everything)
-    toto = set.union(*([set()] + [
-        winners
-        for mask, winners in new_mw
-        if all([(mask[d][0] <= inf[d]) if mask[d][1] else (mask[d][0] >= sup[d]) for d in range(dim)])
-    ]))
-    cover_alls = cover_alls.union(toto)
-    new_mw = [(mask, winners) for mask, winners in new_mw
-              if not all([(mask[d][0] <= inf[d]) if mask[d][1] else (mask[d][0] >= sup[d]) for d in range(dim)])]
-    if not new_mw:
-        area = np.prod([high - low for (low, high) in zip(inf, sup)])
-        histogram[len(cover_alls)] += area
-    else:
-        mask, _ = random.choice(new_mw)
-        d_lim = random.choice([d for d in range(dim) if inf[d] < mask[d][0] < sup[d]])
-        lim = mask[d_lim][0]
-        winners_distribution(inf, [lim if d == d_lim else sup[d] for d in range(dim)], new_mw, histogram, cover_alls)
-        winners_distribution([lim if d == d_lim else inf[d] for d in range(dim)], sup, new_mw, histogram, cover_alls)
+    # Eliminate the masks that do not bring any new winner
+    masks_winners = [(mask, winners) for mask, winners in masks_winners if not winners.issubset(cover_alls)]
+    masks = [mask for mask, _ in masks_winners]
+    cells = masks_cells(inf, sup, masks)
+    for covering, area in cells.items():
+        winners = set(cover_alls).union(*[masks_winners[i][1] for i in covering])
+        histogram[len(winners)] += area
     return np.array(histogram)
 
 
+class _MasksSweep:
+    """Decomposition of a bounding rectangle by some masks.
+
+    Parameters
+    ----------
+    inf, sup, masks
+        Cf. :meth:`masks_area`.
+
+    Notes
+    -----
+    The algorithm is a sweep along one dimension at a time, with coordinate compression. In a sub-problem, we
+    consider a subset of the dimensions and a subset of the masks, the other dimensions being already fixed:
+
+    * The masks that are empty in the bounding rectangle (restricted to these dimensions) are eliminated,
+    * The masks that cover the whole bounding rectangle are detected,
+    * Among the dimensions where the remaining masks have a limit strictly inside the bounding rectangle, we choose
+      the one with the fewest distinct limits (the lowest index in case of a tie). The distinct limits cut this
+      dimension into slabs. In each slab, each remaining mask either contains the slab (in this dimension) or does
+      not meet it, and we recurse with the other dimensions and the masks that contain the slab.
+
+    In each sub-problem, the bounding rectangle in the remaining dimensions is the initial one. So, a sub-problem is
+    characterized by its remaining dimensions and its set of masks: the results are memoized with this key. This way,
+    the slabs (or, more generally, the sub-boxes) where the same masks are active are computed only once.
+
+    Everything is deterministic, and the computations are exact with fractions.
+
+    Examples
+    --------
+        >>> sweep = _MasksSweep(inf=[0, 0], sup=[1, 2],
+        ...                     masks=[[(Fraction(2, 10), True), (Fraction(6, 10), False)],
+        ...                            [(Fraction(3, 10), False), (Fraction(4, 10), True)]])
+        >>> sweep.area()
+        Fraction(47, 50)
+        >>> cells = sweep.cells()
+        >>> for covering in sorted(cells.keys(), key=sorted):
+        ...     print(sorted(covering), cells[covering])
+        [] 53/50
+        [0] 23/50
+        [0, 1] 1/50
+        [1] 23/50
+    """
+
+    def __init__(self, inf, sup, masks):
+        self.inf = inf
+        self.sup = sup
+        self.masks = masks
+        self._memo_area = dict()
+        self._memo_cells = dict()
+
+    def _volume(self, dims):
+        volume = 1
+        for d in dims:
+            volume *= self.sup[d] - self.inf[d]
+        return volume
+
+    def _analyze(self, dims, active):
+        """Analyze a sub-problem.
+
+        Returns
+        -------
+        covering : frozenset
+            The masks that cover the whole bounding rectangle (restricted to the dimensions `dims`).
+        partial : list
+            The masks that cover a part of it.
+        """
+        covering = []
+        partial = []
+        for i in active:
+            mask = self.masks[i]
+            if any([(mask[d][0] >= self.sup[d]) if mask[d][1] else (mask[d][0] <= self.inf[d]) for d in dims]):
+                continue
+            if all([(mask[d][0] <= self.inf[d]) if mask[d][1] else (mask[d][0] >= self.sup[d]) for d in dims]):
+                covering.append(i)
+            else:
+                partial.append(i)
+        return frozenset(covering), partial
+
+    def _slabs(self, dims, partial):
+        """Choose the dimension of the sweep.
+
+        Returns
+        -------
+        d : int
+            The dimension.
+        slabs : list of tuple
+            Each element is a tuple `(length, sub_active)`, where `length` is the length of the slab and `sub_active`
+            is the set of masks that contain the slab (in dimension `d`).
+        """
+        d_limits = {d: sorted({self.masks[i][d][0] for i in partial
+                               if self.inf[d] < self.masks[i][d][0] < self.sup[d]})
+                    for d in dims}
+        d = min([d for d in dims if d_limits[d]], key=lambda d: (len(d_limits[d]), d))
+        bounds = [self.inf[d]] + d_limits[d] + [self.sup[d]]
+        slabs = []
+        for low, high in zip(bounds[:-1], bounds[1:]):
+            sub_active = frozenset([i for i in partial
+                                    if ((self.masks[i][d][0] <= low) if self.masks[i][d][1]
+                                        else (self.masks[i][d][0] >= high))])
+            slabs.append((high - low, sub_active))
+        return d, slabs
+
+    def area(self, dims=None, active=None):
+        """Area of the union of the masks.
+
+        Parameters
+        ----------
+        dims : tuple, optional
+            The dimensions of the sub-problem. Default: all dimensions.
+        active : frozenset, optional
+            The indices of the masks of the sub-problem. Default: all masks.
+
+        Returns
+        -------
+        Number
+            The area (restricted to the dimensions `dims`) of the union of the masks `active`.
+        """
+        if dims is None:
+            dims, active = tuple(range(len(self.inf))), frozenset(range(len(self.masks)))
+        key = (dims, active)
+        if key not in self._memo_area:
+            covering, partial = self._analyze(dims, active)
+            if covering:
+                result = self._volume(dims)
+            elif not partial:
+                result = 0
+            else:
+                d, slabs = self._slabs(dims, partial)
+                other_dims = tuple(d_other for d_other in dims if d_other != d)
+                result = 0
+                for length, sub_active in slabs:
+                    if sub_active:
+                        result += length * self.area(other_dims, sub_active)
+            self._memo_area[key] = result
+        return self._memo_area[key]
+
+    def cells(self, dims=None, active=None):
+        """Decomposition of the bounding rectangle according to the masks that cover each point.
+
+        Parameters
+        ----------
+        dims : tuple, optional
+            The dimensions of the sub-problem. Default: all dimensions.
+        active : frozenset, optional
+            The indices of the masks of the sub-problem. Default: all masks.
+
+        Returns
+        -------
+        dict
+            Key: a frozenset of indices of masks. Value: the area (restricted to the dimensions `dims`) of the set
+            of points that are covered exactly by these masks (among the masks `active`). Keys with a null area may
+            be omitted.
+        """
+        if dims is None:
+            dims, active = tuple(range(len(self.inf))), frozenset(range(len(self.masks)))
+        key = (dims, active)
+        if key not in self._memo_cells:
+            covering, partial = self._analyze(dims, active)
+            if not partial:
+                result = {covering: self._volume(dims)}
+            else:
+                d, slabs = self._slabs(dims, partial)
+                other_dims = tuple(d_other for d_other in dims if d_other != d)
+                result = dict()
+                for length, sub_active in slabs:
+                    for sub_covering, area in self.cells(other_dims, sub_active).items():
+                        label = covering | sub_covering
+                        result[label] = result.get(label, 0) + length * area
+            self._memo_cells[key] = result
+        return self._memo_cells[key]
+
+
 def random_mask(dim):
     """Random mask.
 
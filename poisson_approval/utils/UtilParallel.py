@@ -0,0 +1,177 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def effective_n_jobs(n_jobs):
+    """Number of processes.
+
+    Parameters
+    ----------
+    n_jobs : int
+        A number of processes, or -1 for the number of CPUs.
+
+    Returns
+    -------
+    int
+        The number of processes.
+
+    Examples
+    --------
+        >>> effective_n_jobs(3)
+        3
+        >>> effective_n_jobs(-1) == os.cpu_count()
+        True
+    """
+    return os.cpu_count() if n_jobs == -1 else n_jobs
+
+
+def process_pool(n_jobs, initializer=None, initargs=()):
+    """Pool of processes.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of processes (-1 means the number of CPUs).
+    initializer : callable, optional
+        Called at the start of each worker process, with the arguments `initargs`.
+    initargs : tuple
+        Arguments of `initializer`.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The pool of processes.
+
+    Notes
+    -----
+    If possible, the processes are forked, so that the arguments of `initializer` are inherited by the workers
+    without being pickled: this way, they can contain lambda functions.
+    """
+    mp_context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=effective_n_jobs(n_jobs), mp_context=mp_context,
+                               initializer=initializer, initargs=initargs)
+
+
+def imap_chunks(executor, f, iterable, chunk_size, n_pending, *args):
+    """Apply a function to the chunks of an iterable in an executor, lazily and in order.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor
+        The executor.
+    f : callable
+        A function whose inputs are the elements of `args`, then a list (a chunk of `iterable`), and whose output is a
+        list of the same length.
+    iterable : iterable
+        The inputs.
+    chunk_size : int
+        Number of inputs per chunk.
+    n_pending : int
+        Maximal number of chunks that are submitted and not consumed yet. This bounds the memory used, even if
+        `iterable` is very long.
+    args
+        Other arguments of `f`.
+
+    Yields
+    ------
+    tuple
+        A pair ``(x, y)``, where `x` is an element of `iterable` and `y` the corresponding output of `f`.
+
+    Notes
+    -----
+    When the generator is closed before its end, the chunks that are not started yet are cancelled.
+
+    Examples
+    --------
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> def square(offset, xs):
+        ...     return [offset + x ** 2 for x in xs]
+        >>> with ThreadPoolExecutor(max_workers=2) as executor:
+        ...     list(imap_chunks(executor, square, range(5), 2, 2, 100))
+        [(0, 100), (1, 101), (2, 104), (3, 109), (4, 116)]
+    """
+    iterator = iter(iterable)
+    pending = deque()
+
+    def submit():
+        chunk = list(islice(iterator, chunk_size))
+        if chunk:
+            pending.append((chunk, executor.submit(f, *args, chunk)))
+        return bool(chunk)
+
+    try:
+        while len(pending) < n_pending and submit():
+            pass
+        while pending:
+            chunk, future = pending.popleft()
+            submit()
+            yield from zip(chunk, future.result())
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def imap_parallel(f, iterable, n_jobs=None, executor=None, chunk_size=64):
+    """Apply a function to each element of an iterable, possibly in parallel, lazily and in order.
+
+    Parameters
+    ----------
+    f : callable
+        A function with one input.
+    iterable : iterable
+        The inputs.
+    n_jobs : int, optional
+        If specified, the computation is made in a new pool of `n_jobs` processes (-1 means the number of CPUs), cf.
+        :func:`process_pool`. In that case, `f` needs not be picklable.
+    executor : concurrent.futures.Executor, optional
+        If specified, the computation is made by this executor. This parameter takes precedence over `n_jobs`. If it
+        is a pool of processes, then `f` must be picklable.
+    chunk_size : int
+        Number of inputs sent at once to a worker.
+
+    Yields
+    ------
+    tuple
+        A pair ``(x, f(x))``, where `x` is an element of `iterable`.
+
+    Notes
+    -----
+    If neither `n_jobs` nor `executor` is specified, the computation is serial.
+
+    Examples
+    --------
+        >>> def square(x):
+        ...     return x ** 2
+        >>> list(imap_parallel(square, range(4)))
+        [(0, 0), (1, 1), (2, 4), (3, 9)]
+        >>> list(imap_parallel(lambda x: x ** 3, range(4), n_jobs=2, chunk_size=1))
+        [(0, 0), (1, 1), (2, 8), (3, 27)]
+    """
+    if executor is None and n_jobs is None:
+        for x in iterable:
+            yield x, f(x)
+    elif executor is None:
+        with process_pool(n_jobs, initializer=_set_worker_function, initargs=(f,)) as pool:
+            yield from imap_chunks(pool, _apply_in_worker, iterable, chunk_size, 2 * effective_n_jobs(n_jobs))
+    else:
+        yield from imap_chunks(executor, _apply, iterable, chunk_size, 2 * os.cpu_count(), f)
+
+
+def _apply(f, xs):
+    return [f(x) for x in xs]
+
+
+# Function of :func:`imap_parallel` in a worker process (set by the initializer of the pool).
+_worker_function = None
+
+
+def _set_worker_function(f):
+    global _worker_function
+    _worker_function = f
+
+
+def _apply_in_worker(xs):
+    return _apply(_worker_function, xs)
@@ -0,0 +1,141 @@
+import math
+import numpy as np
+
+
+# The solver works with ``t = log(x)``, restricted to this interval to avoid overflows.
+_T_MAX = 300
+_MAX_ITERATIONS = 100
+_TOLERANCE = 1e-13
+
+
+def _trio_objective(x, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    """Objective function of the trio, as a function of `x`."""
+    return 2 * np.sqrt((tau_x * x + tau_xz) * (tau_yz / x + tau_y)) + tau_xy * x + tau_z / x - 1
+
+
+def _trio_derivatives(x, tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz):
+    """First and second derivatives of the objective function of the trio, as a function of ``t = log(x)``.
+
+    This works with floats as well as arrays.
+    """
+    # The product under the square root and its derivatives.
+    p = (tau_x * x + tau_xz) * (tau_yz / x + tau_y)
+    dp = tau_x * tau_y * x - tau_xz * tau_yz / x
+    d2p = tau_x * tau_y * x + tau_xz * tau_yz / x
+    sqrt_p = p ** .5
+    first = dp / sqrt_p + tau_xy * x - tau_z / x
+    second = d2p / sqrt_p - dp ** 2 / (2 * p * sqrt_p) + tau_xy * x + tau_z / x
+    return first, second
+
+
+def trio_minimize(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf=0., sup=np.inf, start=None):
+    """Minimize the objective function of the trio (vectorized).
+
+    Parameters
+    ----------
+    tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz : float or numpy.ndarray
+        The shares of the ballots. Arrays are broadcast together, so that a batch of trios can be solved at once.
+    inf : float or numpy.ndarray
+        Lower bound for `x`. Default: 0.
+    sup : float or numpy.ndarray
+        Upper bound for `x`. Default: infinity.
+    start : float or numpy.ndarray, optional
+        Starting point. Default: the geometric mean of the bounds if they are positive and finite, 1 otherwise
+        (clipped to the bounds).
+
+    Returns
+    -------
+    mu : float or numpy.ndarray
+        The minimum of the objective function, i.e. the magnitude of the trio.
+    x : float or numpy.ndarray
+        The point where the minimum is reached.
+
+    Notes
+    -----
+    The objective function is ``2 * sqrt((tau_x * x + tau_xz) * (tau_yz / x + tau_y)) + tau_xy * x + tau_z / x - 1``.
+    As a function of ``t = log(x)``, it is a sum of convex functions, hence convex. We find the root of its derivative
+    by Newton's method with the analytic second derivative, safeguarded by bisection on a bracket that is
+    updated at each iteration. All the trios are solved simultaneously. When all the inputs are numbers, the
+    computation is done with floats, which avoids the overhead of `numpy` for a single trio.
+
+    Examples
+    --------
+        >>> mu, x = trio_minimize(tau_x=.1, tau_y=.2, tau_z=.3, tau_xy=.15, tau_xz=.05, tau_yz=.2)
+        >>> print('%.9f, %.9f' % (mu, x))
+        -0.070714770, 1.215884692
+
+    With a batch of trios:
+
+        >>> mu, x = trio_minimize(tau_x=np.array([.1, .4]), tau_y=np.array([.2, .1]), tau_z=np.array([.3, .1]),
+        ...                       tau_xy=np.array([.15, .1]), tau_xz=np.array([.05, .1]), tau_yz=np.array([.2, .2]))
+        >>> mu.round(8)
+        array([-0.07071477, -0.02920308])
+
+    If the minimum is not reached in the interior of the bounds, the best bound is returned:
+
+        >>> mu, x = trio_minimize(tau_x=.1, tau_y=.2, tau_z=.3, tau_xy=.15, tau_xz=.05, tau_yz=.2, inf=1.5, sup=2)
+        >>> print('%.9f' % x)
+        1.500000000
+    """
+    if all(np.ndim(value) == 0 for value in [tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf, sup, start]):
+        return _trio_minimize_float(float(tau_x), float(tau_y), float(tau_z), float(tau_xy), float(tau_xz),
+                                    float(tau_yz), float(inf), float(sup), start)
+    tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf, sup = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in [tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf, sup]])
+    taus = (tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz)
+    with np.errstate(divide='ignore'):
+        lo = np.clip(np.log(inf), -_T_MAX, _T_MAX)
+        hi = np.clip(np.log(sup), -_T_MAX, _T_MAX)
+    if start is None:
+        t = np.clip(np.where((inf > 0) & np.isfinite(sup), (lo + hi) / 2, 0.), lo, hi)
+    else:
+        t = np.clip(np.log(np.broadcast_to(np.asarray(start, dtype=float), lo.shape)), lo, hi)
+    active = lo < hi
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(_MAX_ITERATIONS):
+            if not np.any(active):
+                break
+            first, second = _trio_derivatives(np.exp(t), *taus)
+            lo = np.where(active & (first < 0), t, lo)
+            hi = np.where(active & (first > 0), t, hi)
+            step = first / second
+            newton_in_bracket = (t - step >= lo) & (t - step <= hi)
+            t_new = np.where(newton_in_bracket, t - step, (lo + hi) / 2)
+            tolerance = _TOLERANCE * np.maximum(1, np.abs(t))
+            converged = ((first == 0) | (newton_in_bracket & (np.abs(step) <= tolerance))
+                         | (hi - lo <= tolerance))
+            t = np.where(active & (first != 0), t_new, t)
+            active &= ~converged
+    x = np.clip(np.exp(t), inf, sup)
+    return _trio_objective(x, *taus), x
+
+
+def _trio_minimize_float(tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz, inf, sup, start):
+    """Same as :meth:`trio_minimize`, for a single trio (the inputs are floats)."""
+    taus = (tau_x, tau_y, tau_z, tau_xy, tau_xz, tau_yz)
+    lo = min(max(math.log(inf), -_T_MAX), _T_MAX) if inf > 0 else -_T_MAX
+    hi = min(max(math.log(sup), -_T_MAX), _T_MAX)
+    if start is not None:
+        t = math.log(start)
+    elif inf > 0 and math.isfinite(sup):
+        t = (lo + hi) / 2
+    else:
+        t = 0.
+    t = min(max(t, lo), hi)
+    if lo < hi:
+        for _ in range(_MAX_ITERATIONS):
+            first, second = _trio_derivatives(math.exp(t), *taus)
+            if first == 0:
+                break
+            if first < 0:
+                lo = t
+            else:
+                hi = t
+            step = first / second
+            newton_in_bracket = lo <= t - step <= hi
+            tolerance = _TOLERANCE * max(1, abs(t))
+            t = t - step if newton_in_bracket else (lo + hi) / 2
+            if (newton_in_bracket and abs(step) <= tolerance) or hi - lo <= tolerance:
+                break
+    x = min(max(math.exp(t), inf), sup)
+    return _trio_objective(x, *taus), x
@@ -1,4 +1,5 @@
-from poisson_approval.utils.ComputationEngineSymbolic import ComputationEngineSymbolic
+from poisson_approval.constants.basic_constants import FLOAT
+from poisson_approval.utils.ComputationEngineFloat import ComputationEngineFloat
 from poisson_approval.utils.ComputationEngineNumeric import ComputationEngineNumeric
 
 
@@ -7,12 +8,29 @@ def computation_engine(symbolic):
 
     Parameters
     ----------
-    symbolic : bool
-        Whether symbolic computation should be activated.
+    symbolic : bool or str
+        Whether symbolic computation should be activated. If ``FLOAT``, then the computation is performed with floats
+        only.
 
     Returns
     -------
     ComputationEngine
-        :class:`ComputationEngineSymbolic` if `symbolic` is True, :class:`ComputationEngineNumeric` otherwise.
+        :class:`ComputationEngineFloat` if `symbolic` is ``FLOAT``, :class:`ComputationEngineSymbolic` if `symbolic`
+        is True, :class:`ComputationEngineNumeric` otherwise.
+
+    Examples
+    --------
+        >>> computation_engine(False).__name__
+        'ComputationEngineNumeric'
+        >>> computation_engine(True).__name__
+        'ComputationEngineSymbolic'
+        >>> computation_engine(FLOAT).__name__
+        'ComputationEngineFloat'
     """
-    return ComputationEngineSymbolic if symbolic else ComputationEngineNumeric
+    if symbolic == FLOAT:
+        return ComputationEngineFloat
+    if symbolic:
+        # Imported only when needed, because `sympy` is slow to import.
+        from poisson_approval.utils.ComputationEngineSymbolic import ComputationEngineSymbolic
+        return ComputationEngineSymbolic
+    return ComputationEngineNumeric
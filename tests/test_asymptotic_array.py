@@ -0,0 +1,63 @@
+import math
+import numpy as np
+import pytest
+from poisson_approval import Asymptotic, AsymptoticArray
+
+
+def _look_equal(x, y):
+    x, y = float(x), float(y)
+    if math.isnan(x) or math.isnan(y):
+        return math.isnan(x) and math.isnan(y)
+    return x == y or math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def _assert_rows_equal(asymptotics, scalars):
+    assert len(asymptotics) == len(scalars)
+    for i, scalar in enumerate(scalars):
+        for coefficient in ['mu', 'nu', 'xi']:
+            assert _look_equal(getattr(asymptotics, coefficient)[i], getattr(scalar, coefficient))
+
+
+def _sample():
+    values = [-np.inf, np.nan, -2., -0.5, 0., 0.5, 2.]
+    return [(mu, nu, xi) for mu in values for nu in values for xi in [-np.inf, np.nan, -1., 0., 1.]
+            if not (mu == -np.inf) ^ (nu == -np.inf)]
+
+
+def test_operations_match_asymptotic():
+    rows = _sample()
+    rng = np.random.default_rng(0)
+    others = [rows[i] for i in rng.permutation(len(rows))]
+    asymptotics_1 = AsymptoticArray(*zip(*rows))
+    asymptotics_2 = AsymptoticArray(*zip(*others))
+    scalars_1 = [Asymptotic(*row) for row in rows]
+    scalars_2 = [Asymptotic(*row) for row in others]
+    _assert_rows_equal(asymptotics_1 * asymptotics_2, [a * b for a, b in zip(scalars_1, scalars_2)])
+    _assert_rows_equal(asymptotics_1 / asymptotics_2, [a / b for a, b in zip(scalars_1, scalars_2)])
+    _assert_rows_equal(asymptotics_1 + asymptotics_2, [a + b for a, b in zip(scalars_1, scalars_2)])
+    _assert_rows_equal(asymptotics_1 * 3, [a * 3 for a in scalars_1])
+    _assert_rows_equal(2 / asymptotics_1, [2 / a for a in scalars_1])
+    _assert_rows_equal(asymptotics_1 + 1, [a + 1 for a in scalars_1])
+    for limit, scalar in zip(asymptotics_1.limit, scalars_1):
+        assert _look_equal(limit, scalar.limit)
+
+
+def test_look_equal():
+    asymptotics = AsymptoticArray(mu=[1, 1, -np.inf], nu=[2, 2, -np.inf], xi=[3, 3, -np.inf])
+    assert np.array_equal(asymptotics.look_equal(Asymptotic(mu=1, nu=2, xi=3)), [True, True, False])
+    with pytest.raises(ValueError):
+        asymptotics.look_equal(AsymptoticArray(mu=np.nan, nu=0, xi=0))
+
+
+def test_poisson_constructors_match_asymptotic():
+    taus = [0, 0.1, 0.3, 0.6, 1]
+    tau_1, tau_2 = (np.array(values) for values in zip(*[(t_1, t_2) for t_1 in taus for t_2 in taus]))
+    _assert_rows_equal(AsymptoticArray.poisson_eq(tau_1, tau_2),
+                       [Asymptotic.poisson_eq(t_1, t_2) for t_1, t_2 in zip(tau_1, tau_2)])
+    _assert_rows_equal(AsymptoticArray.poisson_one_more(tau_1, tau_2),
+                       [Asymptotic.poisson_one_more(t_1, t_2) for t_1, t_2 in zip(tau_1, tau_2)])
+    for k in range(3):
+        _assert_rows_equal(AsymptoticArray.poisson_x1_eq_x2_plus_k(tau_1, tau_2, k),
+                           [Asymptotic.poisson_x1_eq_x2_plus_k(t_1, t_2, k) for t_1, t_2 in zip(tau_1, tau_2)])
+        _assert_rows_equal(AsymptoticArray.poisson_x1_ge_x2_plus_k(tau_1, tau_2, k),
+                           [Asymptotic.poisson_x1_ge_x2_plus_k(t_1, t_2, k) for t_1, t_2 in zip(tau_1, tau_2)])
@@ -1,3 +1,5 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from poisson_approval import binary_figure
 
 
@@ -36,3 +38,40 @@ def test_heatmap_candidates_reverse():
         >>> tax.set_title('A candidate heat map')
     """
     pass
+
+
+def _quadrants(x, y1, y2):
+    return [1, 0, 0] if x > y1 else [0, 1, 0] if x + y2 > 1 else [0, 0, 1]
+
+
+_LABELS = dict(x_left_label='x-left', x_right_label='x-right', y_left_label='y-left', y_right_label='y-right')
+
+
+def test_heatmap_candidates_adaptive():
+    figure, tax = binary_figure(xscale=40, yscale=30)
+    tax.heatmap_candidates(_quadrants, reverse_right=True, **_LABELS)
+    data_full = tax.data_
+    assert data_full.shape == (30, 40, 3)
+    assert tax.n_evaluations_ == 30 * 40
+    assert tax.n_evaluations_saved_ == 0
+    for coarse_scale, n_jobs in [(8, None), (5, 2)]:
+        figure, tax = binary_figure(xscale=40, yscale=30)
+        tax.heatmap_candidates(_quadrants, reverse_right=True, adaptive=True, coarse_scale=coarse_scale,
+                               n_jobs=n_jobs, **_LABELS)
+        assert np.array_equal(tax.data_, data_full)
+        assert tax.n_evaluations_ + tax.n_evaluations_saved_ == 30 * 40
+        assert tax.n_evaluations_ < 30 * 40 / 2
+
+
+def test_heatmap_intensity_parallel():
+    def f(x, y1, y2):
+        return int(x > y1) + y2
+    figure, tax = binary_figure(xscale=17, yscale=9)
+    tax.heatmap_intensity(f, **_LABELS)
+    data_full = tax.data_
+    assert data_full.shape == (9, 17)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tax.heatmap_intensity(f, executor=executor, chunk_size=10, **_LABELS)
+    assert np.array_equal(tax.data_, data_full)
+    tax.heatmap_intensity(lambda x, y1, y2: int(x > .3), adaptive=True, **_LABELS)
+    assert tax.n_evaluations_saved_ > 0
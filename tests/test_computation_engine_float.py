@@ -0,0 +1,24 @@
+from fractions import Fraction
+from poisson_approval import TauVector, ProfileNoisyDiscrete, RANKINGS, FLOAT, isnan
+
+
+def test_float_engine_same_best_responses():
+    d_ballot_share = {'a': Fraction(1, 10), 'ab': Fraction(6, 10), 'c': Fraction(3, 10)}
+    tau_numeric = TauVector(d_ballot_share)
+    tau_float = TauVector(d_ballot_share, symbolic=FLOAT)
+    assert all(isinstance(share, float) for share in tau_float.d_ballot_share.values())
+    for ranking in RANKINGS:
+        threshold_numeric = tau_numeric.d_ranking_best_response[ranking].utility_threshold
+        threshold_float = tau_float.d_ranking_best_response[ranking].utility_threshold
+        assert (isnan(threshold_numeric) and isnan(threshold_float)
+                or abs(threshold_numeric - threshold_float) < 1e-9)
+
+
+def test_float_engine_in_profile():
+    d_type_share = {('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+                    ('cab', 0.7, 0.01): Fraction(3, 10)}
+    results_numeric = ProfileNoisyDiscrete(d_type_share).iterated_voting(init='sincere', n_max_episodes=100)
+    results_float = ProfileNoisyDiscrete(d_type_share, symbolic=FLOAT).iterated_voting(
+        init='sincere', n_max_episodes=100)
+    assert results_float['converges'] == results_numeric['converges']
+    assert results_float['cycle_taus_actual'][0].isclose(results_numeric['cycle_taus_actual'][0])
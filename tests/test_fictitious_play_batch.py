@@ -0,0 +1,72 @@
+import random
+import pytest
+from poisson_approval import fictitious_play_batch, monte_carlo_fictitious_play, initialize_random_seeds, \
+    rand_simplex, ProfileDiscrete, ProfileHistogram, RandProfileHistogramUniform, RANKINGS, CANDIDATES, \
+    VOTING_RULES, MCS_CONVERGES, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_BALLOT_STATISTICS, one_over_t
+
+
+def _random_profiles(n_profiles):
+    profiles = []
+    for voting_rule in VOTING_RULES:
+        for _ in range(n_profiles):
+            shares = rand_simplex(6)
+            if random.random() < .5:
+                profiles.append(ProfileDiscrete({
+                    (ranking, round(random.random(), 3)): share for ranking, share in zip(RANKINGS, shares)
+                }, voting_rule=voting_rule))
+            else:
+                profiles.append(ProfileHistogram(
+                    dict(zip(RANKINGS, shares)), {ranking: [1] for ranking in RANKINGS}, voting_rule=voting_rule))
+    return profiles
+
+
+def test_fictitious_play_batch_matches_fictitious_play():
+    initialize_random_seeds(0)
+    profiles = _random_profiles(8)
+    kwargs = dict(init='sincere', n_max_episodes=50, ballot_update_ratio=one_over_t,
+                  other_statistics_tau={'score_a': lambda tau: tau.scores['a']},
+                  other_statistics_strategy={'share_single_votes': lambda strategy: strategy.share_single_votes})
+    all_results = fictitious_play_batch(profiles, **kwargs)
+    for profile, results in zip(profiles, all_results):
+        expected = profile.fictitious_play(**kwargs)
+        assert results.keys() == expected.keys()
+        assert results['converges'] == expected['converges']
+        assert results['n_episodes'] == expected['n_episodes']
+        assert results['tau_init'] == expected['tau_init']
+        if expected['converges']:
+            assert results['tau'].isclose(expected['tau'])
+            assert str(results['strategy']) == str(expected['strategy'])
+        for candidate in CANDIDATES:
+            assert float(results['d_candidate_winning_frequency'][candidate]) == pytest.approx(
+                float(expected['d_candidate_winning_frequency'][candidate]))
+        assert results['score_a'] == pytest.approx(expected['score_a'])
+        assert results['share_single_votes'] == pytest.approx(expected['share_single_votes'])
+
+
+def test_fictitious_play_batch_symbolic():
+    profile = ProfileHistogram({'abc': 1}, {'abc': [1]}, symbolic=True)
+    with pytest.raises(ValueError):
+        fictitious_play_batch([profile], init='sincere', n_max_episodes=10)
+
+
+def test_monte_carlo_batch_size():
+    settings = [MCS_CONVERGES, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_BALLOT_STATISTICS]
+    initialize_random_seeds(0)
+    meta_results = monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=5,
+                                               n_max_episodes=20, voting_rules=VOTING_RULES,
+                                               monte_carlo_settings=settings)
+    initialize_random_seeds(0)
+    meta_results_batch = monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=5,
+                                                     n_max_episodes=20, voting_rules=VOTING_RULES,
+                                                     monte_carlo_settings=settings, batch_size=2)
+    for voting_rule in VOTING_RULES:
+        assert meta_results_batch[voting_rule]['converges'] == meta_results[voting_rule]['converges']
+        assert meta_results_batch[voting_rule]['n_episodes'] == meta_results[voting_rule]['n_episodes']
+        assert meta_results_batch[voting_rule]['mean_share_single_votes'] == pytest.approx(
+            meta_results[voting_rule]['mean_share_single_votes'])
+
+
+def test_monte_carlo_batch_size_iterated_voting():
+    with pytest.raises(ValueError):
+        monte_carlo_fictitious_play(factory=RandProfileHistogramUniform(n_bins=1), n_samples=1, n_max_episodes=10,
+                                    meth='iterated_voting', batch_size=2)
@@ -0,0 +1,78 @@
+import numpy as np
+from functools import partial
+from fractions import Fraction
+from poisson_approval import HeatmapCache, ProfileNoisyDiscrete, SimplexToProfile, XyyToProfile, \
+    ternary_plot_winners_at_equilibrium, binary_plot_n_equilibria
+from poisson_approval.meta_analysis.HeatmapCache import evaluate_on_inputs
+
+
+def test_parameters(tmp_path):
+    def f(x, y):
+        return x + y
+    cache = HeatmapCache(str(tmp_path), statistic='f', d={'a': 1, 'b': Fraction(1, 2)})
+    evaluate_on_inputs(f, [(1, 2)], cache=cache)
+    assert HeatmapCache(str(tmp_path), d={'b': Fraction(1, 2), 'a': 1}, statistic='f').file_name == cache.file_name
+    assert len(HeatmapCache(str(tmp_path), statistic='f', d={'a': 1, 'b': Fraction(1, 2)})) == 1
+    assert len(HeatmapCache(str(tmp_path), statistic='f', d={'a': 1, 'b': Fraction(1, 3)})) == 0
+
+
+def test_parameters_functions_and_arrays(tmp_path):
+    def file_name(**parameters):
+        return HeatmapCache(str(tmp_path), **parameters).file_name
+
+    def make_ratio(exponent):
+        return lambda t: 1 / t ** exponent
+    assert file_name(ratio=lambda t: 1 / t) != file_name(ratio=lambda t: 1 / t ** 2)
+    assert file_name(ratio=make_ratio(1)) != file_name(ratio=make_ratio(2))
+    assert file_name(ratio=make_ratio(1)) == file_name(ratio=make_ratio(1))
+    assert file_name(ratio=partial(pow, 2)) != file_name(ratio=partial(pow, 3))
+    a = np.zeros(2000)
+    b = a.copy()
+    b[1000] = 1
+    assert file_name(a=a) != file_name(a=b)
+    assert file_name(a=a) == file_name(a=a.copy())
+
+
+def test_only_new_points_are_computed(tmp_path):
+    computed = []
+
+    def f(x, y):
+        computed.append((x, y))
+        return [x, y, 0]
+    values, n_evaluations = evaluate_on_inputs(f, [(Fraction(1, 2), 0), (1, 0)],
+                                               cache=HeatmapCache(str(tmp_path), statistic='f'))
+    assert n_evaluations == 2
+    values, n_evaluations = evaluate_on_inputs(f, [(Fraction(2, 4), 0), (Fraction(1, 4), 0)],
+                                               cache=HeatmapCache(str(tmp_path), statistic='f'))
+    assert n_evaluations == 1
+    assert values == [[.5, 0., 0.], [.25, 0., 0.]]
+    assert all(isinstance(x, float) for value in values for x in value)
+    assert computed == [(Fraction(1, 2), 0), (1, 0), (Fraction(1, 4), 0)]
+
+
+def test_ternary_shortcut(tmp_path):
+    simplex_to_profile = SimplexToProfile(
+        ProfileNoisyDiscrete,
+        left_type=('abc', 0.5, 0.01), right_type=('bac', 0.5, 0.01), top_type=('cab', 0.5, 0.01))
+    figure, tax = ternary_plot_winners_at_equilibrium(simplex_to_profile, scale=10)
+    d_point_values = tax.d_point_values_
+    figure, tax = ternary_plot_winners_at_equilibrium(simplex_to_profile, scale=5, cache_dir=str(tmp_path))
+    cache_5_points = tax.d_point_values_
+    figure, tax = ternary_plot_winners_at_equilibrium(simplex_to_profile, scale=10, cache_dir=str(tmp_path),
+                                                      title='Another title')
+    assert tax.n_evaluations_ == len(d_point_values) - len(cache_5_points)
+    assert tax.d_point_values_.keys() == d_point_values.keys()
+    assert all(np.array_equal(tax.d_point_values_[point], values) for point, values in d_point_values.items())
+    cache = HeatmapCache(str(tmp_path), statistic='winners_at_equilibrium', simplex_to_profile=simplex_to_profile,
+                         meth='analyzed_strategies_ordinal')
+    assert len(cache) == len(d_point_values)
+
+
+def test_binary_shortcut(tmp_path):
+    xyy_to_profile = XyyToProfile(ProfileNoisyDiscrete, left_ranking='bca', right_ranking='cab', noise=0.01)
+    figure, ax = binary_plot_n_equilibria(xyy_to_profile, xscale=5, yscale=3, cache_dir=str(tmp_path))
+    data = ax.data_
+    figure, ax = binary_plot_n_equilibria(xyy_to_profile, xscale=5, yscale=3, cache_dir=str(tmp_path))
+    assert (ax.data_ == data).all()
+    assert ax.n_evaluations_ == 0
+    assert ax.n_evaluations_saved_ == 15
@@ -1,7 +1,9 @@
+import pytest
 from poisson_approval import monte_carlo_fictitious_play, RandProfileHistogramUniform, \
     MCS_PROFILE, MCS_TAU_INIT, MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_CONVERGES, MCS_FREQUENCY_CW_WINS, \
     MCS_WELFARE_LOSSES, MCS_UTILITY_THRESHOLDS, MCS_BALLOT_STATISTICS, MCS_DECREASING_SCORES, VOTING_RULES, \
-    one_over_t
+    one_over_t, initialize_random_seeds
+from poisson_approval.meta_analysis.monte_carlo_fictitious_play import MonteCarloSetting
 
 
 def test_no_mcs():
@@ -61,3 +63,120 @@ def test_monte_carlo_iterated_voting():
         ... )
     """
     pass
+
+
+def _meta_results_with_seed(**kwargs):
+    return monte_carlo_fictitious_play(
+        factory=RandProfileHistogramUniform(n_bins=1),
+        n_samples=6,
+        n_max_episodes=20,
+        voting_rules=VOTING_RULES,
+        monte_carlo_settings=[MCS_N_EPISODES, MCS_CONVERGES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_WELFARE_LOSSES,
+                              MCS_UTILITY_THRESHOLDS, MCS_BALLOT_STATISTICS, MCS_DECREASING_SCORES],
+        seed=42,
+        **kwargs
+    )
+
+
+def _assert_same_meta_results(meta_results, other_meta_results):
+    assert meta_results.keys() == other_meta_results.keys()
+    for voting_rule, d_statistic_value in meta_results.items():
+        assert d_statistic_value.keys() == other_meta_results[voting_rule].keys()
+        for statistic_name, value in d_statistic_value.items():
+            assert repr(value) == repr(other_meta_results[voting_rule][statistic_name])
+
+
+def test_monte_carlo_n_jobs():
+    _assert_same_meta_results(_meta_results_with_seed(), _meta_results_with_seed(n_jobs=2))
+    _assert_same_meta_results(_meta_results_with_seed(), _meta_results_with_seed(n_jobs=3))
+
+
+def test_monte_carlo_executor():
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        _assert_same_meta_results(_meta_results_with_seed(), _meta_results_with_seed(executor=executor))
+
+
+def test_monte_carlo_file_stream(tmp_path):
+    from poisson_approval import MonteCarloStream
+    file_stream = str(tmp_path / 'stream.sav')
+    meta_results_stream = _meta_results_with_seed(file_stream=file_stream)
+    _assert_same_meta_results(_meta_results_with_seed(), meta_results_stream)
+    # Simulate an interruption: keep the header, the first 2 records and a truncated record.
+    stream = MonteCarloStream(file_stream)
+    ends = [end for _, end in stream._frames()]
+    with open(file_stream, 'r+b') as f:
+        f.truncate(ends[3] - 5)
+    assert stream.start(stream.header) == {0, 1}
+    with open(file_stream, 'r+b') as f:
+        f.truncate(ends[2] + 5)
+    # Resume without giving the seed again.
+    meta_results_resumed = monte_carlo_fictitious_play(
+        factory=RandProfileHistogramUniform(n_bins=1),
+        n_samples=6,
+        n_max_episodes=20,
+        voting_rules=VOTING_RULES,
+        monte_carlo_settings=[MCS_N_EPISODES, MCS_CONVERGES, MCS_CANDIDATE_WINNING_FREQUENCY, MCS_WELFARE_LOSSES,
+                              MCS_UTILITY_THRESHOLDS, MCS_BALLOT_STATISTICS, MCS_DECREASING_SCORES],
+        file_stream=file_stream,
+    )
+    _assert_same_meta_results(meta_results_stream, meta_results_resumed)
+
+
+def _meta_results_without_seed(file_stream, **kwargs):
+    parameters = dict(
+        factory=RandProfileHistogramUniform(n_bins=1),
+        n_samples=4,
+        n_max_episodes=20,
+        voting_rules=VOTING_RULES,
+        monte_carlo_settings=[MCS_N_EPISODES, MCS_CANDIDATE_WINNING_FREQUENCY],
+        file_stream=file_stream,
+    )
+    parameters.update(kwargs)
+    return monte_carlo_fictitious_play(**parameters)
+
+
+def test_monte_carlo_file_stream_without_seed(tmp_path):
+    from poisson_approval import MonteCarloStream
+    file_stream = str(tmp_path / 'stream.sav')
+    meta_results_stream = _meta_results_without_seed(file_stream)
+    assert MonteCarloStream(file_stream).header['seed'] is not None
+    # Simulate an interruption after the first 2 records, then resume with other random generators.
+    ends = [end for _, end in MonteCarloStream(file_stream)._frames()]
+    with open(file_stream, 'r+b') as f:
+        f.truncate(ends[2])
+    initialize_random_seeds(1)
+    meta_results_resumed = _meta_results_without_seed(file_stream)
+    _assert_same_meta_results(meta_results_stream, meta_results_resumed)
+
+
+def test_monte_carlo_file_stream_other_settings(tmp_path):
+    file_stream = str(tmp_path / 'stream.sav')
+    _meta_results_without_seed(file_stream)
+    for kwargs in [dict(n_max_episodes=21), dict(init='random_tau'), dict(perception_update_ratio=one_over_t),
+                   dict(ballot_update_ratio=1), dict(statistics_update_ratio=one_over_t),
+                   dict(factory=RandProfileHistogramUniform(n_bins=7)),
+                   dict(monte_carlo_settings=[MCS_N_EPISODES, MonteCarloSetting(
+                       statistics_post_processing={'d_candidate_winning_frequency': _other_winning_frequency})])]:
+        with pytest.raises(ValueError):
+            _meta_results_without_seed(file_stream, **kwargs)
+
+
+def _other_winning_frequency(results, profile):
+    return {candidate: 0 for candidate in results['d_candidate_winning_frequency']}
+
+
+def test_monte_carlo_file_stream_appends_by_groups(tmp_path, monkeypatch):
+    from poisson_approval import MonteCarloStream
+    appends = []
+    append = MonteCarloStream.append
+
+    def counting_append(self, records):
+        records = list(records)
+        appends.append(len(records))
+        append(self, records)
+    monkeypatch.setattr(MonteCarloStream, 'append', counting_append)
+    meta_results = _meta_results_without_seed(str(tmp_path / 'stream.sav'))
+    assert sum(appends) == 4
+    assert len(appends) < 4
+    assert len(meta_results[VOTING_RULES[0]]['n_episodes']) == 4
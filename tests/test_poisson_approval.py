@@ -2,6 +2,8 @@
 
 """Tests for `poisson_approval` package."""
 
+import subprocess
+import sys
 import pytest
 
 
@@ -22,3 +24,15 @@ def test_content(response):
     """Sample pytest test function with the pytest fixture as an argument."""
     # from bs4 import BeautifulSoup
     # assert 'GitHub' in BeautifulSoup(response.content).title.string
+
+
+def test_lazy_imports():
+    script = ('import sys, poisson_approval; '
+              'print(any(module in sys.modules for module in ["sympy", "matplotlib", "ternary", "scipy"]))')
+    output = subprocess.run([sys.executable, '-c', script], check=True, stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout
+    assert output.strip() == 'False'
+    assert poisson_approval.ternary_figure.__name__ == 'ternary_figure'
+    assert 'ternary_figure' in dir(poisson_approval)
+    with pytest.raises(AttributeError):
+        poisson_approval.foo
@@ -1,7 +1,8 @@
+import pytest
 from fractions import Fraction
 import numpy as np
 from poisson_approval import ProfileHistogram, StrategyThreshold, StrategyOrdinal, EquilibriumStatus, PLURALITY, \
-    ANTI_PLURALITY, initialize_random_seeds
+    ANTI_PLURALITY, initialize_random_seeds, RandProfileHistogramUniform, RANKINGS, CANDIDATES
 
 
 def test_normalization():
@@ -78,3 +79,47 @@ def test_welfare():
         {'a': Fraction(1, 1), 'b': Fraction(1, 3), 'c': 0}
     """
     pass
+
+
+def test_iterated_voting_max_history():
+    profile = ProfileHistogram({'abc': 0.03, 'acb': 0.25, 'bac': 0.18, 'bca': 0.19, 'cab': 0.03, 'cba': 0.32},
+                               {'abc': [1], 'acb': [1], 'bac': [1], 'bca': [1], 'cab': [1], 'cba': [1]})
+    results = profile.iterated_voting(init='sincere', n_max_episodes=100)
+    assert results['n_episodes'] == 6
+    assert len(results['cycle_taus_actual']) == 3
+    results_window = profile.iterated_voting(init='sincere', n_max_episodes=100, max_history=3)
+    assert results_window['n_episodes'] == 6
+    assert results_window['cycle_taus_actual'] == results['cycle_taus_actual']
+    results_small_window = profile.iterated_voting(init='sincere', n_max_episodes=100, max_history=2)
+    assert results_small_window['n_episodes'] == 100
+    assert results_small_window['cycle_taus_actual'] == []
+
+
+def test_have_rankings_with_utility_below():
+    initialize_random_seeds(0)
+    profile = RandProfileHistogramUniform(n_bins=1000)()
+    thresholds = np.random.rand(20, 6)
+    thresholds[0, :] = 0
+    thresholds[1, :] = 1
+    thresholds[2, :] = 0.5
+    results = profile.have_rankings_with_utility_below(thresholds)
+    assert results.shape == (20, 6)
+    for i in range(20):
+        for j, ranking in enumerate(RANKINGS):
+            assert results[i, j] == pytest.approx(profile.have_ranking_with_utility_below_u(ranking, thresholds[i, j]))
+            assert results[i, j] == pytest.approx(profile.d_ranking_share[ranking] * (
+                np.sum(profile.d_ranking_histogram[ranking][:int(thresholds[i, j] * 1000)])
+                + (profile.d_ranking_histogram[ranking][int(thresholds[i, j] * 1000)]
+                   * (thresholds[i, j] * 1000 - int(thresholds[i, j] * 1000)) if thresholds[i, j] < 1 else 0)))
+
+
+def test_d_candidate_welfare_fine_histogram():
+    initialize_random_seeds(0)
+    profile = RandProfileHistogramUniform(n_bins=1000)()
+    for candidate in CANDIDATES:
+        expected = sum(
+            share * (1 if ranking[0] == candidate else 0)
+            + share * (np.sum([(i + .5) / 1000 * h for i, h in enumerate(profile.d_ranking_histogram[ranking])])
+                       if ranking[1] == candidate else 0)
+            for ranking, share in profile.d_ranking_share.items())
+        assert profile.d_candidate_welfare[candidate] == pytest.approx(expected)
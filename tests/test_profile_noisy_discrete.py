@@ -1,6 +1,9 @@
 import pytest
+import random
+import numpy as np
 from fractions import Fraction
-from poisson_approval import ProfileNoisyDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY
+from poisson_approval import ProfileNoisyDiscrete, StrategyOrdinal, PLURALITY, ANTI_PLURALITY, RANKINGS, \
+    initialize_random_seeds
 
 
 def test_normalization():
@@ -66,3 +69,64 @@ def test_welfare():
         {'a': Fraction(1, 1), 'b': Fraction(1, 3), 'c': 0}
     """
     pass
+
+
+def test_have_ranking_with_utility_index():
+    initialize_random_seeds(0)
+    d = {(RANKINGS[i % 6], round(random.random(), 3), round(random.uniform(0.001, 0.2), 3)): random.random()
+         for i in range(300)}
+    profile = ProfileNoisyDiscrete(d, normalization_warning=False)
+    thresholds = np.random.rand(10, 6)
+    thresholds[0, :] = 0
+    thresholds[1, :] = 1
+    results = profile.have_rankings_with_utility_below(thresholds)
+    for i in range(10):
+        for j, ranking in enumerate(RANKINGS):
+            u = thresholds[i, j]
+            d_umin_umax_share = profile.d_ranking_umin_umax_share[ranking]
+            expected_below = sum([min(max((u - umin) / (umax - umin), 0), 1) * share
+                                  for (umin, umax), share in d_umin_umax_share.items()])
+            expected_above = sum([min(max((umax - u) / (umax - umin), 0), 1) * share
+                                  for (umin, umax), share in d_umin_umax_share.items()])
+            assert profile.have_ranking_with_utility_below_u(ranking, u) == pytest.approx(expected_below, abs=1e-12)
+            assert profile.have_ranking_with_utility_above_u(ranking, u) == pytest.approx(expected_above, abs=1e-12)
+            assert results[i, j] == pytest.approx(expected_below, abs=1e-12)
+
+
+def test_analyzed_strategies_parallel():
+    from concurrent.futures import ThreadPoolExecutor
+    from poisson_approval import EquilibriumStatus
+    profile = ProfileNoisyDiscrete({
+        ('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+        ('cab', 0.7, 0.01): Fraction(2, 10), ('cba', 0.5, 0.01): Fraction(1, 10)
+    })
+    serial = profile.analyzed_strategies(profile.strategies_group)
+    parallel = profile.analyzed_strategies(profile.strategies_group, n_jobs=2, chunk_size=3)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        threaded = profile.analyzed_strategies(profile.strategies_group, executor=executor, chunk_size=3)
+    for analyzed in [parallel, threaded]:
+        assert analyzed.equilibria == serial.equilibria
+        assert analyzed.utility_dependent == serial.utility_dependent
+        assert analyzed.non_equilibria == serial.non_equilibria
+        assert analyzed.n_distinct_taus == serial.n_distinct_taus
+    analyzed = profile.analyzed_strategies(profile.strategies_group, drop_non_equilibria=True)
+    assert analyzed.equilibria == serial.equilibria
+    assert analyzed.non_equilibria == []
+    analyzed = profile.analyzed_strategies(profile.strategies_group, n_jobs=2, chunk_size=1,
+                                           stop_at_first_equilibrium=True)
+    assert analyzed.equilibria == serial.equilibria[:1]
+    statuses = [status for _, status in profile.iter_analyzed_strategies(profile.strategies_group)]
+    assert statuses.count(EquilibriumStatus.EQUILIBRIUM) == len(serial.equilibria)
+
+
+def test_analyzed_strategies_distinct_taus():
+    profile = ProfileNoisyDiscrete({
+        ('abc', 0.3, 0.01): 0.1, ('abc', 0.6, 0.01): 0.1, ('bac', 0.2, 0.01): 0.2, ('bac', 0.5, 0.01): 0.2,
+        ('cab', 0.1, 0.01): 0.2, ('cab', 0.9, 0.01): 0.2
+    }, voting_rule=PLURALITY)
+    analyzed = profile.analyzed_strategies(profile.strategies_group)
+    strategies = analyzed.equilibria + analyzed.utility_dependent + analyzed.non_equilibria
+    assert analyzed.n_distinct_taus == len({strategy.tau for strategy in strategies}) < len(strategies)
+    for strategy in strategies:
+        fresh_copy = strategy.deepcopy_with_attached_profile(profile=profile)
+        assert profile.is_equilibrium(fresh_copy) == strategy.is_equilibrium
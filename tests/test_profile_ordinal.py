@@ -99,3 +99,44 @@ def test_welfare():
         {'a': Fraction(20, 31), 'b': 0, 'c': 1}
     """
     pass
+
+
+def test_decomposition_equilibria():
+    import numpy as np
+    from poisson_approval import RandProfileOrdinalUniform, masks_area, masks_distribution, winners_distribution
+    initialize_random_seeds(42)
+    rand_profile = RandProfileOrdinalUniform()
+    n_utility_dependent = 0
+    for _ in range(20):
+        profile = rand_profile()
+        utility_dependent = profile.analyzed_strategies_ordinal.utility_dependent
+        n_utility_dependent += len(utility_dependent)
+        support = sorted(profile.support_in_rankings)
+        for test in [lambda strategy: True, lambda strategy: strategy.winners == {'a'}]:
+            masks_winners = [
+                ([(strategy.d_ranking_best_response[ranking].utility_threshold,
+                   len(strategy.d_ranking_ballot[ranking]) == 2) for ranking in support], strategy.winners)
+                for strategy in utility_dependent if test(strategy)]
+            masks = [mask for mask, _ in masks_winners]
+            equilibria = [strategy for strategy in profile.analyzed_strategies_ordinal.equilibria if test(strategy)]
+            inf, sup = [0] * len(support), [1] * len(support)
+            expected = 1 if equilibria else masks_area(inf, sup, masks)
+            assert np.isclose(profile.proba_equilibrium(test=test), expected)
+            expected = masks_distribution(inf, sup, masks, cover_alls=len(equilibria))
+            assert np.allclose(profile.distribution_equilibria(test=test), expected)
+            cover_alls = set().union(*[strategy.winners for strategy in equilibria])
+            expected = winners_distribution(inf, sup, masks_winners, cover_alls=cover_alls)
+            assert np.allclose(profile.distribution_winners(test=test), expected)
+    assert n_utility_dependent > 0
+
+
+def test_analyzed_strategies_n_best_responses():
+    profile = ProfileOrdinal({'abc': Fraction(1, 10), 'bac': Fraction(6, 10), 'cab': Fraction(3, 10)})
+    n_strategies = len(list(profile.strategies_ordinal))
+    serial = profile.analyzed_strategies(profile.strategies_ordinal)
+    assert serial.n_best_responses_computed == 15
+    assert serial.n_best_responses_avoided == 33
+    assert serial.n_best_responses_computed + serial.n_best_responses_avoided == 6 * n_strategies
+    parallel = profile.analyzed_strategies(profile.strategies_ordinal, n_jobs=2, chunk_size=3)
+    assert parallel.n_best_responses_computed == serial.n_best_responses_computed
+    assert parallel.n_best_responses_avoided == serial.n_best_responses_avoided
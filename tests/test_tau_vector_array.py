@@ -0,0 +1,60 @@
+import math
+import numpy as np
+from poisson_approval import (TauVectorArray, BALLOTS_WITH_INVERSIONS, PAIRS_WITH_INVERSIONS, CANDIDATES, RANKINGS,
+                              APPROVAL, PLURALITY, ANTI_PLURALITY)
+
+
+def _look_equal(x, y):
+    x, y = float(x), float(y)
+    if math.isnan(x) or math.isnan(y):
+        return math.isnan(x) and math.isnan(y)
+    return math.isclose(x, y, rel_tol=1e-7, abs_tol=1e-9)
+
+
+def test_events_match_tau_vector():
+    rng = np.random.default_rng(42)
+    shares = rng.dirichlet(np.ones(6), size=40)
+    shares[:5, 0] = 0
+    shares[5:10, 3:5] = 0
+    shares = np.vstack([shares, [[1 / 6] * 6], [[0.1, 0.2, 0.1, 0.3, 0.2, 0.1]]])
+    taus = TauVectorArray(shares, normalization_warning=False)
+    names = (['trio']
+             + ['%s_%s' % (stub, pair) for stub in ['duo', 'pivot_weak', 'pivot_strict', 'trio_2t']
+                for pair in PAIRS_WITH_INVERSIONS]
+             + ['trio_1t_%s' % candidate for candidate in CANDIDATES]
+             + ['%s_%s' % (stub, ranking) for stub in ['pivot_tij', 'pivot_tjk'] for ranking in RANKINGS])
+    for name in names:
+        event_array = getattr(taus, name)
+        for i, tau in enumerate(taus):
+            event = getattr(tau, name)
+            for coefficient in ['mu', 'nu', 'xi']:
+                assert _look_equal(getattr(event_array, coefficient)[i], getattr(event, coefficient))
+            for label in BALLOTS_WITH_INVERSIONS:
+                assert _look_equal(getattr(event_array, 'phi_' + label)[i], getattr(event, 'phi_' + label))
+                assert _look_equal(getattr(event_array, 'psi_' + label)[i], getattr(event, 'psi_' + label))
+
+
+def test_scores_and_winners():
+    taus = TauVectorArray([[1, 0, 0, 0, 0, 0], [0, 0, 0, 1, 0, 0]])
+    assert np.array_equal(taus.scores, [[1, 0, 0], [1, 1, 0]])
+    assert np.array_equal(taus.winners, [[True, False, False], [True, True, False]])
+    assert taus[1].winners == {'a', 'b'}
+
+
+def test_best_responses_match_tau_vector():
+    rng = np.random.default_rng(7)
+    approval_shares = rng.dirichlet(np.ones(6), size=30)
+    approval_shares[:5, 3:] = 0
+    approval_shares[5:8, [0, 4]] = 0
+    grid = np.array([[x, y, 6 - x - y] for x in range(7) for y in range(7 - x)]) / 6
+    plurality_shares = np.hstack([grid, np.zeros(grid.shape)])
+    anti_plurality_shares = np.hstack([np.zeros(grid.shape), grid])
+    for voting_rule, shares in [(APPROVAL, approval_shares), (PLURALITY, plurality_shares),
+                                (ANTI_PLURALITY, anti_plurality_shares)]:
+        taus = TauVectorArray(shares, voting_rule=voting_rule, normalization_warning=False)
+        for i, tau in enumerate(taus):
+            for r, ranking in enumerate(RANKINGS):
+                best_response = tau.d_ranking_best_response[ranking]
+                assert _look_equal(taus.utility_thresholds[i, r], best_response.utility_threshold)
+                assert (TauVectorArray.JUSTIFICATIONS[taus.justification_codes[i, r]]
+                        == best_response.justification)
@@ -0,0 +1,57 @@
+import pickle
+from fractions import Fraction
+from poisson_approval import TauVector, ProfileNoisyDiscrete, PLURALITY
+
+
+def test_cache_with_iterated_voting():
+    profile = ProfileNoisyDiscrete({('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+                                    ('cab', 0.7, 0.01): Fraction(3, 10)})
+    results_without_cache = profile.iterated_voting(init='sincere', n_max_episodes=100)
+    cache = TauVector.enable_cache(max_size=10)
+    try:
+        results_with_cache = profile.iterated_voting(init='sincere', n_max_episodes=100)
+        assert cache.hits > 0
+        assert len(cache) <= 10
+    finally:
+        TauVector.disable_cache()
+    assert results_with_cache['converges'] == results_without_cache['converges']
+    assert results_with_cache['cycle_taus_actual'] == results_without_cache['cycle_taus_actual']
+
+
+def test_cache_keys():
+    cache = TauVector.enable_cache()
+    try:
+        tau = TauVector({'a': Fraction(1, 2), 'b': Fraction(1, 2)})
+        assert TauVector({'a': 0.5, 'b': 0.5}) is not tau
+        assert TauVector({'a': Fraction(1, 2), 'b': Fraction(1, 2)}, voting_rule=PLURALITY) is not tau
+        assert TauVector({'a': Fraction(1, 2), 'b': Fraction(1, 2)}) is tau
+        assert cache.hits == 1
+        assert pickle.loads(pickle.dumps(tau)) == tau
+    finally:
+        TauVector.disable_cache()
+
+
+def test_using_cache_in_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from poisson_approval import TauVectorCache, RandTauVectorUniform, initialize_random_seeds
+    initialize_random_seeds(0)
+    d_ballot_shares = [RandTauVectorUniform()().d_ballot_share for _ in range(20)]
+
+    def build(i):
+        with TauVector.using_cache(TauVectorCache(max_size=4)) as cache:
+            for _ in range(20):
+                for d_ballot_share in d_ballot_shares[i % 4::4]:
+                    assert TauVector(d_ballot_share) is TauVector(d_ballot_share)
+            return cache.hits
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(hits > 0 for hits in executor.map(build, range(16)))
+    assert TauVector.cache is None
+    profile = ProfileNoisyDiscrete({('abc', 0.4, 0.01): Fraction(1, 10), ('bac', 0.2, 0.01): Fraction(6, 10),
+                                    ('cab', 0.7, 0.01): Fraction(3, 10)})
+    serial = profile.analyzed_strategies(profile.strategies_group)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = profile.analyzed_strategies(profile.strategies_group, executor=executor, chunk_size=4)
+    assert TauVector.cache is None
+    assert threaded.equilibria == serial.equilibria
+    assert pickle.loads(pickle.dumps(TauVectorCache())).get({'a': 1}) is None
@@ -0,0 +1,53 @@
+import itertools
+from fractions import Fraction
+from poisson_approval import TauVector, RANKINGS, BALLOTS_WITH_INVERSIONS, isnan
+
+
+def _permutations_of(d_ballot_share):
+    for permutation in itertools.permutations('abc'):
+        d_candidate_new = dict(zip('abc', permutation))
+        yield {''.join(d_candidate_new[candidate] for candidate in ballot): share
+               for ballot, share in d_ballot_share.items()}
+
+
+def test_symmetry_reduction():
+    d_ballot_share = {'a': Fraction(1, 10), 'ab': Fraction(1, 5), 'b': Fraction(1, 10), 'bc': Fraction(2, 5),
+                      'c': Fraction(1, 5)}
+    try:
+        for d in _permutations_of(d_ballot_share):
+            TauVector.symmetry_reduction = False
+            tau = TauVector(d)
+            assert not tau.is_symmetry_reduced
+            TauVector.symmetry_reduction = True
+            tau_reduced = TauVector(d)
+            assert tau_reduced.is_symmetry_reduced or tau_reduced.is_standardized
+            for pair in ['ab', 'ac', 'bc']:
+                event, event_reduced = getattr(tau, 'pivot_weak_' + pair), getattr(tau_reduced, 'pivot_weak_' + pair)
+                assert tau.ce.look_equal(event.mu, event_reduced.mu)
+                for label in BALLOTS_WITH_INVERSIONS:
+                    phi, phi_reduced = event.phi[label], event_reduced.phi[label]
+                    assert (isnan(phi) and isnan(phi_reduced)) or tau.ce.look_equal(phi, phi_reduced)
+            for ranking in RANKINGS:
+                assert (tau.d_ranking_best_response[ranking].ballot
+                        == tau_reduced.d_ranking_best_response[ranking].ballot)
+        # With the cache, all the variants share the same standardized version.
+        TauVector.enable_cache()
+        assert len({id(TauVector(d).standardized_version) for d in _permutations_of(d_ballot_share)}) == 1
+    finally:
+        TauVector.symmetry_reduction = False
+        TauVector.disable_cache()
+
+
+def test_symmetry_reduction_lazy_best_responses():
+    try:
+        TauVector.symmetry_reduction = True
+        taus = [TauVector(d) for d in _permutations_of({'a': Fraction(1, 10), 'ab': Fraction(3, 5),
+                                                         'c': Fraction(3, 10)})]
+        tau = [tau for tau in taus if tau.is_symmetry_reduced][0]
+        best_response = tau.d_ranking_best_response['abc']
+        assert best_response.utility_threshold == tau.standardized_version.d_ranking_best_response[
+            ''.join(tau._d_candidate_standardized[candidate] for candidate in 'abc')].utility_threshold
+        assert tau.n_best_responses_computed == 1
+        assert tau.standardized_version.n_best_responses_computed == 1
+    finally:
+        TauVector.symmetry_reduction = False
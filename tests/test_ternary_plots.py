@@ -1,5 +1,10 @@
 import pytest
+import pickle
+import numpy as np
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
 from poisson_approval import ternary_figure
+from poisson_approval.meta_analysis.ternary_plots import Point
 
 
 def test():
@@ -61,3 +66,90 @@ def test_annotate_condorcet_old():
     tax._annotate_condorcet_old(right_ranking='abc', left_ranking='bac', top_ranking='cab')
     tax._annotate_condorcet_old(right_ranking='bac', left_ranking='abc', top_ranking='cab')
     tax._annotate_condorcet_old(right_ranking='bac', left_ranking='cab', top_ranking='abc')
+
+
+def _candidates(right, top, left):
+    return [right, top ** 2, left / 2]
+
+
+def test_heatmap_candidates_parallel():
+    figure, tax = ternary_figure(scale=8)
+    tax.heatmap_candidates(_candidates, left_label='left', right_label='right', top_label='top')
+    d_point_values_serial = tax.d_point_values_
+    figure, tax = ternary_figure(scale=8)
+    tax.heatmap_candidates(_candidates, left_label='left', right_label='right', top_label='top',
+                           n_jobs=2, chunk_size=5)
+    assert list(tax.d_point_values_.items()) == list(d_point_values_serial.items())
+    figure, tax = ternary_figure(scale=8)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tax.heatmap_candidates(_candidates, left_label='left', right_label='right', top_label='top',
+                               executor=executor)
+    assert list(tax.d_point_values_.items()) == list(d_point_values_serial.items())
+
+
+def test_heatmap_intensity_parallel():
+    figure, tax = ternary_figure(scale=6)
+    tax.heatmap_intensity(lambda right, top, left: right - left, left_label='left', right_label='right',
+                          top_label='top', n_jobs=2, style='triangular', boundary=False)
+
+
+def _sectors(right, top, left):
+    if right > 2 * top:
+        return [1, 0, 0]
+    return [0, 1, 0] if top > left else [0, 0, 1]
+
+
+def test_heatmap_candidates_adaptive():
+    figure, tax = ternary_figure(scale=50)
+    tax.heatmap_candidates(_sectors, left_label='left', right_label='right', top_label='top')
+    d_point_values_full = tax.d_point_values_
+    assert tax.n_evaluations_ == len(d_point_values_full)
+    assert tax.n_evaluations_saved_ == 0
+    for coarse_scale, n_jobs in [(8, None), (5, 2)]:
+        figure, tax = ternary_figure(scale=50)
+        tax.heatmap_candidates(_sectors, left_label='left', right_label='right', top_label='top',
+                               adaptive=True, coarse_scale=coarse_scale, n_jobs=n_jobs)
+        assert tax.d_point_values_ == d_point_values_full
+        assert tax.n_evaluations_ + tax.n_evaluations_saved_ == len(d_point_values_full)
+        assert tax.n_evaluations_ < len(d_point_values_full) / 2
+
+
+def test_heatmap_intensity_adaptive():
+    figure, tax = ternary_figure(scale=31)
+    tax.heatmap_intensity(lambda right, top, left: int(right > .4), left_label='left', right_label='right',
+                          top_label='top', adaptive=True)
+    assert tax.n_evaluations_saved_ > 0
+    with pytest.raises(ValueError):
+        tax.heatmap_intensity(lambda right, top, left: 0, left_label='left', right_label='right', top_label='top',
+                              adaptive=True, boundary=False)
+
+
+def test_f_point_values_vectorized():
+    figure, tax = ternary_figure(scale=12)
+    tax.heatmap_candidates(_sectors, left_label='left', right_label='right', top_label='top')
+    rng = np.random.default_rng(42)
+    points = rng.dirichlet([1, 1, 1], size=200)
+    values = tax.f_point_values_(right=points[:, 0], top=points[:, 1], left=points[:, 2])
+    assert values.shape == (200, 3)
+    for (right, top, left), value in zip(points, values):
+        assert tax.f_point_values_(right=right, top=top, left=left) == list(value)
+    assert tax.f_point_values_(right=Fraction(1, 4), top=Fraction(1, 3), left=Fraction(5, 12)) == \
+        tax.d_point_values_[Point(right=Fraction(3, 12), top=Fraction(4, 12), left=Fraction(5, 12))]
+    with pytest.raises(ValueError):
+        tax.f_point_values_(right=.5, top=.5, left=.5)
+
+
+def test_f_point_values_restored(tmp_path):
+    def f(right, top, left):
+        return [right, top, 1 - right - top]
+    file_save_data = str(tmp_path / 'data.sav')
+    figure, tax = ternary_figure(scale=6)
+    tax.heatmap_candidates(f, left_label='left', right_label='right', top_label='top', file_save_data=file_save_data)
+    assert tax.f_point_values_(right=.5, top=.3, left=.2) == [Fraction(1, 2), Fraction(1, 3), Fraction(1, 6)]
+    with open(file_save_data, 'rb') as file:
+        _, d_point_values = pickle.load(file)
+    figure, tax_restored = ternary_figure(scale=6)
+    tax_restored.d_point_values_ = d_point_values
+    assert tax_restored.f_point_values_(right=.5, top=.3, left=.2) == [Fraction(1, 2), Fraction(1, 3), Fraction(1, 6)]
+    assert np.array_equal(tax_restored.f_point_values_(right=[.5, 0.], top=[.3, 1.], left=[.2, 0.]),
+                          np.array([[1 / 2, 1 / 3, 1 / 6], [0., 1., 0.]]))
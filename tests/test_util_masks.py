@@ -0,0 +1,42 @@
+import random
+from fractions import Fraction
+import numpy as np
+from poisson_approval.utils.UtilMasks import masks_area, masks_area_naive, masks_distribution, \
+    masks_distribution_naive, winners_distribution
+
+
+def _random_masks(rng, dim, n_masks):
+    # Limits on a coarse grid, so that masks share some limits and some masks are empty or cover everything.
+    return [[(Fraction(rng.randint(0, 10), 10), rng.choice([True, False])) for _ in range(dim)]
+            for _ in range(n_masks)]
+
+
+def test_masks_area_and_distribution_vs_naive():
+    rng = random.Random(42)
+    for dim in range(1, 6):
+        for n_masks in range(0, 6):
+            masks = _random_masks(rng, dim, n_masks)
+            inf, sup = [0] * dim, [1] * dim
+            assert masks_area(inf, sup, masks) == masks_area_naive(inf, sup, masks)
+            distribution = list(masks_distribution(inf, sup, masks))
+            distribution_naive = list(masks_distribution_naive(inf, sup, masks))
+            assert distribution == distribution_naive[:len(distribution)]
+            assert not any(distribution_naive[len(distribution):])
+
+
+def test_masks_distribution_cover_alls():
+    masks = [[(Fraction(1, 2), True)]]
+    assert list(masks_distribution([0], [1], masks, cover_alls=2)) == [0, 0, Fraction(1, 2), Fraction(1, 2)]
+
+
+def test_winners_distribution_is_deterministic_and_exact():
+    rng = random.Random(0)
+    dim = 4
+    masks = _random_masks(rng, dim, 6)
+    masks_winners = [(mask, set(rng.sample('abc', rng.randint(1, 3)))) for mask in masks]
+    histogram = winners_distribution([0] * dim, [1] * dim, masks_winners)
+    assert sum(histogram) == 1
+    assert list(winners_distribution([0] * dim, [1] * dim, masks_winners)) == list(histogram)
+    histogram_cover_alls = winners_distribution([0] * dim, [1] * dim, masks_winners, cover_alls={'a', 'b', 'c'})
+    assert list(histogram_cover_alls) == [0, 0, 0, 1]
+    assert np.all(histogram >= 0)
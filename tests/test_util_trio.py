@@ -0,0 +1,14 @@
+import numpy as np
+from poisson_approval.utils.UtilTrio import trio_minimize, _trio_objective
+
+
+def test_trio_minimize_batch_and_float():
+    rng = np.random.default_rng(0)
+    shares = rng.dirichlet(np.ones(6), size=50)
+    mu, x = trio_minimize(*shares.T)
+    for i, row in enumerate(shares):
+        mu_i, x_i = trio_minimize(*row)
+        assert np.isclose(mu_i, mu[i], rtol=1e-12, atol=1e-15)
+        assert np.isclose(x_i, x[i], rtol=1e-9)
+        assert _trio_objective(x_i * (1 - 1e-4), *row) >= mu_i
+        assert _trio_objective(x_i * (1 + 1e-4), *row) >= mu_i